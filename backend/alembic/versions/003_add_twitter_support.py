@@ -22,11 +22,13 @@ def upgrade() -> None:
     # 1. Extend feed_type ENUM with 'twitter' value
     op.execute("ALTER TYPE feed_type ADD VALUE 'twitter'")
 
-    # 2. Drop UNIQUE constraint on rss_feeds.url (Twitter sources have null URLs)
-    op.drop_constraint("rss_feeds_url_key", "rss_feeds", type_="unique")
-
-    # 3. Make rss_feeds.url nullable
-    op.alter_column("rss_feeds", "url", existing_type=sa.String(), nullable=True)
+    # 2-3. Drop UNIQUE constraint on rss_feeds.url and make it nullable
+    # (Twitter sources have null URLs). One ALTER TABLE takes the table lock once.
+    op.execute(
+        "ALTER TABLE rss_feeds "
+        "DROP CONSTRAINT rss_feeds_url_key, "
+        "ALTER COLUMN url DROP NOT NULL"
+    )
 
     # 4. Create twitter_source_config table
     op.create_table(
@@ -44,30 +46,33 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
     )
 
-    # 5. Add raw_metadata JSONB column to feed_items
-    op.add_column("feed_items", sa.Column("raw_metadata", postgresql.JSONB(), nullable=True))
-
-    # 6. Make feed_items.title nullable
-    op.alter_column("feed_items", "title", existing_type=sa.String(), nullable=True)
+    # 5-6. Add raw_metadata JSONB column to feed_items and make title nullable
+    op.execute(
+        "ALTER TABLE feed_items "
+        "ADD COLUMN raw_metadata JSONB, "
+        "ALTER COLUMN title DROP NOT NULL"
+    )
 
 
 def downgrade() -> None:
     # Reverse order of upgrade operations
 
-    # 6. Re-add NOT NULL on feed_items.title
-    op.alter_column("feed_items", "title", existing_type=sa.String(), nullable=False)
-
-    # 5. Drop raw_metadata column from feed_items
-    op.drop_column("feed_items", "raw_metadata")
+    # 6-5. Re-add NOT NULL on feed_items.title and drop raw_metadata
+    op.execute(
+        "ALTER TABLE feed_items "
+        "ALTER COLUMN title SET NOT NULL, "
+        "DROP COLUMN raw_metadata"
+    )
 
     # 4. Drop twitter_source_config table
     op.drop_table("twitter_source_config")
 
-    # 3. Re-add NOT NULL on rss_feeds.url
-    op.alter_column("rss_feeds", "url", existing_type=sa.String(), nullable=False)
-
-    # 2. Re-add UNIQUE constraint on rss_feeds.url
-    op.create_unique_constraint("rss_feeds_url_key", "rss_feeds", ["url"])
+    # 3-2. Re-add NOT NULL and the UNIQUE constraint on rss_feeds.url
+    op.execute(
+        "ALTER TABLE rss_feeds "
+        "ALTER COLUMN url SET NOT NULL, "
+        "ADD CONSTRAINT rss_feeds_url_key UNIQUE (url)"
+    )
 
     # Note: Cannot remove 'twitter' from feed_type ENUM in PostgreSQL easily.
     # The value is harmless and left in place.
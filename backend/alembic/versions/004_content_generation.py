@@ -39,36 +39,26 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
     )
 
-    # 3. Add new columns to content_outputs
-    op.add_column("content_outputs", sa.Column("title", sa.String(), nullable=True))
-    op.add_column(
-        "content_outputs",
-        sa.Column(
-            "template_id",
-            postgresql.UUID(as_uuid=True),
-            sa.ForeignKey("content_templates.id"),
-            nullable=True,
-        ),
-    )
-    op.add_column("content_outputs", sa.Column("google_doc_id", sa.String(), nullable=True))
-    op.add_column("content_outputs", sa.Column("google_doc_url", sa.String(), nullable=True))
-    op.add_column(
-        "content_outputs",
-        sa.Column(
-            "approved_by",
-            postgresql.UUID(as_uuid=True),
-            sa.ForeignKey("users.id"),
-            nullable=True,
-        ),
+    # 3. Add new columns to content_outputs in a single ALTER TABLE
+    op.execute(
+        "ALTER TABLE content_outputs "
+        "ADD COLUMN title VARCHAR, "
+        "ADD COLUMN template_id UUID REFERENCES content_templates (id), "
+        "ADD COLUMN google_doc_id VARCHAR, "
+        "ADD COLUMN google_doc_url VARCHAR, "
+        "ADD COLUMN approved_by UUID REFERENCES users (id), "
+        "ADD COLUMN approved_at TIMESTAMP WITHOUT TIME ZONE, "
+        "ADD COLUMN published_at TIMESTAMP WITHOUT TIME ZONE, "
+        "ADD COLUMN raw_llm_output JSONB, "
+        "ADD COLUMN error_message TEXT"
     )
-    op.add_column("content_outputs", sa.Column("approved_at", sa.DateTime(), nullable=True))
-    op.add_column("content_outputs", sa.Column("published_at", sa.DateTime(), nullable=True))
-    op.add_column("content_outputs", sa.Column("raw_llm_output", postgresql.JSONB(), nullable=True))
-    op.add_column("content_outputs", sa.Column("error_message", sa.Text(), nullable=True))
 
     # 4. Add Google OAuth token columns to users
-    op.add_column("users", sa.Column("google_refresh_token", sa.String(), nullable=True))
-    op.add_column("users", sa.Column("google_access_token", sa.String(), nullable=True))
+    op.execute(
+        "ALTER TABLE users "
+        "ADD COLUMN google_refresh_token VARCHAR, "
+        "ADD COLUMN google_access_token VARCHAR"
+    )
 
     # 5. Create system_settings table
     op.create_table(
@@ -113,19 +103,25 @@ def downgrade() -> None:
     op.drop_table("system_settings")
 
     # 4. Drop Google OAuth token columns from users
-    op.drop_column("users", "google_access_token")
-    op.drop_column("users", "google_refresh_token")
+    op.execute(
+        "ALTER TABLE users "
+        "DROP COLUMN google_access_token, "
+        "DROP COLUMN google_refresh_token"
+    )
 
     # 3. Drop new columns from content_outputs
-    op.drop_column("content_outputs", "error_message")
-    op.drop_column("content_outputs", "raw_llm_output")
-    op.drop_column("content_outputs", "published_at")
-    op.drop_column("content_outputs", "approved_at")
-    op.drop_column("content_outputs", "approved_by")
-    op.drop_column("content_outputs", "google_doc_url")
-    op.drop_column("content_outputs", "google_doc_id")
-    op.drop_column("content_outputs", "template_id")
-    op.drop_column("content_outputs", "title")
+    op.execute(
+        "ALTER TABLE content_outputs "
+        "DROP COLUMN error_message, "
+        "DROP COLUMN raw_llm_output, "
+        "DROP COLUMN published_at, "
+        "DROP COLUMN approved_at, "
+        "DROP COLUMN approved_by, "
+        "DROP COLUMN google_doc_url, "
+        "DROP COLUMN google_doc_id, "
+        "DROP COLUMN template_id, "
+        "DROP COLUMN title"
+    )
 
     # 2. Drop content_templates table
     op.drop_table("content_templates")
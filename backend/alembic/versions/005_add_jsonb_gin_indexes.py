@@ -0,0 +1,41 @@
+"""add_jsonb_gin_indexes
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, column) — jsonb_path_ops only supports @> containment,
+# but it is much smaller and faster to build than the default jsonb_ops.
+GIN_INDEXES = [
+    ("ix_analysis_cards_raw_llm_output_gin", "analysis_cards", "raw_llm_output"),
+    ("ix_briefings_raw_llm_output_gin", "briefings", "raw_llm_output"),
+    ("ix_content_outputs_source_card_ids_gin", "content_outputs", "source_card_ids"),
+    ("ix_profile_update_suggestions_source_card_ids_gin", "profile_update_suggestions", "source_card_ids"),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, table, column in GIN_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin ({column} jsonb_path_ops)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _table, _column in reversed(GIN_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,45 @@
+"""add_feed_partial_indexes
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Partial indexes only hold the working set (unprocessed items, active
+    # feeds), so they stay small as feed history grows.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_feed_items_unprocessed",
+            "feed_items",
+            ["feed_id", "published_at"],
+            postgresql_where=sa.text("is_processed = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_rss_feeds_due",
+            "rss_feeds",
+            ["last_checked_at"],
+            postgresql_where=sa.text("is_active = true"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_rss_feeds_due", table_name="rss_feeds", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_feed_items_unprocessed", table_name="feed_items", postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,47 @@
+"""server_side_uuid_defaults
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every table with a UUID "id" primary key.
+UUID_PK_TABLES = [
+    "users",
+    "competitors",
+    "rss_feeds",
+    "feed_items",
+    "augment_profile",
+    "check_runs",
+    "analysis_cards",
+    "analysis_card_edits",
+    "analysis_card_comments",
+    "briefings",
+    "profile_update_suggestions",
+    "content_outputs",
+    "content_templates",
+    "twitter_source_config",
+]
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from PostgreSQL 13; pgcrypto provides it on older servers.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table in UUID_PK_TABLES:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+
+
+def downgrade() -> None:
+    for table in reversed(UUID_PK_TABLES):
+        op.alter_column(table, "id", server_default=None)
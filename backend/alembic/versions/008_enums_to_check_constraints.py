@@ -0,0 +1,88 @@
+"""enums_to_check_constraints
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> [(column, enum type name, allowed values, server default)]
+ENUM_COLUMNS = {
+    "users": [
+        ("role", "user_role", ("admin", "reviewer", "viewer"), "viewer"),
+    ],
+    "rss_feeds": [
+        ("feed_type", "feed_type", ("rss", "web_scrape", "twitter"), "rss"),
+    ],
+    "check_runs": [
+        ("status", "check_run_status", ("running", "completed", "failed"), None),
+    ],
+    "analysis_cards": [
+        ("event_type", "event_type", (
+            "new_feature", "product_announcement", "partnership", "acquisition",
+            "acquired", "funding", "pricing_change", "leadership_change", "expansion", "other",
+        ), None),
+        ("priority", "priority_level", ("red", "yellow", "green"), None),
+        ("status", "card_status", ("draft", "in_review", "approved", "archived"), "draft"),
+    ],
+    "briefings": [
+        ("status", "briefing_status", ("draft", "in_review", "approved", "archived"), "draft"),
+    ],
+    "profile_update_suggestions": [
+        ("target_type", "suggestion_target_type", ("competitor", "augment"), None),
+        ("status", "suggestion_status", ("pending", "approved", "rejected"), "pending"),
+    ],
+    "content_outputs": [
+        ("status", "content_output_status", ("draft", "in_review", "approved", "published", "failed"), "draft"),
+    ],
+}
+
+
+def _in_list(values: tuple[str, ...]) -> str:
+    return ", ".join(f"'{v}'" for v in values)
+
+
+def upgrade() -> None:
+    # Native ENUMs need ALTER TYPE ... ADD VALUE, which cannot run inside a
+    # transaction (see 003/004). VARCHAR + CHECK lets a new value ship as a
+    # transactional DROP/ADD CONSTRAINT swap instead.
+    for table, columns in ENUM_COLUMNS.items():
+        clauses = []
+        for column, _, values, default in columns:
+            if default is not None:
+                clauses.append(f"ALTER COLUMN {column} DROP DEFAULT")
+            clauses.append(f"ALTER COLUMN {column} TYPE VARCHAR USING {column}::text")
+            if default is not None:
+                clauses.append(f"ALTER COLUMN {column} SET DEFAULT '{default}'")
+            clauses.append(f"ADD CONSTRAINT ck_{table}_{column} CHECK ({column} IN ({_in_list(values)}))")
+        op.execute(f"ALTER TABLE {table} " + ", ".join(clauses))
+
+    for columns in ENUM_COLUMNS.values():
+        for _, type_name, _, _ in columns:
+            op.execute(f"DROP TYPE IF EXISTS {type_name}")
+
+
+def downgrade() -> None:
+    for columns in ENUM_COLUMNS.values():
+        for _, type_name, values, _ in columns:
+            op.execute(f"CREATE TYPE {type_name} AS ENUM ({_in_list(values)})")
+
+    for table, columns in ENUM_COLUMNS.items():
+        clauses = []
+        for column, type_name, _, default in columns:
+            clauses.append(f"DROP CONSTRAINT ck_{table}_{column}")
+            if default is not None:
+                clauses.append(f"ALTER COLUMN {column} DROP DEFAULT")
+            clauses.append(f"ALTER COLUMN {column} TYPE {type_name} USING {column}::{type_name}")
+            if default is not None:
+                clauses.append(f"ALTER COLUMN {column} SET DEFAULT '{default}'")
+        op.execute(f"ALTER TABLE {table} " + ", ".join(clauses))
@@ -0,0 +1,38 @@
+"""external_storage_for_large_text
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Large free-text columns that list/queue queries never read.
+EXTERNAL_COLUMNS = {
+    "feed_items": ["raw_content"],
+    "analysis_cards": ["summary", "impact_assessment", "suggested_counter_moves"],
+}
+
+
+def upgrade() -> None:
+    # EXTERNAL moves long values out of line without compressing them, so the
+    # heap rows scanned by list and queue queries stay narrow and reading the
+    # full text skips decompression. Only affects rows written from now on;
+    # a catalog-only change, so no table rewrite or long lock.
+    for table, columns in EXTERNAL_COLUMNS.items():
+        clauses = ", ".join(f"ALTER COLUMN {column} SET STORAGE EXTERNAL" for column in columns)
+        op.execute(f"ALTER TABLE {table} {clauses}")
+
+
+def downgrade() -> None:
+    for table, columns in EXTERNAL_COLUMNS.items():
+        clauses = ", ".join(f"ALTER COLUMN {column} SET STORAGE EXTENDED" for column in columns)
+        op.execute(f"ALTER TABLE {table} {clauses}")
@@ -0,0 +1,62 @@
+"""add_latest_n_indexes
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Descending indexes let "newest first ... LIMIT n" queries read n index
+    # entries instead of sorting the whole result set.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_feed_items_feed_published",
+            "feed_items",
+            ["feed_id", sa.text("published_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_analysis_cards_created_desc",
+            "analysis_cards",
+            [sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # The (analysis_card_id, competitor_id) primary key cannot serve
+        # lookups by competitor.
+        op.create_index(
+            "ix_card_competitors_comp",
+            "analysis_card_competitors",
+            ["competitor_id", "analysis_card_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_card_competitors_comp", table_name="analysis_card_competitors",
+            postgresql_concurrently=True, if_exists=True,
+        )
+        op.drop_index(
+            "ix_analysis_cards_created_desc", table_name="analysis_cards",
+            postgresql_concurrently=True, if_exists=True,
+        )
+        op.drop_index(
+            "ix_feed_items_feed_published", table_name="feed_items",
+            postgresql_concurrently=True, if_exists=True,
+        )
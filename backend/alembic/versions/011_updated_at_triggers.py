@@ -0,0 +1,95 @@
+"""updated_at_triggers
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> audit timestamp columns it carries
+TIMESTAMP_COLUMNS = {
+    "users": ["created_at", "updated_at"],
+    "competitors": ["created_at", "updated_at"],
+    "rss_feeds": ["created_at", "updated_at"],
+    "feed_items": ["created_at"],
+    "augment_profile": ["created_at", "updated_at"],
+    "analysis_cards": ["created_at", "updated_at"],
+    "analysis_card_edits": ["created_at"],
+    "analysis_card_comments": ["created_at", "updated_at"],
+    "briefings": ["created_at", "updated_at"],
+    "profile_update_suggestions": ["created_at"],
+    "content_outputs": ["created_at", "updated_at"],
+    "content_templates": ["created_at", "updated_at"],
+    "system_settings": ["updated_at"],
+    "twitter_source_config": ["created_at", "updated_at"],
+}
+
+# table -> event timestamp columns (no default), also made TIMESTAMPTZ so no
+# model mixes naive and aware datetimes
+EVENT_TIMESTAMP_COLUMNS = {
+    "rss_feeds": ["last_checked_at", "last_successful_at"],
+    "feed_items": ["published_at"],
+    "check_runs": ["scheduled_time", "started_at", "completed_at"],
+    "analysis_cards": ["approved_at"],
+    "briefings": ["approved_at"],
+    "profile_update_suggestions": ["reviewed_at"],
+    "content_outputs": ["approved_at", "published_at"],
+}
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = CURRENT_TIMESTAMP;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        # Existing naive values were written in UTC.
+        clauses = []
+        for column in columns:
+            clauses.append(f"ALTER COLUMN {column} TYPE TIMESTAMPTZ USING {column} AT TIME ZONE 'UTC'")
+            clauses.append(f"ALTER COLUMN {column} SET DEFAULT CURRENT_TIMESTAMP")
+        op.execute(f"ALTER TABLE {table} " + ", ".join(clauses))
+
+        if "updated_at" in columns:
+            op.execute(
+                f"CREATE TRIGGER trg_{table}_updated BEFORE UPDATE ON {table} "
+                "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+            )
+
+    for table, columns in EVENT_TIMESTAMP_COLUMNS.items():
+        op.execute(f"ALTER TABLE {table} " + ", ".join(
+            f"ALTER COLUMN {column} TYPE TIMESTAMPTZ USING {column} AT TIME ZONE 'UTC'" for column in columns
+        ))
+
+
+def downgrade() -> None:
+    for table, columns in EVENT_TIMESTAMP_COLUMNS.items():
+        op.execute(f"ALTER TABLE {table} " + ", ".join(
+            f"ALTER COLUMN {column} TYPE TIMESTAMP USING {column} AT TIME ZONE 'UTC'" for column in columns
+        ))
+
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        if "updated_at" in columns:
+            op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated ON {table}")
+
+        clauses = []
+        for column in columns:
+            clauses.append(f"ALTER COLUMN {column} TYPE TIMESTAMP USING {column} AT TIME ZONE 'UTC'")
+            clauses.append(f"ALTER COLUMN {column} SET DEFAULT now()")
+        op.execute(f"ALTER TABLE {table} " + ", ".join(clauses))
+
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
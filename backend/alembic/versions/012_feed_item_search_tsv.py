@@ -0,0 +1,45 @@
+"""feed_item_search_tsv
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Stored generated column: kept up to date by PostgreSQL on every write.
+    # Adding it rewrites feed_items once.
+    op.execute("""
+        ALTER TABLE feed_items ADD COLUMN search_tsv tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('english', coalesce(title, '') || ' ' || coalesce(raw_content, ''))
+        ) STORED
+    """)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_feed_items_search_tsv",
+            "feed_items",
+            ["search_tsv"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_feed_items_search_tsv", table_name="feed_items",
+            postgresql_concurrently=True, if_exists=True,
+        )
+    op.drop_column("feed_items", "search_tsv")
@@ -0,0 +1,53 @@
+"""uuid_v7_defaults
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# High-insert tables whose primary key index benefits from time-ordered ids.
+UUID_V7_TABLES = ["feed_items", "analysis_cards"]
+
+
+def upgrade() -> None:
+    # PostgreSQL < 18 has no uuidv7(). Build one from gen_random_uuid(): overwrite
+    # the first 48 bits with the Unix time in milliseconds and set the version
+    # nibble to 7 (v4 already carries the RFC 4122 variant bits).
+    op.execute("""
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE
+    """)
+    # Existing v4 rows stay as they are; new rows append at the right edge of the index.
+    for table in UUID_V7_TABLES:
+        op.alter_column(table, "id", server_default=sa.text("uuid_generate_v7()"))
+
+
+def downgrade() -> None:
+    for table in UUID_V7_TABLES:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
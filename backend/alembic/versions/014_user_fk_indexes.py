@@ -0,0 +1,53 @@
+"""user_fk_indexes
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "014"
+down_revision: Union[str, None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, FK column, INCLUDE columns, nullable FK)
+USER_FK_INDEXES = [
+    ("ix_analysis_cards_approved_by", "analysis_cards", "approved_by", ["approved_at"], True),
+    ("ix_briefings_approved_by", "briefings", "approved_by", ["approved_at"], True),
+    ("ix_content_outputs_approved_by", "content_outputs", "approved_by", ["approved_at"], True),
+    ("ix_profile_update_suggestions_reviewed_by", "profile_update_suggestions", "reviewed_by", ["reviewed_at"], True),
+    ("ix_competitors_created_by", "competitors", "created_by", [], True),
+    ("ix_rss_feeds_created_by", "rss_feeds", "created_by", [], False),
+    ("ix_analysis_card_edits_user_id", "analysis_card_edits", "user_id", [], False),
+    ("ix_analysis_card_comments_user_id", "analysis_card_comments", "user_id", [], False),
+]
+
+
+def upgrade() -> None:
+    # PostgreSQL does not index FK columns itself, so every user delete (and
+    # any lookup by user) scanned each referencing table. Nullable columns get
+    # partial indexes, since only set values are ever looked up; the approval
+    # timestamp rides along in INCLUDE for index-only scans.
+    with op.get_context().autocommit_block():
+        for name, table, column, include, nullable in USER_FK_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_include=include,
+                postgresql_where=sa.text(f"{column} IS NOT NULL") if nullable else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _, _ in reversed(USER_FK_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
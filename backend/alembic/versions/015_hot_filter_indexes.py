@@ -0,0 +1,51 @@
+"""hot_filter_indexes
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "015"
+down_revision: Union[str, None] = "014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns, partial-index predicate)
+HOT_FILTER_INDEXES = [
+    # Card list filtered by status, newest first; profile review's approved-since-cutoff scan.
+    ("ix_analysis_cards_status_created", "analysis_cards", ["status", sa.text("created_at DESC")], None),
+    ("ix_analysis_cards_check_run_id", "analysis_cards", ["check_run_id"], "check_run_id IS NOT NULL"),
+    ("ix_analysis_cards_feed_item_id", "analysis_cards", ["feed_item_id"], "feed_item_id IS NOT NULL"),
+    # The suggestions queue only ever lists pending rows, newest first.
+    (
+        "ix_profile_update_suggestions_pending", "profile_update_suggestions",
+        [sa.text("created_at DESC")], "status = 'pending'",
+    ),
+    # Per-competitor output lookups on the content dashboard.
+    ("ix_content_outputs_competitor_status", "content_outputs", ["competitor_id", "status"], None),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in HOT_FILTER_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(HOT_FILTER_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,30 @@
+"""more_uuid_v7_defaults
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "016"
+down_revision: Union[str, None] = "015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The remaining append-mostly tables; uuid_generate_v7() comes from 013.
+UUID_V7_TABLES = ["analysis_card_edits", "analysis_card_comments", "check_runs", "content_outputs"]
+
+
+def upgrade() -> None:
+    for table in UUID_V7_TABLES:
+        op.alter_column(table, "id", server_default=sa.text("uuid_generate_v7()"))
+
+
+def downgrade() -> None:
+    for table in UUID_V7_TABLES:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
@@ -0,0 +1,69 @@
+"""denormalized_child_counts
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "017"
+down_revision: Union[str, None] = "016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (parent table, counter column, child table, child FK column)
+CHILD_COUNTS = [
+    ("analysis_cards", "comments_count", "analysis_card_comments", "analysis_card_id"),
+    ("briefings", "card_count", "briefing_cards", "briefing_id"),
+]
+
+
+def _set_updated_trigger(table: str, when: str | None) -> None:
+    op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated ON {table}")
+    op.execute(
+        f"CREATE TRIGGER trg_{table}_updated BEFORE UPDATE ON {table} FOR EACH ROW "
+        + (f"WHEN ({when}) " if when else "")
+        + "EXECUTE FUNCTION set_updated_at()"
+    )
+
+
+def upgrade() -> None:
+    for parent, column, child, fk in CHILD_COUNTS:
+        op.add_column(parent, sa.Column(column, sa.Integer(), server_default="0", nullable=False))
+        # Counter maintenance is not an edit of the parent row, so it (and the
+        # backfill below) must not bump updated_at via the 011 trigger.
+        _set_updated_trigger(parent, f"OLD.{column} IS NOT DISTINCT FROM NEW.{column}")
+        op.execute(
+            f"UPDATE {parent} SET {column} = "
+            f"(SELECT count(*) FROM {child} WHERE {child}.{fk} = {parent}.id)"
+        )
+
+        op.execute(f"""
+            CREATE OR REPLACE FUNCTION bump_{parent}_{column}() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP = 'INSERT' THEN
+                    UPDATE {parent} SET {column} = {column} + 1 WHERE id = NEW.{fk};
+                ELSE
+                    UPDATE {parent} SET {column} = {column} - 1 WHERE id = OLD.{fk};
+                END IF;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        """)
+        op.execute(
+            f"CREATE TRIGGER trg_{child}_count AFTER INSERT OR DELETE ON {child} "
+            f"FOR EACH ROW EXECUTE FUNCTION bump_{parent}_{column}()"
+        )
+
+
+def downgrade() -> None:
+    for parent, column, child, _ in reversed(CHILD_COUNTS):
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{child}_count ON {child}")
+        op.execute(f"DROP FUNCTION IF EXISTS bump_{parent}_{column}()")
+        _set_updated_trigger(parent, None)
+        op.drop_column(parent, column)
@@ -0,0 +1,45 @@
+"""check_run_notify
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "018"
+down_revision: Union[str, None] = "017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match backend.check_run_events.CHANNEL.
+CHANNEL = "check_run"
+
+
+def upgrade() -> None:
+    # NOTIFY is delivered on commit, so listeners never see a rolled-back run.
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION notify_check_run() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('{CHANNEL}', json_build_object(
+                'id', NEW.id,
+                'status', NEW.status,
+                'cards_generated', NEW.cards_generated
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(
+        "CREATE TRIGGER trg_check_runs_notify "
+        "AFTER INSERT OR UPDATE OF status, cards_generated ON check_runs "
+        "FOR EACH ROW EXECUTE FUNCTION notify_check_run()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_check_runs_notify ON check_runs")
+    op.execute("DROP FUNCTION IF EXISTS notify_check_run()")
@@ -0,0 +1,35 @@
+"""external_storage_for_llm_text
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "019"
+down_revision: Union[str, None] = "018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Remaining generated/free-text bodies, read whole and only by detail views.
+# Same reasoning as 009: skip pglz on write and read, keep heap rows narrow.
+EXTERNAL_COLUMNS = {
+    "briefings": ["content"],
+    "analysis_card_comments": ["content"],
+}
+
+
+def upgrade() -> None:
+    for table, columns in EXTERNAL_COLUMNS.items():
+        clauses = ", ".join(f"ALTER COLUMN {column} SET STORAGE EXTERNAL" for column in columns)
+        op.execute(f"ALTER TABLE {table} {clauses}")
+
+
+def downgrade() -> None:
+    for table, columns in EXTERNAL_COLUMNS.items():
+        clauses = ", ".join(f"ALTER COLUMN {column} SET STORAGE EXTENDED" for column in columns)
+        op.execute(f"ALTER TABLE {table} {clauses}")
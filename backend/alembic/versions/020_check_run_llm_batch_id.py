@@ -0,0 +1,31 @@
+"""check_run_llm_batch_id
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "020"
+down_revision: Union[str, None] = "019"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Message Batch submitted by a scheduled run and not yet collected.
+    op.add_column("check_runs", sa.Column("llm_batch_id", sa.String(), nullable=True))
+    op.create_index(
+        "ix_check_runs_llm_batch_id", "check_runs", ["llm_batch_id"],
+        postgresql_where=sa.text("llm_batch_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_check_runs_llm_batch_id", table_name="check_runs")
+    op.drop_column("check_runs", "llm_batch_id")
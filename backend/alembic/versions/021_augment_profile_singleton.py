@@ -0,0 +1,37 @@
+"""augment_profile_singleton
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "021"
+down_revision: Union[str, None] = "020"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match backend.models.augment_profile.AUGMENT_PROFILE_ID.
+AUGMENT_PROFILE_ID = "00000000-0000-0000-0000-000000000001"
+
+
+def upgrade() -> None:
+    # Concurrent first loads could each insert a default row; keep the most
+    # recently edited one, which is what the app has been showing since.
+    op.execute("""
+        DELETE FROM augment_profile WHERE id <> (
+            SELECT id FROM augment_profile ORDER BY updated_at DESC, created_at DESC LIMIT 1
+        )
+    """)
+    op.execute(f"UPDATE augment_profile SET id = '{AUGMENT_PROFILE_ID}'")
+    op.create_check_constraint(
+        "ck_augment_profile_singleton", "augment_profile", f"id = '{AUGMENT_PROFILE_ID}'"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_augment_profile_singleton", "augment_profile", type_="check")
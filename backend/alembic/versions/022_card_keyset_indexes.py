@@ -0,0 +1,47 @@
+"""card_keyset_indexes
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "022"
+down_revision: Union[str, None] = "021"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (new index, replaced index, columns, replaced columns). The card list pages
+# with WHERE (created_at, id) < (...) ORDER BY created_at DESC, id DESC, which
+# only an index ending in both keys can answer without a sort.
+KEYSET_INDEXES = [
+    (
+        "ix_analysis_cards_created_id_desc", "ix_analysis_cards_created_desc",
+        [sa.text("created_at DESC"), sa.text("id DESC")], [sa.text("created_at DESC")],
+    ),
+    (
+        "ix_analysis_cards_status_created_id", "ix_analysis_cards_status_created",
+        ["status", sa.text("created_at DESC"), sa.text("id DESC")], ["status", sa.text("created_at DESC")],
+    ),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, replaced, columns, _ in KEYSET_INDEXES:
+            op.create_index(name, "analysis_cards", columns, postgresql_concurrently=True, if_not_exists=True)
+            op.drop_index(replaced, table_name="analysis_cards", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, replaced, _, replaced_columns in reversed(KEYSET_INDEXES):
+            op.create_index(
+                replaced, "analysis_cards", replaced_columns, postgresql_concurrently=True, if_not_exists=True
+            )
+            op.drop_index(name, table_name="analysis_cards", postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,38 @@
+"""card_priority_index
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "023"
+down_revision: Union[str, None] = "022"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Card list filtered by priority (the dashboard's red/yellow/green links),
+    # newest first, in the same (created_at, id) keyset order as 022.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_analysis_cards_priority_created_id",
+            "analysis_cards",
+            ["priority", sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_analysis_cards_priority_created_id", table_name="analysis_cards",
+            postgresql_concurrently=True, if_exists=True,
+        )
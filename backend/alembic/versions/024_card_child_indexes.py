@@ -0,0 +1,50 @@
+"""card_child_indexes
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-02-23
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "024"
+down_revision: Union[str, None] = "023"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns, partial-index predicate)
+CARD_CHILD_INDEXES = [
+    # A card's comment thread is read flat, oldest first; the comments_count
+    # trigger counts by card as well.
+    ("ix_analysis_card_comments_card_created", "analysis_card_comments", ["analysis_card_id", "created_at"], None),
+    # The recursive thread reload walks replies by parent.
+    (
+        "ix_analysis_card_comments_parent", "analysis_card_comments",
+        ["parent_comment_id"], "parent_comment_id IS NOT NULL",
+    ),
+    # Card history, newest first (a backward scan of the same index).
+    ("ix_analysis_card_edits_card_created", "analysis_card_edits", ["analysis_card_id", "created_at"], None),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in CARD_CHILD_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(CARD_CHILD_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
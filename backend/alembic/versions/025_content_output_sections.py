@@ -0,0 +1,60 @@
+"""content_output_sections
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-02-23
+
+"""
+import json
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "025"
+down_revision: Union[str, None] = "024"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors backend.routes.content_outputs._content_sections as of this revision.
+JSON_OBJECT_START = re.compile(r"\s*\{")
+
+
+def _sections(content: str) -> list[dict] | None:
+    if not JSON_OBJECT_START.match(content):
+        return None
+    try:
+        parsed = json.loads(content)
+    except ValueError:
+        return None
+    if not isinstance(parsed, dict):
+        return None
+    return [{"title": k, "body": v} for k, v in parsed.items()]
+
+
+def upgrade() -> None:
+    op.add_column("content_outputs", sa.Column("sections", postgresql.JSONB(), nullable=True))
+
+    # Backfill in Python rather than with jsonb_each: jsonb reorders keys, and
+    # section order is the order the model wrote them. The updated_at trigger
+    # is paused so stale-content detection does not see every output as new.
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(r"SELECT id, content FROM content_outputs WHERE content ~ '^\s*\{'")).all()
+    updates = [
+        {"id": row_id, "sections": json.dumps(sections)}
+        for row_id, content in rows
+        if (sections := _sections(content)) is not None
+    ]
+    if updates:
+        op.execute("ALTER TABLE content_outputs DISABLE TRIGGER trg_content_outputs_updated")
+        conn.execute(
+            sa.text("UPDATE content_outputs SET sections = CAST(:sections AS JSONB) WHERE id = :id"), updates
+        )
+        op.execute("ALTER TABLE content_outputs ENABLE TRIGGER trg_content_outputs_updated")
+
+
+def downgrade() -> None:
+    op.drop_column("content_outputs", "sections")
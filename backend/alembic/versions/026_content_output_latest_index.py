@@ -0,0 +1,41 @@
+"""content_output_latest_index
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-02-24
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "026"
+down_revision: Union[str, None] = "025"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The stale-content check reads the newest approved/published output per
+# (competitor_id, content_type) with DISTINCT ON ... ORDER BY updated_at DESC;
+# this index returns those rows in order, one per group, without a sort.
+INDEX_NAME = "ix_content_outputs_latest_approved"
+COLUMNS = ["competitor_id", "content_type", sa.text("updated_at DESC")]
+WHERE = "status IN ('approved', 'published')"
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            "content_outputs",
+            COLUMNS,
+            postgresql_where=sa.text(WHERE),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(INDEX_NAME, table_name="content_outputs", postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,135 @@
+"""In-process caches for read-heavy data.
+
+``briefing_cache`` holds briefing list/detail responses. Briefings change only
+when one is generated, edited or approved, or when a linked card is edited,
+yet every dashboard visit re-reads them.
+
+``profile_cache`` holds the Augment and competitor profile text that every
+card analysis, briefing and content generation puts into its prompt.
+
+``user_cache`` holds the signed-in user's columns (minus OAuth tokens), which
+every authenticated request looks up.
+
+Entries are kept for their cache's TTL and dropped as soon as any session
+commits a write to one of the models they were built from, whether flushed
+from the unit of work or executed as an INSERT/UPDATE/DELETE statement. The
+caches are per process: with several workers (gunicorn runs two), a write
+made through one worker is visible on the others after at most one TTL.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from backend.config import settings
+from backend.database import SessionLocal
+from backend.models.analysis_card import AnalysisCard
+from backend.models.augment_profile import AugmentProfile
+from backend.models.briefing import Briefing, BriefingCard
+from backend.models.competitor import Competitor
+from backend.models.user import User
+
+
+class TTLCache:
+    """Dict of values that expire ``ttl`` seconds after being set. ``ttl=0`` disables caching.
+
+    Holds at most ``max_entries`` values. Every entry lives for the same TTL,
+    so insertion order is expiry order: ``set`` drops expired entries from
+    the front, then the oldest ones while over the cap. Keys that are never
+    read again (one per briefing list cursor, say) cannot pile up.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 1024) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if self.ttl <= 0:
+            return
+        now = time.monotonic()
+        self._entries.pop(key, None)
+        self._entries[key] = (now + self.ttl, value)
+        while self._entries:
+            oldest_key, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now and len(self._entries) <= self.max_entries:
+                break
+            self._entries.pop(oldest_key, None)
+
+    def pop(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+briefing_cache = TTLCache(settings.BRIEFING_CACHE_TTL)
+profile_cache = TTLCache(settings.PROFILE_CACHE_TTL)
+user_cache = TTLCache(settings.USER_CACHE_TTL)
+
+# Writes to any of a cache's models can change what it holds.
+_CACHE_MODELS = (
+    (briefing_cache, (Briefing, BriefingCard, AnalysisCard)),
+    (profile_cache, (AugmentProfile, Competitor)),
+    (user_cache, (User,)),
+)
+_MODELS_BY_TABLE = {
+    model.__tablename__: model for _, models in _CACHE_MODELS for model in models
+}
+_STALE = "stale_caches"
+
+
+# ---------------------------------------------------------------------------
+# Invalidation
+# ---------------------------------------------------------------------------
+
+def _mark_stale(session: Session, classes: set[type]) -> None:
+    stale = {cache for cache, models in _CACHE_MODELS if any(issubclass(c, models) for c in classes)}
+    if stale:
+        session.info.setdefault(_STALE, set()).update(stale)
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _note_writes(session: Session, flush_context) -> None:
+    _mark_stale(session, {type(obj) for obj in chain(session.new, session.dirty, session.deleted)})
+
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _note_statement_writes(orm_execute_state: ORMExecuteState) -> None:
+    # INSERT/UPDATE/DELETE statements run through Session.execute (insert()
+    # of link rows, upserts, update_returning, Query.update) bypass flush.
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    model = _MODELS_BY_TABLE.get(orm_execute_state.statement.table.name)
+    if model is not None:
+        _mark_stale(orm_execute_state.session, {model})
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    # Cleared after the commit, so readers from then on load the new rows. A
+    # reader that loaded before the commit can still set() the old ones
+    # afterwards; that entry lives for at most one TTL.
+    for cache in session.info.pop(_STALE, ()):
+        cache.clear()
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _forget_rolled_back_writes(session: Session) -> None:
+    session.info.pop(_STALE, None)
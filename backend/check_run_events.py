@@ -0,0 +1,124 @@
+"""Push check-run changes to browsers via PostgreSQL LISTEN/NOTIFY.
+
+Migration 018 fires ``NOTIFY check_run`` with a small JSON payload whenever a
+check run is created or its status or card count changes. Each process keeps
+one dedicated connection LISTENing, registered as a reader on the event loop,
+and fans payloads out to the WebSocket clients subscribed through
+``check_run_listener.subscribe()``. Idle dashboards cost no queries, and
+NOTIFY reaches every app instance, whichever one ran the check.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from backend.database import engine
+
+logger = logging.getLogger(__name__)
+
+# Must match the channel in migration 018.
+CHANNEL = "check_run"
+RECONNECT_DELAY = 5  # seconds
+# Events queued for a client that is not reading; later ones are dropped.
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class CheckRunListener:
+    """One LISTEN connection per process, fanned out to asyncio queues."""
+
+    def __init__(self) -> None:
+        self._conn = None
+        # Kept apart from the connection: a closed psycopg2 connection
+        # raises on fileno(), but its reader must still be removed.
+        self._fd: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._subscribers: set[asyncio.Queue[str]] = set()
+        self._closed = False
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._closed = False
+        await self._connect()
+
+    def stop(self) -> None:
+        self._closed = True
+        self._disconnect()
+
+    @contextmanager
+    def subscribe(self) -> Iterator[asyncio.Queue[str]]:
+        """Yield a queue that receives every notification payload until exit."""
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    # ------------------------------------------------------------------
+    # Connection handling
+    # ------------------------------------------------------------------
+
+    async def _connect(self) -> None:
+        try:
+            self._conn = await self._loop.run_in_executor(None, _open_listen_connection)
+        except Exception:
+            logger.warning("Could not LISTEN on %s; retrying in %ss", CHANNEL, RECONNECT_DELAY, exc_info=True)
+            self._schedule_reconnect()
+            return
+        self._fd = self._conn.fileno()
+        self._loop.add_reader(self._fd, self._drain)
+
+    def _disconnect(self) -> None:
+        if self._fd is not None:
+            self._loop.remove_reader(self._fd)
+            self._fd = None
+        if self._conn is None:
+            return
+        try:
+            self._conn.close()
+        except Exception:
+            logger.debug("Error closing LISTEN connection", exc_info=True)
+        self._conn = None
+
+    def _schedule_reconnect(self) -> None:
+        if not self._closed:
+            self._loop.call_later(RECONNECT_DELAY, lambda: self._loop.create_task(self._connect()))
+
+    def _drain(self) -> None:
+        """Event-loop reader callback: hand pending notifications to subscribers."""
+        if self._conn is None:
+            return
+        try:
+            self._conn.poll()
+        except Exception:
+            logger.warning("LISTEN connection lost; reconnecting", exc_info=True)
+            self._disconnect()
+            self._schedule_reconnect()
+            return
+        while self._conn.notifies:
+            self.publish(self._conn.notifies.pop(0).payload)
+
+    def publish(self, payload: str) -> None:
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                logger.debug("Dropping check-run event for a slow subscriber")
+
+
+def _open_listen_connection():
+    """Open a connection outside the pool, in autocommit mode, LISTENing on CHANNEL."""
+    conn = engine.raw_connection()
+    # Detached so it neither counts against nor returns to the request pool.
+    conn.detach()
+    dbapi_conn = conn.driver_connection
+    dbapi_conn.autocommit = True
+    with dbapi_conn.cursor() as cursor:
+        cursor.execute(f"LISTEN {CHANNEL}")
+    return dbapi_conn
+
+
+check_run_listener = CheckRunListener()
@@ -1,20 +1,172 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+import logging
+from collections import Counter
+from contextvars import ContextVar
+
+import orjson
+from sqlalchemy import create_engine, event, inspect, update
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker, DeclarativeBase
+from sqlalchemy.orm.attributes import set_committed_value
 
 from backend.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+logger = logging.getLogger(__name__)
+
+# Sync endpoints run in FastAPI's worker threadpool (40 threads by default),
+# so size the pool for that concurrency rather than SQLAlchemy's default 5+10.
+engine = create_engine(
+    settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # A stuck query (e.g. behind a slow LLM endpoint) cannot pin a pooled
+    # connection for longer than this. Sessions run in UTC, so server-side
+    # now() and timestamptz text output never depend on the server's zone.
+    connect_args={"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS} -c timezone=UTC"},
+    # JSONB columns (raw_llm_output, sections, ...) are parsed with orjson.
+    json_serializer=lambda value: orjson.dumps(value).decode(),
+    json_deserializer=orjson.loads,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# application_name reported to PostgreSQL for connections checked out in the
+# current context; set per request by DBApplicationNameMiddleware.
+db_application_name: ContextVar[str] = ContextVar("db_application_name", default=settings.DB_APPLICATION_NAME)
+
+
+@event.listens_for(engine, "checkout")
+def _set_application_name(dbapi_conn, connection_record, connection_proxy) -> None:
+    """Tag the connection in pg_stat_activity with the router using it."""
+    name = db_application_name.get()
+    if connection_record.info.get("application_name") == name:
+        return
+    with dbapi_conn.cursor() as cursor:
+        cursor.execute("SET application_name = %s", (name,))
+    # Commit so the setting survives the pool's rollback-on-return.
+    dbapi_conn.commit()
+    connection_record.info["application_name"] = name
+
+
+class DBApplicationNameMiddleware:
+    """ASGI middleware that names DB connections after the API router serving the request."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith("/api/"):
+            router_name = scope["path"].split("/", 3)[2]
+            token = db_application_name.set(f"{settings.DB_APPLICATION_NAME}:{router_name}")
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                db_application_name.reset(token)
+        else:
+            await self.app(scope, receive, send)
+
+
+class NPlusOneError(Exception):
+    """A relationship was lazy-loaded more than once in a single request."""
+
+
+# Lazy loads per relationship in the current request; None outside requests
+# handled by NPlusOneMiddleware.
+_lazy_loads: ContextVar[Counter | None] = ContextVar("lazy_loads", default=None)
+
+
+def _record_lazy_load(orm_execute_state: ORMExecuteState) -> None:
+    loads = _lazy_loads.get()
+    if loads is None or orm_execute_state.lazy_loaded_from is None:
+        return
+    attribute = str(orm_execute_state.loader_strategy_path.prop)
+    loads[attribute] += 1
+    # One lazy load is fine; the second one for the same relationship means
+    # it is being loaded per row.
+    if loads[attribute] == 2:
+        if settings.NPLUSONE_RAISE:
+            raise NPlusOneError(f"{attribute} lazy-loaded repeatedly; add it to the query's eager loads")
+        logger.warning("Potential N+1 query: %s lazy-loaded repeatedly in one request", attribute)
+
+
+class NPlusOneMiddleware:
+    """Development-only ASGI middleware that flags relationships lazy-loaded per row.
+
+    Hooks SessionLocal's ``do_orm_execute`` event, so it costs nothing unless
+    installed. Warns by default; ``NPLUSONE_RAISE`` turns hits into errors.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+        if not event.contains(SessionLocal, "do_orm_execute", _record_lazy_load):
+            event.listen(SessionLocal, "do_orm_execute", _record_lazy_load)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _lazy_loads.set(Counter())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _lazy_loads.reset(token)
+
+
+def warm_pool(count: int = settings.DB_POOL_WARM) -> None:
+    """Open ``count`` pooled connections up front so early requests skip the connect handshake."""
+    connections = []
+    try:
+        for _ in range(min(count, settings.DB_POOL_SIZE)):
+            connections.append(engine.connect())
+    except Exception:
+        logger.warning("Could not pre-warm the database pool", exc_info=True)
+    finally:
+        for connection in connections:
+            connection.close()
+
+
+def pool_stats() -> dict:
+    """Snapshot of the connection pool for monitoring."""
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "status": pool.status(),
+    }
+
 
 class Base(DeclarativeBase):
     pass
 
 
+def update_returning(db: Session, obj: Base, **values) -> None:
+    """UPDATE ``obj``'s row with ``values`` and keep what the database wrote.
+
+    Values may be SQL expressions such as ``func.now()``. The written columns
+    and the trigger-maintained (``server_onupdate``) ones come back through
+    RETURNING and are stored on ``obj`` as loaded state, so it can be
+    serialized without a refresh.
+    """
+    mapper = inspect(obj).mapper
+    returned = [mapper.attrs[key] for key in values] + [
+        prop for prop in mapper.column_attrs
+        if prop.key not in values and prop.columns[0].server_onupdate is not None
+    ]
+    stmt = (
+        update(mapper.class_)
+        .where(*[col == value for col, value in zip(mapper.primary_key, mapper.primary_key_from_instance(obj))])
+        .values(**values)
+        .returning(*[prop.class_attribute for prop in returned])
+    )
+    row = db.execute(stmt, execution_options={"synchronize_session": False}).one()
+    for prop, value in zip(returned, row):
+        set_committed_value(obj, prop.key, value)
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
-
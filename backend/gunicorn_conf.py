@@ -0,0 +1,37 @@
+"""Gunicorn settings for the production container.
+
+The app is imported once in the master (``preload_app``) and forked into
+Uvicorn workers, so module-level state (SQLAlchemy mappers, route tables,
+the SPA index bytes) is shared copy-on-write.
+
+Each worker has its own connection pool and check-run LISTEN connection, so
+PostgreSQL sees up to ``workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW + 1)``
+connections. The default of two workers is 2 * (20 + 10 + 1) = 62, inside
+PostgreSQL's stock ``max_connections`` of 100; raise ``WEB_CONCURRENCY`` only
+together with the server limit or with smaller per-worker pools.
+
+Workers share nothing else at run time. The in-process caches in
+``backend.cache`` are cleared only in the worker that made a write, so other
+workers can serve a stale entry for up to one TTL, and
+``BRIEFING_MAX_INFLIGHT`` caps briefing calls per worker, not per host.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = True
+# Feed checks fetch and parse every feed inside the request.
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+
+def post_fork(server, worker):
+    # Connections opened in the master before forking must not be shared by
+    # the children; drop them from this worker's pool without closing the
+    # parent's sockets.
+    from backend.database import engine
+
+    engine.dispose(close=False)
@@ -1,19 +1,35 @@
 import logging
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
+from backend.check_run_events import check_run_listener
 from backend.config import settings
+from backend.database import DBApplicationNameMiddleware, NPlusOneMiddleware, engine, warm_pool
+from backend.static_files import CachedStaticFiles, SPAIndex
 from backend.routes import auth, feeds, competitors, augment_profile, cards, briefings, suggestions, system, content_outputs, content_templates
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Competitive Intelligence Scanner")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await run_in_threadpool(warm_pool)
+    await check_run_listener.start()
+    yield
+    check_run_listener.stop()
+    # Close pooled connections so reloads and shutdowns don't leave them open.
+    engine.dispose()
+
+
+app = FastAPI(title="Competitive Intelligence Scanner", lifespan=lifespan)
 
 
 @app.exception_handler(Exception)
@@ -27,14 +43,32 @@ async def global_exception_handler(request: Request, exc: Exception):
 # Session middleware — must be added before CORS so sessions work on all routes
 app.add_middleware(SessionMiddleware, secret_key=settings.SESSION_SECRET)
 
+app.add_middleware(DBApplicationNameMiddleware)
+
+# Flag relationships lazy-loaded once per row while developing
+if settings.ENV != "production":
+    app.add_middleware(NPlusOneMiddleware)
+
+# Compress JSON and other dynamic responses. Static assets with a
+# precompressed sibling already carry Content-Encoding and are left alone.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+
+@app.get("/healthz", include_in_schema=False)
+async def healthz():
+    """Liveness probe; registered first so it matches before any router."""
+    return {"status": "ok"}
+
+
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
 app.include_router(feeds.router, prefix="/api/feeds", tags=["feeds"])
 app.include_router(competitors.router, prefix="/api/competitors", tags=["competitors"])
@@ -46,24 +80,40 @@ app.include_router(system.router, prefix="/api", tags=["system"])
 app.include_router(content_outputs.router, prefix="/api/content-outputs", tags=["content-outputs"])
 app.include_router(content_templates.router, prefix="/api/content-templates", tags=["content-templates"])
 
-# Static file serving with SPA fallback
+# Static file serving with SPA fallback (skipped when nginx / a CDN serves ./static)
 static_dir = Path("./static")
-if static_dir.is_dir():
+if settings.SERVE_STATIC and static_dir.is_dir():
     # Mount static assets (JS, CSS, images) at /assets
     assets_dir = static_dir / "assets"
     if assets_dir.is_dir():
-        app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="assets")
+        # Vite content-hashes every file under /assets, so a URL never changes content.
+        app.mount(
+            "/assets",
+            CachedStaticFiles(directory=str(assets_dir), cache_control="public, max-age=31536000, immutable"),
+            name="assets",
+        )
+
+    # The frontend build is fixed for the life of the process, so stat the
+    # top-level files once instead of on every request.
+    vite_svg_file = static_dir / "vite.svg"
+    vite_svg_stat = vite_svg_file.stat() if vite_svg_file.is_file() else None
+    index_file = static_dir / "index.html"
+    spa_index = SPAIndex(index_file) if index_file.is_file() else None
 
     # Serve other static files (favicon, etc.)
     @app.get("/vite.svg")
     async def vite_svg():
-        return FileResponse(static_dir / "vite.svg")
+        if vite_svg_stat is None:
+            return JSONResponse(status_code=404, content={"detail": "Not Found"})
+        return FileResponse(
+            vite_svg_file, stat_result=vite_svg_stat, headers={"Cache-Control": "public, max-age=86400"}
+        )
 
-    # SPA catch-all: serve index.html for all non-API routes
+    # SPA catch-all: serve index.html for all non-API routes. Unknown /api
+    # paths get a real 404 rather than the app shell.
     @app.get("/{full_path:path}")
-    async def spa_fallback(full_path: str):
-        index_file = static_dir / "index.html"
-        if index_file.exists():
-            return FileResponse(index_file)
-        return JSONResponse(status_code=404, content={"detail": "Not Found"})
+    async def spa_fallback(full_path: str, request: Request):
+        if spa_index is None or full_path == "api" or full_path.startswith("api/"):
+            return JSONResponse(status_code=404, content={"detail": "Not Found"})
+        return spa_index.response(request.headers.get("if-none-match"))
 
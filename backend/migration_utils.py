@@ -0,0 +1,128 @@
+"""Helpers for data migrations that touch many rows.
+
+Schema changes stay plain ``op.*`` calls; these helpers are for backfills and
+bulk inserts, which should never load a whole table into memory or hold one
+transaction open for the full run. Each batch is committed on its own inside
+an Alembic ``autocommit_block()``, and rows are paged by primary key (keyset
+pagination) rather than ``OFFSET`` so later pages stay cheap. Row-wise
+writes go through ``psycopg2.extras.execute_values`` so each batch is a single
+multi-row ``VALUES`` statement instead of one round-trip per row.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+from psycopg2.extras import execute_values
+
+BATCH_SIZE = 1000
+
+
+def chunked(rows: Iterable[Any], size: int = BATCH_SIZE) -> Iterator[list[Any]]:
+    """Yield successive lists of at most ``size`` items from ``rows``."""
+    it = iter(rows)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def iter_key_batches(
+    conn: sa.engine.Connection,
+    table: str,
+    key: str = "id",
+    where: str | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> Iterator[list[Any]]:
+    """Yield primary-key values of ``table`` in ascending order, one page at a time."""
+    last_key = None
+    while True:
+        clauses = [f"({where})"] if where else []
+        params: dict[str, Any] = {"limit": batch_size}
+        if last_key is not None:
+            clauses.append(f"{key} > :last_key")
+            params["last_key"] = last_key
+        sql = f"SELECT {key} FROM {table}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {key} LIMIT :limit"
+
+        keys = [row[0] for row in conn.execute(sa.text(sql), params)]
+        if not keys:
+            return
+        yield keys
+        last_key = keys[-1]
+
+
+def batched_update(
+    table: str,
+    set_clause: str,
+    where: str | None = None,
+    key: str = "id",
+    batch_size: int = BATCH_SIZE,
+) -> int:
+    """Run ``UPDATE table SET set_clause`` in committed, keyset-paginated batches.
+
+    Returns the total number of rows updated.
+    """
+    updated = 0
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        for keys in iter_key_batches(conn, table, key=key, where=where, batch_size=batch_size):
+            result = conn.execute(
+                sa.text(f"UPDATE {table} SET {set_clause} WHERE {key} = ANY(:keys)"),
+                {"keys": keys},
+            )
+            updated += result.rowcount
+    return updated
+
+
+def batched_insert(
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    template: str | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> int:
+    """Insert row tuples into ``table`` with one multi-VALUES statement per batch.
+
+    ``template`` is passed through to ``execute_values`` for casts such as
+    ``"(%s::uuid, %s::jsonb)"``. Returns the row count.
+    """
+    sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s"
+    inserted = 0
+    with op.get_context().autocommit_block(), op.get_bind().connection.cursor() as cursor:
+        for batch in chunked(rows, batch_size):
+            execute_values(cursor, sql, batch, template=template, page_size=batch_size)
+            inserted += len(batch)
+    return inserted
+
+
+def batched_update_values(
+    table: str,
+    key: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    template: str | None = None,
+    batch_size: int = BATCH_SIZE,
+) -> int:
+    """Apply per-row values computed in Python, joined on ``key``, one batch per statement.
+
+    Each row is ``(key_value, *column_values)``. Use this for backfills whose
+    new values cannot be expressed as a single SQL ``SET`` clause.
+    Returns the row count.
+    """
+    assignments = ", ".join(f"{col} = data.{col}" for col in columns)
+    sql = (
+        f"UPDATE {table} SET {assignments} "
+        f"FROM (VALUES %s) AS data ({key}, {', '.join(columns)}) "
+        f"WHERE {table}.{key} = data.{key}"
+    )
+    updated = 0
+    with op.get_context().autocommit_block(), op.get_bind().connection.cursor() as cursor:
+        for batch in chunked(rows, batch_size):
+            execute_values(cursor, sql, batch, template=template, page_size=batch_size)
+            updated += len(batch)
+    return updated
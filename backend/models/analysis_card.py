@@ -2,63 +2,120 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
+from typing import Literal
 
-from sqlalchemy import String, Text, Boolean, ForeignKey, Enum as SAEnum, func
+from sqlalchemy import String, DateTime, Integer, Text, Boolean, ForeignKey, Index, CheckConstraint, FetchedValue, func, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, backref, mapped_column, relationship
 
 from backend.database import Base
 
 
+EventType = Literal[
+    "new_feature", "product_announcement", "partnership", "acquisition", "acquired",
+    "funding", "pricing_change", "leadership_change", "expansion", "other",
+]
+Priority = Literal["red", "yellow", "green"]
+CardStatus = Literal["draft", "in_review", "approved", "archived"]
+
+
 class AnalysisCard(Base):
     __tablename__ = "analysis_cards"
+    __table_args__ = (
+        CheckConstraint(
+            "event_type IN ('new_feature', 'product_announcement', 'partnership', 'acquisition', "
+            "'acquired', 'funding', 'pricing_change', 'leadership_change', 'expansion', 'other')",
+            name="ck_analysis_cards_event_type",
+        ),
+        CheckConstraint("priority IN ('red', 'yellow', 'green')", name="ck_analysis_cards_priority"),
+        CheckConstraint(
+            "status IN ('draft', 'in_review', 'approved', 'archived')", name="ck_analysis_cards_status"
+        ),
+        Index(
+            "ix_analysis_cards_raw_llm_output_gin", "raw_llm_output",
+            postgresql_using="gin", postgresql_ops={"raw_llm_output": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_analysis_cards_approved_by", "approved_by",
+            postgresql_include=["approved_at"], postgresql_where=text("approved_by IS NOT NULL"),
+        ),
+        Index(
+            "ix_analysis_cards_check_run_id", "check_run_id", postgresql_where=text("check_run_id IS NOT NULL")
+        ),
+        Index(
+            "ix_analysis_cards_feed_item_id", "feed_item_id", postgresql_where=text("feed_item_id IS NOT NULL")
+        ),
+    )
+
+    # Fetch trigger-maintained columns (updated_at, counters) with RETURNING
+    # on UPDATE too, so an edited row can be serialized without a refresh.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v7()")
+    )
     feed_item_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("feed_items.id"), nullable=True
     )
-    event_type: Mapped[str] = mapped_column(
-        SAEnum(
-            "new_feature", "product_announcement", "partnership", "acquisition",
-            "acquired", "funding", "pricing_change", "leadership_change", "expansion", "other",
-            name="event_type",
-        ),
-        nullable=False,
-    )
-    priority: Mapped[str] = mapped_column(
-        SAEnum("red", "yellow", "green", name="priority_level"),
-        nullable=False,
-    )
+    event_type: Mapped[EventType] = mapped_column(String, nullable=False)
+    priority: Mapped[Priority] = mapped_column(String, nullable=False)
     title: Mapped[str] = mapped_column(String, nullable=False)
     summary: Mapped[str] = mapped_column(Text, nullable=False)
     impact_assessment: Mapped[str] = mapped_column(Text, nullable=False)
     suggested_counter_moves: Mapped[str] = mapped_column(Text, nullable=False)
-    raw_llm_output: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
-    status: Mapped[str] = mapped_column(
-        SAEnum("draft", "in_review", "approved", "archived", name="card_status"),
-        default="draft",
-        nullable=False,
-    )
+    # Tens of KB of model output that only the card detail view returns.
+    raw_llm_output: Mapped[dict | None] = mapped_column(JSONB, nullable=True, deferred=True)
+    status: Mapped[CardStatus] = mapped_column(String, default="draft", nullable=False)
     approved_by: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=True
     )
-    approved_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    approved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     check_run_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("check_runs.id"), nullable=True
     )
-    created_at: Mapped[datetime] = mapped_column(default=func.now(), nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now(), nullable=False)
+    # Maintained by a trigger on analysis_card_comments; never written by the app.
+    comments_count: Mapped[int] = mapped_column(
+        Integer, server_default="0", server_onupdate=FetchedValue(), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.current_timestamp(),
+        server_onupdate=FetchedValue(),  # set by the set_updated_at() trigger
+        nullable=False,
+    )
+
+    # lazy="raise": touching an unloaded relationship fails loudly instead of
+    # issuing one query per card. Eager-load via backend.models.loaders.
+    feed_item = relationship("FeedItem", lazy="raise")
+    approver = relationship("User", lazy="raise")
+    check_run = relationship("CheckRun", lazy="raise")
+    competitors = relationship(
+        "Competitor", secondary="analysis_card_competitors", backref="analysis_cards", lazy="raise"
+    )
+    edits = relationship("AnalysisCardEdit", back_populates="analysis_card", lazy="raise")
+    comments = relationship("AnalysisCardComment", back_populates="analysis_card", lazy="raise")
 
-    feed_item = relationship("FeedItem")
-    approver = relationship("User")
-    check_run = relationship("CheckRun")
-    competitors = relationship("Competitor", secondary="analysis_card_competitors", backref="analysis_cards")
-    edits = relationship("AnalysisCardEdit", back_populates="analysis_card")
-    comments = relationship("AnalysisCardComment", back_populates="analysis_card")
+
+# Keyset pagination order for the card list (migration 022).
+Index("ix_analysis_cards_created_id_desc", AnalysisCard.created_at.desc(), AnalysisCard.id.desc())
+Index(
+    "ix_analysis_cards_status_created_id",
+    AnalysisCard.status, AnalysisCard.created_at.desc(), AnalysisCard.id.desc(),
+)
+Index(
+    "ix_analysis_cards_priority_created_id",
+    AnalysisCard.priority, AnalysisCard.created_at.desc(), AnalysisCard.id.desc(),
+)
 
 
 class AnalysisCardCompetitor(Base):
     __tablename__ = "analysis_card_competitors"
+    __table_args__ = (
+        Index("ix_card_competitors_comp", "competitor_id", "analysis_card_id"),
+    )
 
     analysis_card_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("analysis_cards.id"), primary_key=True
@@ -70,8 +127,14 @@ class AnalysisCardCompetitor(Base):
 
 class AnalysisCardEdit(Base):
     __tablename__ = "analysis_card_edits"
+    __table_args__ = (
+        Index("ix_analysis_card_edits_user_id", "user_id"),
+        Index("ix_analysis_card_edits_card_created", "analysis_card_id", "created_at"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v7()")
+    )
     analysis_card_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("analysis_cards.id"), nullable=False
     )
@@ -79,7 +142,9 @@ class AnalysisCardEdit(Base):
     field_changed: Mapped[str] = mapped_column(String, nullable=False)
     previous_value: Mapped[str] = mapped_column(Text, nullable=False)
     new_value: Mapped[str] = mapped_column(Text, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(default=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False
+    )
 
     analysis_card = relationship("AnalysisCard", back_populates="edits")
     user = relationship("User")
@@ -87,21 +152,49 @@ class AnalysisCardEdit(Base):
 
 class AnalysisCardComment(Base):
     __tablename__ = "analysis_card_comments"
+    __table_args__ = (
+        Index("ix_analysis_card_comments_user_id", "user_id"),
+        Index("ix_analysis_card_comments_card_created", "analysis_card_id", "created_at"),
+        Index(
+            "ix_analysis_card_comments_parent", "parent_comment_id",
+            postgresql_where=text("parent_comment_id IS NOT NULL"),
+        ),
+    )
+
+    # Fetch the trigger-set updated_at with RETURNING on UPDATE too, so an
+    # edited comment can be serialized without a refresh.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v7()")
+    )
     analysis_card_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("analysis_cards.id"), nullable=False
     )
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    # STORAGE EXTERNAL (migration 019): stored out of line, uncompressed.
     content: Mapped[str] = mapped_column(Text, nullable=False)
     parent_comment_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("analysis_card_comments.id"), nullable=True
     )
     resolved: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(default=func.now(), nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.current_timestamp(),
+        server_onupdate=FetchedValue(),  # set by the set_updated_at() trigger
+        nullable=False,
+    )
 
     analysis_card = relationship("AnalysisCard", back_populates="comments")
     user = relationship("User")
-    replies = relationship("AnalysisCardComment", backref="parent", remote_side=[id])
-
+    # Threads are assembled in memory from one query (see routes/cards.py);
+    # a lazy load here would cost a query per comment per level.
+    replies = relationship(
+        "AnalysisCardComment",
+        backref=backref("parent", remote_side=[id]),
+        order_by="AnalysisCardComment.created_at",
+        lazy="raise",
+    )
@@ -3,17 +3,28 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Text, ForeignKey, func
+from sqlalchemy import DateTime, Text, ForeignKey, FetchedValue, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.database import Base
 
 
+# The table holds exactly one row under this fixed key, enforced by the
+# ck_augment_profile_singleton CHECK added in migration 021.
+AUGMENT_PROFILE_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+
 class AugmentProfile(Base):
     __tablename__ = "augment_profile"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Fetch the trigger-set updated_at with RETURNING on UPDATE too, so an
+    # edited profile can be serialized without a refresh.
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
     company_description: Mapped[str] = mapped_column(Text, nullable=False)
     key_differentiators: Mapped[str] = mapped_column(Text, nullable=False)
     target_customer_segments: Mapped[str] = mapped_column(Text, nullable=False)
@@ -21,8 +32,15 @@ class AugmentProfile(Base):
     strategic_priorities: Mapped[str] = mapped_column(Text, nullable=False)
     pricing: Mapped[str] = mapped_column(Text, nullable=False)
     updated_by: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(default=func.now(), nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.current_timestamp(),
+        server_onupdate=FetchedValue(),  # set by the set_updated_at() trigger
+        nullable=False,
+    )
 
     updater = relationship("User")
 
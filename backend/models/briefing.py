@@ -2,35 +2,65 @@ from __future__ import annotations
 
 import uuid
 from datetime import date, datetime
+from typing import Literal
 
-from sqlalchemy import Date, Text, ForeignKey, Enum as SAEnum, func
+from sqlalchemy import String, Date, DateTime, Integer, Text, ForeignKey, Index, CheckConstraint, FetchedValue, func, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.database import Base
 
 
+BriefingStatus = Literal["draft", "in_review", "approved", "archived"]
+
+
 class Briefing(Base):
     __tablename__ = "briefings"
+    __table_args__ = (
+        CheckConstraint("status IN ('draft', 'in_review', 'approved', 'archived')", name="ck_briefings_status"),
+        Index(
+            "ix_briefings_raw_llm_output_gin", "raw_llm_output",
+            postgresql_using="gin", postgresql_ops={"raw_llm_output": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_briefings_approved_by", "approved_by",
+            postgresql_include=["approved_at"], postgresql_where=text("approved_by IS NOT NULL"),
+        ),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    date: Mapped[date] = mapped_column(Date, unique=True, nullable=False)
-    content: Mapped[str] = mapped_column(Text, nullable=False)
-    raw_llm_output: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
-    status: Mapped[str] = mapped_column(
-        SAEnum("draft", "in_review", "approved", "archived", name="briefing_status"),
-        default="draft",
-        nullable=False,
+    # Fetch trigger-maintained columns (updated_at, counters) with RETURNING
+    # on UPDATE too, so an edited row can be serialized without a refresh.
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
     )
+    date: Mapped[date] = mapped_column(Date, unique=True, nullable=False)
+    # The Markdown body and model output are only returned by detail views.
+    # content is STORAGE EXTERNAL (migration 019): stored out of line, uncompressed.
+    content: Mapped[str] = mapped_column(Text, nullable=False, deferred=True)
+    raw_llm_output: Mapped[dict | None] = mapped_column(JSONB, nullable=True, deferred=True)
+    status: Mapped[BriefingStatus] = mapped_column(String, default="draft", nullable=False)
     approved_by: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=True
     )
-    approved_at: Mapped[datetime | None] = mapped_column(nullable=True)
-    created_at: Mapped[datetime] = mapped_column(default=func.now(), nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now(), nullable=False)
+    approved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Maintained by a trigger on briefing_cards; never written by the app.
+    card_count: Mapped[int] = mapped_column(
+        Integer, server_default="0", server_onupdate=FetchedValue(), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.current_timestamp(),
+        server_onupdate=FetchedValue(),  # set by the set_updated_at() trigger
+        nullable=False,
+    )
 
     approver = relationship("User")
-    cards = relationship("AnalysisCard", secondary="briefing_cards", backref="briefings")
+    cards = relationship("AnalysisCard", secondary="briefing_cards", backref="briefings", lazy="raise")
 
 
 class BriefingCard(Base):
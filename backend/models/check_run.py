@@ -2,27 +2,36 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
+from typing import Literal
 
-from sqlalchemy import Integer, Text, Enum as SAEnum
+from sqlalchemy import String, DateTime, Integer, Text, CheckConstraint, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.database import Base
 
 
+CheckRunStatus = Literal["running", "completed", "failed"]
+
+
 class CheckRun(Base):
     __tablename__ = "check_runs"
+    __table_args__ = (
+        CheckConstraint("status IN ('running', 'completed', 'failed')", name="ck_check_runs_status"),
+        Index("ix_check_runs_llm_batch_id", "llm_batch_id", postgresql_where=text("llm_batch_id IS NOT NULL")),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    scheduled_time: Mapped[datetime] = mapped_column(nullable=False)
-    started_at: Mapped[datetime] = mapped_column(nullable=False)
-    completed_at: Mapped[datetime | None] = mapped_column(nullable=True)
-    status: Mapped[str] = mapped_column(
-        SAEnum("running", "completed", "failed", name="check_run_status"),
-        nullable=False,
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v7()")
     )
+    scheduled_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    status: Mapped[CheckRunStatus] = mapped_column(String, nullable=False)
     feeds_checked: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     new_items_found: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     cards_generated: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     error_log: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Message Batch still awaiting collection (see LLMAnalyzer.collect_batch).
+    llm_batch_id: Mapped[str | None] = mapped_column(String, nullable=True)
 
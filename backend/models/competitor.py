@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, Boolean, Text, ForeignKey, func
+from sqlalchemy import String, DateTime, Boolean, Text, ForeignKey, FetchedValue, Index, func, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,8 +12,13 @@ from backend.database import Base
 
 class Competitor(Base):
     __tablename__ = "competitors"
+    __table_args__ = (
+        Index("ix_competitors_created_by", "created_by", postgresql_where=text("created_by IS NOT NULL")),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
     name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     key_products: Mapped[str] = mapped_column(Text, nullable=False)
@@ -22,15 +27,22 @@ class Competitor(Base):
     known_weaknesses: Mapped[str] = mapped_column(Text, nullable=False)
     augment_overlap: Mapped[str] = mapped_column(Text, nullable=False)
     pricing: Mapped[str] = mapped_column(Text, nullable=False)
-    content_types: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    content_types: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_suggested: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     suggested_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_by: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=True
     )
-    created_at: Mapped[datetime] = mapped_column(default=func.now(), nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.current_timestamp(),
+        server_onupdate=FetchedValue(),  # set by the set_updated_at() trigger
+        nullable=False,
+    )
 
     creator = relationship("User")
     feeds = relationship("RSSFeed", back_populates="competitor")
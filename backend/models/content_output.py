@@ -2,31 +2,51 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
+from typing import Literal
 
-from sqlalchemy import String, Integer, Text, ForeignKey, Enum as SAEnum, func
+from sqlalchemy import String, DateTime, Integer, Text, ForeignKey, Index, CheckConstraint, FetchedValue, func, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.database import Base
 
 
+ContentOutputStatus = Literal["draft", "in_review", "approved", "published", "failed"]
+
+
 class ContentOutput(Base):
     __tablename__ = "content_outputs"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('draft', 'in_review', 'approved', 'published', 'failed')",
+            name="ck_content_outputs_status",
+        ),
+        Index(
+            "ix_content_outputs_source_card_ids_gin", "source_card_ids",
+            postgresql_using="gin", postgresql_ops={"source_card_ids": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_content_outputs_approved_by", "approved_by",
+            postgresql_include=["approved_at"], postgresql_where=text("approved_by IS NOT NULL"),
+        ),
+        Index("ix_content_outputs_competitor_status", "competitor_id", "status"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v7()")
+    )
     competitor_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("competitors.id"), nullable=False
     )
     content_type: Mapped[str] = mapped_column(String, nullable=False)
     title: Mapped[str | None] = mapped_column(String, nullable=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
-    source_card_ids: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # Title/body pairs split out of JSON-object content when it is written
+    # (migration 025), so reads never parse the body.
+    sections: Mapped[list[dict] | None] = mapped_column(JSONB, nullable=True)
+    source_card_ids: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True)
     version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
-    status: Mapped[str] = mapped_column(
-        SAEnum("draft", "in_review", "approved", "published", "failed", name="content_output_status"),
-        default="draft",
-        nullable=False,
-    )
+    status: Mapped[ContentOutputStatus] = mapped_column(String, default="draft", nullable=False)
     template_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("content_templates.id"), nullable=True
     )
@@ -35,14 +55,30 @@ class ContentOutput(Base):
     approved_by: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=True
     )
-    approved_at: Mapped[datetime | None] = mapped_column(nullable=True)
-    published_at: Mapped[datetime | None] = mapped_column(nullable=True)
-    raw_llm_output: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    approved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    published_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Kept for auditing; never returned by the API.
+    raw_llm_output: Mapped[dict | None] = mapped_column(JSONB, nullable=True, deferred=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(default=func.now(), nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.current_timestamp(),
+        server_onupdate=FetchedValue(),  # set by the set_updated_at() trigger
+        nullable=False,
+    )
 
     competitor = relationship("Competitor")
     template = relationship("ContentTemplate")
     approver = relationship("User")
 
+
+# Latest approved/published output per (competitor, content_type), read by
+# the stale-content check (migration 026).
+Index(
+    "ix_content_outputs_latest_approved",
+    ContentOutput.competitor_id, ContentOutput.content_type, ContentOutput.updated_at.desc(),
+    postgresql_where=text("status IN ('approved', 'published')"),
+)
@@ -2,33 +2,51 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
+from typing import Literal
 
-from sqlalchemy import String, Boolean, Integer, Text, ForeignKey, func
+from sqlalchemy import String, DateTime, Boolean, Integer, Text, ForeignKey, Index, CheckConstraint, FetchedValue, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.database import Base
 
 
+FeedType = Literal["rss", "web_scrape", "twitter"]
+
+
 class RSSFeed(Base):
     __tablename__ = "rss_feeds"
+    __table_args__ = (
+        CheckConstraint("feed_type IN ('rss', 'web_scrape', 'twitter')", name="ck_rss_feeds_feed_type"),
+        Index("ix_rss_feeds_due", "last_checked_at", postgresql_where=text("is_active = true")),
+        Index("ix_rss_feeds_created_by", "created_by"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
     name: Mapped[str] = mapped_column(String, nullable=False)
     url: Mapped[str | None] = mapped_column(String, nullable=True)
     competitor_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("competitors.id"), nullable=True
     )
-    feed_type: Mapped[str] = mapped_column(String, default="rss", server_default="rss", nullable=False)
+    feed_type: Mapped[FeedType] = mapped_column(String, default="rss", server_default="rss", nullable=False)
     css_selector: Mapped[str | None] = mapped_column(Text, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    last_checked_at: Mapped[datetime | None] = mapped_column(nullable=True)
-    last_successful_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    last_checked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_successful_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     error_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_by: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(default=func.now(), nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.current_timestamp(),
+        server_onupdate=FetchedValue(),  # set by the set_updated_at() trigger
+        nullable=False,
+    )
 
     competitor = relationship("Competitor", back_populates="feeds")
     creator = relationship("User")
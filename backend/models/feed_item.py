@@ -3,8 +3,8 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, Boolean, Text, ForeignKey, UniqueConstraint, func
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import String, DateTime, Boolean, Text, ForeignKey, Index, UniqueConstraint, Computed, func, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.database import Base
@@ -12,21 +12,41 @@ from backend.database import Base
 
 class FeedItem(Base):
     __tablename__ = "feed_items"
-    __table_args__ = (UniqueConstraint("feed_id", "guid", name="uq_feed_items_feed_guid"),)
-
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        UniqueConstraint("feed_id", "guid", name="uq_feed_items_feed_guid"),
+        Index(
+            "ix_feed_items_unprocessed", "feed_id", "published_at",
+            postgresql_where=text("is_processed = false"),
+        ),
+        Index("ix_feed_items_search_tsv", "search_tsv", postgresql_using="gin"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v7()")
+    )
     feed_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("rss_feeds.id"), nullable=False)
     guid: Mapped[str] = mapped_column(String, nullable=False)
     title: Mapped[str | None] = mapped_column(String, nullable=True)
     url: Mapped[str] = mapped_column(String, nullable=False)
     author: Mapped[str | None] = mapped_column(String, nullable=True)
-    published_at: Mapped[datetime] = mapped_column(nullable=False)
+    published_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # STORAGE EXTERNAL (migration 009): stored out of line, uncompressed.
     raw_content: Mapped[str] = mapped_column(Text, nullable=False)
     raw_metadata: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     is_processed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_relevant: Mapped[bool | None] = mapped_column(Boolean, nullable=True)
     irrelevance_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(default=func.now(), nullable=False)
+    # Full-text search vector, generated by PostgreSQL; deferred so item loads skip it.
+    search_tsv: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('english', coalesce(title, '') || ' ' || coalesce(raw_content, ''))", persisted=True),
+        deferred=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False
+    )
 
     feed = relationship("RSSFeed", back_populates="items")
 
+
+Index("ix_feed_items_feed_published", FeedItem.feed_id, FeedItem.published_at.desc())
@@ -0,0 +1,65 @@
+"""Eager-load option bundles for the API serializers.
+
+AnalysisCard and Briefing relationships are ``lazy="raise"``, so every query
+whose results are serialized must say up front what it needs. Comment and
+edit queries get the same guarantee per query through ``raiseload("*")``. Building these
+options configures the mappers, which is why they live here rather than next
+to the models: by the time this module is imported, ``backend.models`` has
+registered every class.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload, undefer
+
+from backend.models.analysis_card import AnalysisCard, AnalysisCardComment, AnalysisCardEdit
+from backend.models.briefing import Briefing
+from backend.models.competitor import Competitor
+from backend.models.content_output import ContentOutput
+
+# Relationships every card response needs. The card list (CardListItem) also
+# leaves the long out-of-line text columns unread; single-card views
+# (CardResponse) add the deferred raw_llm_output.
+CARD_LOADS = (selectinload(AnalysisCard.competitors),)
+CARD_LIST_LOADS = CARD_LOADS + (
+    load_only(
+        AnalysisCard.id, AnalysisCard.feed_item_id, AnalysisCard.event_type, AnalysisCard.priority,
+        AnalysisCard.title, AnalysisCard.summary, AnalysisCard.status, AnalysisCard.approved_by,
+        AnalysisCard.approved_at, AnalysisCard.check_run_id, AnalysisCard.comments_count,
+        AnalysisCard.created_at, AnalysisCard.updated_at,
+    ),
+)
+CARD_DETAIL_LOADS = CARD_LOADS + (undefer(AnalysisCard.raw_llm_output),)
+
+# Comment and edit responses only read the author's name. Replies are
+# threaded in memory (routes/cards.py), so any other relationship access
+# would be a query per row: make it fail instead.
+COMMENT_LOADS = (joinedload(AnalysisCardComment.user), raiseload("*"))
+EDIT_LOADS = (joinedload(AnalysisCardEdit.user), raiseload("*"))
+
+# Briefing responses only render each card's title/type/priority/status, so
+# skip the large text columns. The briefing's own deferred body is needed.
+# Responses without the card list (approve-all) load just the body and rely
+# on the trigger-maintained card_count.
+BRIEFING_BODY_LOADS = (undefer(Briefing.content),)
+BRIEFING_LOADS = BRIEFING_BODY_LOADS + (
+    selectinload(Briefing.cards).load_only(
+        AnalysisCard.id, AnalysisCard.title, AnalysisCard.event_type,
+        AnalysisCard.priority, AnalysisCard.status,
+    ),
+    undefer(Briefing.raw_llm_output),
+)
+
+# Content output responses only show the competitor's name, never its profile
+# text. The list (ContentOutputListItem) also leaves the body and its sections
+# unread; raw_llm_output is deferred on the model.
+CONTENT_OUTPUT_LOADS = (joinedload(ContentOutput.competitor).load_only(Competitor.name),)
+CONTENT_OUTPUT_LIST_LOADS = CONTENT_OUTPUT_LOADS + (
+    load_only(
+        ContentOutput.id, ContentOutput.competitor_id, ContentOutput.content_type, ContentOutput.title,
+        ContentOutput.source_card_ids, ContentOutput.version, ContentOutput.status, ContentOutput.template_id,
+        ContentOutput.google_doc_id, ContentOutput.google_doc_url, ContentOutput.approved_by,
+        ContentOutput.approved_at, ContentOutput.published_at, ContentOutput.error_message,
+        ContentOutput.created_at, ContentOutput.updated_at,
+    ),
+)
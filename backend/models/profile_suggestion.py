@@ -2,22 +2,42 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
+from typing import Literal
 
-from sqlalchemy import String, Text, ForeignKey, Enum as SAEnum, func
+from sqlalchemy import String, DateTime, Text, ForeignKey, Index, CheckConstraint, func, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from backend.database import Base
 
 
+SuggestionTargetType = Literal["competitor", "augment"]
+SuggestionStatus = Literal["pending", "approved", "rejected"]
+
+
 class ProfileUpdateSuggestion(Base):
     __tablename__ = "profile_update_suggestions"
+    __table_args__ = (
+        CheckConstraint(
+            "target_type IN ('competitor', 'augment')", name="ck_profile_update_suggestions_target_type"
+        ),
+        CheckConstraint(
+            "status IN ('pending', 'approved', 'rejected')", name="ck_profile_update_suggestions_status"
+        ),
+        Index(
+            "ix_profile_update_suggestions_source_card_ids_gin", "source_card_ids",
+            postgresql_using="gin", postgresql_ops={"source_card_ids": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_profile_update_suggestions_reviewed_by", "reviewed_by",
+            postgresql_include=["reviewed_at"], postgresql_where=text("reviewed_by IS NOT NULL"),
+        ),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    target_type: Mapped[str] = mapped_column(
-        SAEnum("competitor", "augment", name="suggestion_target_type"),
-        nullable=False,
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
     )
+    target_type: Mapped[SuggestionTargetType] = mapped_column(String, nullable=False)
     competitor_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("competitors.id"), nullable=True
     )
@@ -25,18 +45,22 @@ class ProfileUpdateSuggestion(Base):
     current_value: Mapped[str] = mapped_column(Text, nullable=False)
     suggested_value: Mapped[str] = mapped_column(Text, nullable=False)
     reason: Mapped[str] = mapped_column(Text, nullable=False)
-    source_card_ids: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
-    status: Mapped[str] = mapped_column(
-        SAEnum("pending", "approved", "rejected", name="suggestion_status"),
-        default="pending",
-        nullable=False,
-    )
+    source_card_ids: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True)
+    status: Mapped[SuggestionStatus] = mapped_column(String, default="pending", nullable=False)
     reviewed_by: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=True
     )
-    reviewed_at: Mapped[datetime | None] = mapped_column(nullable=True)
-    created_at: Mapped[datetime] = mapped_column(default=func.now(), nullable=False)
+    reviewed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False
+    )
 
     competitor = relationship("Competitor")
     reviewer = relationship("User")
 
+
+Index(
+    "ix_profile_update_suggestions_pending",
+    ProfileUpdateSuggestion.created_at.desc(),
+    postgresql_where=text("status = 'pending'"),
+)
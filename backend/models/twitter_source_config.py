@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import String, Boolean, Integer, ForeignKey, func
+from sqlalchemy import String, DateTime, Boolean, Integer, ForeignKey, FetchedValue, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -13,7 +13,9 @@ from backend.database import Base
 class TwitterSourceConfig(Base):
     __tablename__ = "twitter_source_config"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()")
+    )
     feed_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("rss_feeds.id"), unique=True, nullable=False
     )
@@ -24,8 +26,15 @@ class TwitterSourceConfig(Base):
     backfill_completed: Mapped[bool] = mapped_column(Boolean, default=False, server_default="false", nullable=False)
     include_retweets: Mapped[bool] = mapped_column(Boolean, default=False, server_default="false", nullable=False)
     include_replies: Mapped[bool] = mapped_column(Boolean, default=False, server_default="false", nullable=False)
-    created_at: Mapped[datetime] = mapped_column(default=func.now(), nullable=False)
-    updated_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.current_timestamp(),
+        server_onupdate=FetchedValue(),  # set by the set_updated_at() trigger
+        nullable=False,
+    )
 
     feed: Mapped[RSSFeed] = relationship("RSSFeed", back_populates="twitter_config")
 
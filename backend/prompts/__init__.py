@@ -1 +1,57 @@
+"""Prompt templates for the Claude API calls."""
 
+from __future__ import annotations
+
+from collections.abc import Callable
+from string import Formatter
+from typing import Any
+
+
+def cached_system(text: str) -> list[dict[str, Any]]:
+    """Wrap a system prompt as one text block ending in a prompt-cache breakpoint.
+
+    Calls that share the block (e.g. every item of a feed check run) reuse the
+    cached prefix for five minutes. Prefixes shorter than the model's minimum
+    cacheable length are simply not cached.
+    """
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+def compile_template(template: str) -> Callable[..., str]:
+    """Parse a ``str.format`` template once into a keyword-only renderer.
+
+    The template is split into literal chunks and field names at import, so
+    rendering is a single join instead of re-parsing the template on every
+    call. Only plain ``{name}`` fields are supported; ``{{``/``}}`` escapes
+    behave as in ``str.format``. A template without fields renders to one
+    prebuilt string.
+    """
+    literals: list[str] = []
+    fields: list[str] = []
+    pending = ""
+    for literal, field, spec, conversion in Formatter().parse(template):
+        pending += literal
+        if field is None:
+            continue
+        if not field.isidentifier() or spec or conversion:
+            raise ValueError(f"Unsupported template field: {{{field}}}")
+        literals.append(pending)
+        fields.append(field)
+        pending = ""
+    tail = pending
+
+    if not fields:
+        def render_static(**values: object) -> str:
+            return tail
+
+        return render_static
+
+    def render(**values: object) -> str:
+        parts: list[str] = []
+        for literal, field in zip(literals, fields):
+            parts.append(literal)
+            parts.append(str(values[field]))
+        parts.append(tail)
+        return "".join(parts)
+
+    return render
@@ -1,5 +1,9 @@
 """Prompt template for generating morning briefings."""
 
+from functools import lru_cache
+
+from backend.prompts import compile_template
+
 BRIEFING_SYSTEM_PROMPT = """You are a competitive intelligence analyst preparing a morning briefing for \
 Augment Code's GTM team — Account Executives, Sales Engineers, and leadership. \
 Synthesize the following intelligence items into a cohesive strategic briefing."""
@@ -37,6 +41,13 @@ A brief summary of each analysis card included in this briefing, grouped by comp
 Respond in Markdown format only. Do not wrap in code fences."""
 
 
+# Only the cards change between briefings on the same profiles, so the text
+# before them is rendered once per profile context and the rest is constant.
+_briefing_head, _briefing_tail = BRIEFING_USER_PROMPT.split("{analysis_cards_json}")
+_render_briefing_head = compile_template(_briefing_head)
+_BRIEFING_TAIL = compile_template(_briefing_tail)()
+
+
 def build_briefing_prompt(
     augment_profile: str,
     competitor_profiles: str,
@@ -46,9 +57,13 @@ def build_briefing_prompt(
 
     Returns (system_prompt, user_prompt) tuple for Claude API call.
     """
-    user_prompt = BRIEFING_USER_PROMPT.format(
-        augment_profile=augment_profile,
-        competitor_profiles=competitor_profiles,
-        analysis_cards_json=analysis_cards_json,
-    )
+    user_prompt = "".join((
+        _briefing_prefix(augment_profile, competitor_profiles), analysis_cards_json, _BRIEFING_TAIL,
+    ))
     return BRIEFING_SYSTEM_PROMPT, user_prompt
+
+
+@lru_cache(maxsize=1)
+def _briefing_prefix(augment_profile: str, competitor_profiles: str) -> str:
+    """Render everything before the cards once per profile context."""
+    return _render_briefing_head(augment_profile=augment_profile, competitor_profiles=competitor_profiles)
@@ -1,5 +1,12 @@
 """Prompt template for evaluating individual RSS feed items."""
 
+from functools import lru_cache
+from typing import Any
+
+from backend.prompts import cached_system, compile_template
+
+# Identical for every item in a run (the profiles change only on edits), so it
+# is sent as a cached system prefix; only the item itself varies per call.
 FEED_EVALUATION_SYSTEM = """You are a competitive intelligence analyst for Augment Code, an AI-powered \
 coding tool company. Your job is to evaluate news items and determine their competitive \
 relevance.
@@ -8,13 +15,7 @@ Context:
 - Augment Profile: {augment_profile}
 - Known Competitors: {competitor_list_with_profiles}
 
-Evaluate the following RSS feed item and respond in JSON format.
-
-Feed Source: {feed_name}
-Title: {item_title}
-Content: {item_content}
-URL: {item_url}
-Published: {item_published_at}
+Evaluate the RSS feed item in the user message and respond in JSON format.
 
 Respond with JSON:
 {{
@@ -36,6 +37,16 @@ Priority Guide:
 
 IMPORTANT: Respond ONLY with valid JSON. No markdown, no code fences, no explanation outside the JSON."""
 
+FEED_EVALUATION_ITEM = """Feed Source: {feed_name}
+Title: {item_title}
+Content: {item_content}
+URL: {item_url}
+Published: {item_published_at}"""
+
+
+_render_feed_evaluation_system = compile_template(FEED_EVALUATION_SYSTEM)
+_render_feed_evaluation_item = compile_template(FEED_EVALUATION_ITEM)
+
 
 def build_feed_evaluation_prompt(
     augment_profile: str,
@@ -45,14 +56,29 @@ def build_feed_evaluation_prompt(
     item_content: str,
     item_url: str,
     item_published_at: str,
-) -> str:
-    """Build the feed evaluation prompt with all context filled in."""
-    return FEED_EVALUATION_SYSTEM.format(
-        augment_profile=augment_profile,
-        competitor_list_with_profiles=competitor_list_with_profiles,
+) -> tuple[list[dict[str, Any]], str]:
+    """Build the feed evaluation prompt with all context filled in.
+
+    Returns (system_blocks, user_prompt): the cached instructions and profile
+    context, and the item to evaluate.
+    """
+    user_prompt = _render_feed_evaluation_item(
         feed_name=feed_name,
         item_title=item_title,
         item_content=item_content,
         item_url=item_url,
         item_published_at=item_published_at,
     )
+    return _feed_evaluation_system(augment_profile, competitor_list_with_profiles), user_prompt
+
+
+@lru_cache(maxsize=1)
+def _feed_evaluation_system(augment_profile: str, competitor_list_with_profiles: str) -> list[dict[str, Any]]:
+    """Render the system block once per run; every item shares the same profiles.
+
+    Callers must not mutate the returned blocks.
+    """
+    return cached_system(_render_feed_evaluation_system(
+        augment_profile=augment_profile,
+        competitor_list_with_profiles=competitor_list_with_profiles,
+    ))
@@ -1,5 +1,7 @@
 """Prompt templates for weekly profile review."""
 
+from backend.prompts import compile_template
+
 PROFILE_REVIEW_SYSTEM = """\
 You are a competitive intelligence analyst reviewing profiles for accuracy and completeness.
 Based on recent approved analysis cards, identify any profile fields that should be updated.
@@ -41,13 +43,16 @@ Respond with JSON:
 }}"""
 
 
+_render_profile_review_user = compile_template(PROFILE_REVIEW_USER)
+
+
 def build_profile_review_messages(
     target_name: str,
     target_profile: str,
     relevant_cards: str,
 ) -> list[dict[str, str]]:
     """Build the profile review messages for Claude API (system + user)."""
-    user_content = PROFILE_REVIEW_USER.format(
+    user_content = _render_profile_review_user(
         target_name=target_name,
         target_profile=target_profile,
         relevant_cards=relevant_cards,
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from backend.database import get_db
-from backend.models.augment_profile import AugmentProfile
+from backend.models.augment_profile import AUGMENT_PROFILE_ID, AugmentProfile
+from backend.utils import UtcDatetime
 
 router = APIRouter()
 
@@ -17,34 +18,19 @@ router = APIRouter()
 # --- Pydantic schemas ---
 
 class AugmentProfileResponse(BaseModel):
-    id: str
+    id: uuid.UUID
     company_description: str
     key_differentiators: str
     target_customer_segments: str
     product_capabilities: str
     strategic_priorities: str
     pricing: str
-    updated_by: str
-    created_at: datetime
-    updated_at: datetime
+    updated_by: uuid.UUID
+    created_at: UtcDatetime
+    updated_at: UtcDatetime
 
     model_config = {"from_attributes": True}
 
-    @classmethod
-    def from_orm_model(cls, obj: AugmentProfile) -> "AugmentProfileResponse":
-        return cls(
-            id=str(obj.id),
-            company_description=obj.company_description,
-            key_differentiators=obj.key_differentiators,
-            target_customer_segments=obj.target_customer_segments,
-            product_capabilities=obj.product_capabilities,
-            strategic_priorities=obj.strategic_priorities,
-            pricing=obj.pricing,
-            updated_by=str(obj.updated_by),
-            created_at=obj.created_at,
-            updated_at=obj.updated_at,
-        )
-
 
 class AugmentProfileUpdate(BaseModel):
     company_description: Optional[str] = None
@@ -55,15 +41,23 @@ class AugmentProfileUpdate(BaseModel):
     pricing: Optional[str] = None
 
 
-# --- Routes ---
+# --- Helpers ---
 
-@router.get("", response_model=AugmentProfileResponse)
-def get_augment_profile(db: Session = Depends(get_db)):
-    """Get the Augment company profile (single-row table)."""
-    profile = db.query(AugmentProfile).first()
-    if not profile:
-        # Create a default empty profile if none exists
-        profile = AugmentProfile(
+def _get_or_create_profile(db: Session) -> AugmentProfile:
+    """Return the singleton profile, creating an empty one on first use.
+
+    The common case is one primary-key lookup. On a miss, a single
+    INSERT ... ON CONFLICT DO NOTHING RETURNING creates the row; if a
+    concurrent request won that race, the lookup is repeated.
+    """
+    profile = db.get(AugmentProfile, AUGMENT_PROFILE_ID)
+    if profile is not None:
+        return profile
+
+    stmt = (
+        pg_insert(AugmentProfile)
+        .values(
+            id=AUGMENT_PROFILE_ID,
             company_description="",
             key_differentiators="",
             target_customer_segments="",
@@ -72,10 +66,20 @@ def get_augment_profile(db: Session = Depends(get_db)):
             pricing="",
             updated_by=uuid.UUID("00000000-0000-0000-0000-000000000000"),
         )
-        db.add(profile)
-        db.commit()
-        db.refresh(profile)
-    return AugmentProfileResponse.from_orm_model(profile)
+        .on_conflict_do_nothing(index_elements=["id"])
+        .returning(AugmentProfile)
+    )
+    profile = db.scalars(stmt).one_or_none()
+    db.commit()
+    return profile if profile is not None else db.get(AugmentProfile, AUGMENT_PROFILE_ID)
+
+
+# --- Routes ---
+
+@router.get("", response_model=AugmentProfileResponse)
+def get_augment_profile(db: Session = Depends(get_db)):
+    """Get the Augment company profile (single-row table)."""
+    return _get_or_create_profile(db)
 
 
 @router.put("", response_model=AugmentProfileResponse)
@@ -84,27 +88,16 @@ def update_augment_profile(
     db: Session = Depends(get_db),
 ):
     """Update the Augment company profile."""
-    profile = db.query(AugmentProfile).first()
-    if not profile:
-        # Create if not exists
-        profile = AugmentProfile(
-            company_description="",
-            key_differentiators="",
-            target_customer_segments="",
-            product_capabilities="",
-            strategic_priorities="",
-            pricing="",
-            updated_by=uuid.UUID("00000000-0000-0000-0000-000000000000"),
-        )
-        db.add(profile)
-        db.commit()
-        db.refresh(profile)
+    profile = _get_or_create_profile(db)
 
     update_data = update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(profile, field, value)
 
     # TODO: Set updated_by from authenticated user when auth is implemented
+    # The UPDATE returns the trigger-set updated_at (eager_defaults), so the
+    # profile is complete: serialize it before commit expires it.
+    db.flush()
+    result = AugmentProfileResponse.model_validate(profile)
     db.commit()
-    db.refresh(profile)
-    return AugmentProfileResponse.from_orm_model(profile)
+    return result
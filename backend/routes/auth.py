@@ -3,27 +3,46 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from backend.cache import user_cache
+from backend.config import settings
 from backend.database import get_db
 from backend.models.user import User
 from backend.services.auth_service import (
     oauth,
     validate_domain,
     get_or_create_user,
+    get_user_cached,
     user_to_dict,
 )
 
 router = APIRouter()
 
 
+class UserResponse(BaseModel):
+    id: str
+    email: str
+    name: str
+    role: str
+    google_id: str | None = None
+    created_at: str | None = None
+    updated_at: str | None = None
+
+
+class LogoutResponse(BaseModel):
+    ok: bool
+
+
 def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
     """Dependency: extract current user from session or raise 401."""
     user_id = request.session.get("user_id")
     if not user_id:
         raise HTTPException(status_code=401, detail="Not authenticated")
-    user = db.query(User).filter(User.id == user_id).first()
+    user = get_user_cached(db, user_id)
     if user is None:
         # Session references a deleted user — clear it
         request.session.clear()
@@ -31,7 +50,20 @@ def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
     return user
 
 
-@router.get("/google")
+def reload_user(db: Session, user: User) -> User:
+    """Re-read the signed-in user's row, bypassing user_cache, or raise 401.
+
+    user_cache is per worker, so a role change or deletion made through
+    another worker can take up to USER_CACHE_TTL to reach it. Admin checks
+    (and code that needs the OAuth tokens) use the row instead.
+    """
+    fresh = db.get(User, user.id)
+    if fresh is None:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return fresh
+
+
+@router.get("/google", response_class=RedirectResponse)
 async def google_login(request: Request):
     """Initiate Google SSO — redirect user to Google consent screen."""
     redirect_uri = request.url_for("google_callback")
@@ -42,7 +74,7 @@ async def google_login(request: Request):
     return await oauth.google.authorize_redirect(request, redirect_uri)
 
 
-@router.get("/google/callback")
+@router.get("/google/callback", response_class=RedirectResponse)
 async def google_callback(request: Request, db: Session = Depends(get_db)):
     """Handle Google SSO callback — validate domain, create/get user, set session."""
     token = await oauth.google.authorize_access_token(request)
@@ -54,12 +86,23 @@ async def google_callback(request: Request, db: Session = Depends(get_db)):
     if not validate_domain(email):
         raise HTTPException(
             status_code=403,
-            detail=f"Only @{__import__('backend.config', fromlist=['settings']).settings.ALLOWED_DOMAIN} emails are allowed",
+            detail=f"Only @{settings.ALLOWED_DOMAIN} emails are allowed",
         )
 
     google_id = user_info["sub"]
     name = user_info.get("name", email.split("@")[0])
 
+    # The ORM session is blocking; keep it off the event loop.
+    user_id = await run_in_threadpool(_store_login, db, token, google_id, email, name)
+
+    # Store user ID in session
+    request.session["user_id"] = user_id
+
+    return RedirectResponse(url="/", status_code=302)
+
+
+def _store_login(db: Session, token: dict, google_id: str, email: str, name: str) -> str:
+    """Create/update the user and save their OAuth tokens. Returns the user ID."""
     user = get_or_create_user(db, google_id=google_id, email=email, name=name)
 
     # Store OAuth tokens for Google Docs integration
@@ -71,21 +114,20 @@ async def google_callback(request: Request, db: Session = Depends(get_db)):
         user.google_access_token = access_token
     if refresh_token or access_token:
         db.commit()
+    return str(user.id)
 
-    # Store user ID in session
-    request.session["user_id"] = str(user.id)
 
-    return RedirectResponse(url="/", status_code=302)
-
-
-@router.post("/logout")
+@router.post("/logout", response_model=LogoutResponse)
 async def logout(request: Request):
     """Clear the session."""
+    user_id = request.session.get("user_id")
+    if user_id:
+        user_cache.pop(user_id)
     request.session.clear()
     return {"ok": True}
 
 
-@router.get("/me")
+@router.get("/me", response_model=UserResponse)
 async def me(current_user: User = Depends(get_current_user)):
     """Return the currently authenticated user."""
     return user_to_dict(current_user)
@@ -1,19 +1,29 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import date, datetime, timezone
+from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
 
-from backend.database import get_db
+from backend.cache import briefing_cache
+from backend.database import get_db, update_returning
 from backend.models.analysis_card import AnalysisCard
-from backend.models.briefing import Briefing
+from backend.models.briefing import Briefing, BriefingCard, BriefingStatus
+from backend.models.loaders import BRIEFING_BODY_LOADS, BRIEFING_LOADS
 from backend.models.user import User
-from backend.routes.auth import get_current_user
-from backend.utils import utc_isoformat
+from backend.routes.auth import get_current_user, reload_user
+from backend.services.briefing_generator import (
+    analysis_pending,
+    claim_generation,
+    generate_briefing_task,
+    generation_failed,
+    has_recent_cards,
+)
+from backend.utils import UtcDatetime, decode_cursor, encode_cursor, utc_isoformat
 
 router = APIRouter()
 
@@ -23,33 +33,48 @@ router = APIRouter()
 # ---------------------------------------------------------------------------
 
 class CardBrief(BaseModel):
-    id: str
+    id: uuid.UUID
     title: str
     event_type: str
     priority: str
     status: str
 
+    model_config = {"from_attributes": True}
+
 
 class BriefingResponse(BaseModel):
-    id: str
-    date: str
+    id: uuid.UUID
+    date: date
     content: str
     raw_llm_output: Optional[dict] = None
     status: str
-    approved_by: Optional[str] = None
-    approved_at: Optional[str] = None
+    approved_by: Optional[uuid.UUID] = None
+    approved_at: Optional[UtcDatetime] = None
     cards: list[CardBrief] = []
-    created_at: str
-    updated_at: str
+    created_at: UtcDatetime
+    updated_at: UtcDatetime
+
+    model_config = {"from_attributes": True}
 
 
 class BriefingListItem(BaseModel):
-    id: str
-    date: str
+    id: uuid.UUID
+    date: date
     status: str
     card_count: int
-    created_at: str
-    updated_at: str
+    created_at: UtcDatetime
+    updated_at: UtcDatetime
+
+    model_config = {"from_attributes": True}
+
+
+class BriefingGenerateResponse(BaseModel):
+    # "pending" while generating, "complete" once today's briefing exists,
+    # "no_cards" if there are no recent cards to brief on, "failed" if the
+    # last attempt failed and the retry cooldown has not passed yet
+    status: Literal["pending", "complete", "no_cards", "failed"]
+    date: date
+    briefing_id: Optional[uuid.UUID] = None
 
 
 class BriefingUpdate(BaseModel):
@@ -57,7 +82,7 @@ class BriefingUpdate(BaseModel):
 
 
 class StatusUpdate(BaseModel):
-    status: str
+    status: BriefingStatus
 
 
 class BulkApproveResponse(BaseModel):
@@ -75,56 +100,12 @@ class BulkApproveResponse(BaseModel):
 # Helpers
 # ---------------------------------------------------------------------------
 
-VALID_STATUSES = {"draft", "in_review", "approved", "archived"}
-
-
-def _briefing_to_list_item(briefing: Briefing) -> dict:
-    """Serialize a Briefing to a list-item dict."""
-    card_count = len(briefing.cards) if briefing.cards else 0
-    return {
-        "id": str(briefing.id),
-        "date": briefing.date.isoformat() if briefing.date else None,
-        "status": briefing.status,
-        "card_count": card_count,
-        "created_at": utc_isoformat(briefing.created_at),
-        "updated_at": utc_isoformat(briefing.updated_at),
-    }
-
-
-def _briefing_to_response(briefing: Briefing) -> dict:
-    """Serialize a Briefing to a full response dict with linked cards."""
-    cards = []
-    if briefing.cards:
-        cards = [
-            {
-                "id": str(c.id),
-                "title": c.title,
-                "event_type": c.event_type,
-                "priority": c.priority,
-                "status": c.status,
-            }
-            for c in briefing.cards
-        ]
-    return {
-        "id": str(briefing.id),
-        "date": briefing.date.isoformat() if briefing.date else None,
-        "content": briefing.content,
-        "raw_llm_output": briefing.raw_llm_output,
-        "status": briefing.status,
-        "approved_by": str(briefing.approved_by) if briefing.approved_by else None,
-        "approved_at": utc_isoformat(briefing.approved_at),
-        "cards": cards,
-        "created_at": utc_isoformat(briefing.created_at),
-        "updated_at": utc_isoformat(briefing.updated_at),
-    }
-
-
-def _get_briefing_or_404(briefing_id: str, db: Session) -> Briefing:
+def _get_briefing_or_404(briefing_id: uuid.UUID, db: Session, loads=BRIEFING_LOADS) -> Briefing:
     """Fetch a briefing by ID or raise 404."""
     briefing = (
         db.query(Briefing)
-        .options(joinedload(Briefing.cards))
-        .filter(Briefing.id == uuid.UUID(briefing_id))
+        .options(*loads)
+        .filter(Briefing.id == briefing_id)
         .first()
     )
     if not briefing:
@@ -138,38 +119,97 @@ def _get_briefing_or_404(briefing_id: str, db: Session) -> Briefing:
 
 @router.get("", response_model=list[BriefingListItem])
 def list_briefings(
-    status: Optional[str] = None,
+    response: Response,
+    status: Optional[BriefingStatus] = None,
+    limit: Optional[int] = Query(None, ge=1, le=200, description="Page size; omit for every briefing"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
     db: Session = Depends(get_db),
 ):
-    """List briefings, most recent first. Optionally filter by status."""
-    query = db.query(Briefing).options(joinedload(Briefing.cards))
-
-    if status:
-        if status not in VALID_STATUSES:
-            raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
-        query = query.filter(Briefing.status == status)
-
-    briefings = query.order_by(Briefing.date.desc()).all()
-    # Deduplicate due to joinedload
-    seen = set()
-    unique = []
-    for b in briefings:
-        if b.id not in seen:
-            seen.add(b.id)
-            unique.append(b)
-    return [_briefing_to_list_item(b) for b in unique]
+    """List briefings, most recent first. Optionally filter by status.
+
+    With ``limit``, returns one page and, if more remain, the cursor for the
+    next page in the X-Next-Cursor header (keyset on the unique date).
+    """
+    cache_key = f"list:{status or ''}:{limit or ''}:{cursor or ''}"
+    result = briefing_cache.get(cache_key)
+    if result is None:
+        # card_count is a trigger-maintained column, so the cards are not loaded
+        query = db.query(Briefing)
+        if status:
+            query = query.filter(Briefing.status == status)
+        if cursor:
+            try:
+                (before,) = decode_cursor(cursor, 1)
+                query = query.filter(Briefing.date < date.fromisoformat(before))
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+
+        query = query.order_by(Briefing.date.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        result = [BriefingListItem.model_validate(b) for b in query.all()]
+        briefing_cache.set(cache_key, result)
+
+    if limit is not None and len(result) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(result[-1].date.isoformat())
+    return result
+
+
+@router.post("/generate", response_model=BriefingGenerateResponse, status_code=202)
+def generate_briefing(
+    response: Response,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Queue generation of today's briefing and return immediately.
+
+    The Claude call takes tens of seconds, so it runs as a background task
+    instead of holding the request. Repeat the POST to poll: it answers 202
+    "pending" while the generation runs (without queuing another), and 200
+    "complete" with the id once the briefing exists. With no recent cards
+    nothing is queued and the answer is 200 "no_cards". After a failed
+    generation the answer is 200 "failed" until the retry cooldown passes,
+    so polling clients stop instead of queuing fresh Claude calls. While a
+    card-analysis batch is still out the answer is 202 "pending" without
+    queuing, so the briefing waits for that batch's cards.
+    """
+    today = datetime.now(timezone.utc).date()
+    existing_id = db.query(Briefing.id).filter(Briefing.date == today).scalar()
+    if existing_id is not None:
+        response.status_code = 200
+        return BriefingGenerateResponse(status="complete", date=today, briefing_id=existing_id)
+
+    if not has_recent_cards(db):
+        response.status_code = 200
+        return BriefingGenerateResponse(status="no_cards", date=today)
+
+    if generation_failed(today):
+        response.status_code = 200
+        return BriefingGenerateResponse(status="failed", date=today)
+
+    if not analysis_pending(db) and claim_generation(today):
+        background_tasks.add_task(generate_briefing_task, today)
+    return BriefingGenerateResponse(status="pending", date=today)
 
 
 @router.get("/{briefing_id}", response_model=BriefingResponse)
-def get_briefing(briefing_id: str, db: Session = Depends(get_db)):
+def get_briefing(briefing_id: uuid.UUID, db: Session = Depends(get_db)):
     """Get a single briefing with linked analysis cards."""
+    cache_key = f"detail:{briefing_id}"
+    cached = briefing_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     briefing = _get_briefing_or_404(briefing_id, db)
-    return _briefing_to_response(briefing)
+    result = BriefingResponse.model_validate(briefing)
+    briefing_cache.set(cache_key, result)
+    return result
 
 
 @router.put("/{briefing_id}", response_model=BriefingResponse)
 def update_briefing(
-    briefing_id: str,
+    briefing_id: uuid.UUID,
     body: BriefingUpdate,
     db: Session = Depends(get_db),
 ):
@@ -180,91 +220,70 @@ def update_briefing(
     if "content" in update_data:
         briefing.content = update_data["content"]
 
+    # The UPDATE returns the trigger-set updated_at (eager_defaults), so the
+    # loaded briefing is complete: serialize it before commit expires it.
+    db.flush()
+    result = BriefingResponse.model_validate(briefing)
     db.commit()
-    db.refresh(briefing)
-
-    # Re-load with cards
-    briefing = (
-        db.query(Briefing)
-        .options(joinedload(Briefing.cards))
-        .filter(Briefing.id == briefing.id)
-        .first()
-    )
-    return _briefing_to_response(briefing)
+    return result
 
 
 @router.post("/{briefing_id}/status", response_model=BriefingResponse)
 def update_briefing_status(
-    briefing_id: str,
+    briefing_id: uuid.UUID,
     body: StatusUpdate,
     db: Session = Depends(get_db),
 ):
     """Change the status of a briefing (draft → in_review → approved → archived)."""
-    if body.status not in VALID_STATUSES:
-        raise HTTPException(status_code=400, detail=f"Invalid status: {body.status}")
-
     briefing = _get_briefing_or_404(briefing_id, db)
-    briefing.status = body.status
 
     # If approving, record the timestamp (no auth enforcement yet per task spec)
+    values = {"status": body.status}
     if body.status == "approved":
-        briefing.approved_at = datetime.now(timezone.utc)
+        values["approved_at"] = func.now()
 
+    update_returning(db, briefing, **values)
+    result = BriefingResponse.model_validate(briefing)
     db.commit()
-    db.refresh(briefing)
-
-    # Re-load with cards
-    briefing = (
-        db.query(Briefing)
-        .options(joinedload(Briefing.cards))
-        .filter(Briefing.id == briefing.id)
-        .first()
-    )
-    return _briefing_to_response(briefing)
-
+    return result
 
 
 @router.post("/{briefing_id}/approve-all", response_model=BulkApproveResponse)
 def approve_all_briefing_cards(
-    briefing_id: str,
+    briefing_id: uuid.UUID,
     request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Approve all linked cards and the briefing itself in one request. Admin-only."""
+    current_user = reload_user(db, current_user)
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Only admin users can approve briefings")
 
-    briefing = _get_briefing_or_404(briefing_id, db)
-
-    now = datetime.now(timezone.utc)
+    briefing = _get_briefing_or_404(briefing_id, db, loads=BRIEFING_BODY_LOADS)
 
-    # Approve all linked cards
+    # now() is the transaction start time, so the cards and the briefing
+    # share one approval timestamp.
+    # Approve all linked cards in one UPDATE, without loading them first
     cards_approved = 0
-    if briefing.cards:
-        card_ids = [c.id for c in briefing.cards]
+    if briefing.card_count:
+        linked_card_ids = select(BriefingCard.analysis_card_id).where(BriefingCard.briefing_id == briefing.id)
         cards_approved = (
             db.query(AnalysisCard)
-            .filter(AnalysisCard.id.in_(card_ids))
+            .filter(AnalysisCard.id.in_(linked_card_ids))
             .update(
                 {
                     AnalysisCard.status: "approved",
                     AnalysisCard.approved_by: current_user.id,
-                    AnalysisCard.approved_at: now,
+                    AnalysisCard.approved_at: func.now(),
                 },
-                synchronize_session="fetch",
+                synchronize_session=False,
             )
         )
 
     # Approve the briefing itself
-    briefing.status = "approved"
-    briefing.approved_by = current_user.id
-    briefing.approved_at = now
-
-    db.commit()
-    db.refresh(briefing)
-
-    return {
+    update_returning(db, briefing, status="approved", approved_by=current_user.id, approved_at=func.now())
+    result = {
         "id": str(briefing.id),
         "date": briefing.date.isoformat() if briefing.date else None,
         "content": briefing.content,
@@ -273,4 +292,6 @@ def approve_all_briefing_cards(
         "cards_approved": cards_approved,
         "created_at": utc_isoformat(briefing.created_at),
         "updated_at": utc_isoformat(briefing.updated_at),
-    }
\ No newline at end of file
+    }
+    db.commit()
+    return result
\ No newline at end of file
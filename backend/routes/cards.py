@@ -1,23 +1,33 @@
 from __future__ import annotations
 
+import hashlib
 import uuid
-from datetime import datetime, timezone
+from collections import defaultdict
+from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from pydantic import BaseModel
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import AliasPath, BaseModel, Field
+from sqlalchemy import func, insert, select, tuple_
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.orm.attributes import set_committed_value
 
-from backend.database import get_db
+from backend.database import get_db, update_returning
 from backend.models.analysis_card import (
     AnalysisCard,
     AnalysisCardComment,
     AnalysisCardCompetitor,
     AnalysisCardEdit,
+    CardStatus,
+    EventType,
+    Priority,
 )
+from backend.models.competitor import Competitor
+from backend.models.feed_item import FeedItem
+from backend.models.loaders import CARD_DETAIL_LOADS, CARD_LIST_LOADS, CARD_LOADS, COMMENT_LOADS, EDIT_LOADS
 from backend.models.user import User
-from backend.routes.auth import get_current_user
-from backend.utils import utc_isoformat
+from backend.routes.auth import get_current_user, reload_user
+from backend.utils import UtcDatetime, decode_cursor, encode_cursor
 
 router = APIRouter()
 
@@ -27,43 +37,59 @@ router = APIRouter()
 # ---------------------------------------------------------------------------
 
 class CompetitorBrief(BaseModel):
-    id: str
+    id: uuid.UUID
     name: str
 
+    model_config = {"from_attributes": True}
 
-class CardResponse(BaseModel):
-    id: str
-    feed_item_id: Optional[str]
+
+class CardListItem(BaseModel):
+    """A card as listed; validated straight from the ORM row by pydantic-core.
+
+    Only the columns CARD_LIST_LOADS reads: the long analysis text and raw
+    model output are for single-card views.
+    """
+
+    id: uuid.UUID
+    feed_item_id: Optional[uuid.UUID]
     event_type: str
     priority: str
     title: str
     summary: str
+    status: str
+    approved_by: Optional[uuid.UUID] = None
+    approved_at: Optional[UtcDatetime] = None
+    check_run_id: Optional[uuid.UUID] = None
+    competitors: list[CompetitorBrief] = []
+    comments_count: int = 0
+    created_at: UtcDatetime
+    updated_at: UtcDatetime
+
+    model_config = {"from_attributes": True}
+
+
+class CardResponse(CardListItem):
+    """Single-card views add the full analysis and the deferred raw model output."""
+
     impact_assessment: str
     suggested_counter_moves: str
     raw_llm_output: Optional[dict] = None
-    status: str
-    approved_by: Optional[str] = None
-    approved_at: Optional[str] = None
-    check_run_id: Optional[str] = None
-    competitors: list[CompetitorBrief] = []
-    created_at: str
-    updated_at: str
 
 
 class CardUpdate(BaseModel):
     title: Optional[str] = None
     summary: Optional[str] = None
-    event_type: Optional[str] = None
-    priority: Optional[str] = None
+    event_type: Optional[EventType] = None
+    priority: Optional[Priority] = None
 
 
 class StatusUpdate(BaseModel):
-    status: str
+    status: CardStatus
 
 
 class CommentCreate(BaseModel):
     content: str
-    parent_comment_id: Optional[str] = None
+    parent_comment_id: Optional[uuid.UUID] = None
 
 
 class CommentUpdate(BaseModel):
@@ -71,110 +97,47 @@ class CommentUpdate(BaseModel):
 
 
 class CommentResponse(BaseModel):
-    id: str
-    analysis_card_id: str
-    user_id: str
-    user_name: str
+    id: uuid.UUID
+    analysis_card_id: uuid.UUID
+    user_id: uuid.UUID
+    user_name: str = Field("Unknown", validation_alias=AliasPath("user", "name"))
     content: str
-    parent_comment_id: Optional[str] = None
+    parent_comment_id: Optional[uuid.UUID] = None
     resolved: bool
-    created_at: str
-    updated_at: str
+    created_at: UtcDatetime
+    updated_at: UtcDatetime
     replies: list["CommentResponse"] = []
 
+    model_config = {"from_attributes": True}
+
 
 class EditResponse(BaseModel):
-    id: str
-    analysis_card_id: str
-    user_id: str
-    user_name: str
+    id: uuid.UUID
+    analysis_card_id: uuid.UUID
+    user_id: uuid.UUID
+    user_name: str = Field("Unknown", validation_alias=AliasPath("user", "name"))
     field_changed: str
     previous_value: str
     new_value: str
-    created_at: str
+    created_at: UtcDatetime
+
+    model_config = {"from_attributes": True}
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _card_to_response(card: AnalysisCard) -> dict:
-    """Serialize an AnalysisCard to a dict matching CardResponse."""
-    competitors = []
-    if card.competitors:
-        competitors = [{"id": str(c.id), "name": c.name} for c in card.competitors]
-    return {
-        "id": str(card.id),
-        "feed_item_id": str(card.feed_item_id) if card.feed_item_id else None,
-        "event_type": card.event_type,
-        "priority": card.priority,
-        "title": card.title,
-        "summary": card.summary,
-        "impact_assessment": card.impact_assessment,
-        "suggested_counter_moves": card.suggested_counter_moves,
-        "raw_llm_output": card.raw_llm_output,
-        "status": card.status,
-        "approved_by": str(card.approved_by) if card.approved_by else None,
-        "approved_at": utc_isoformat(card.approved_at),
-        "check_run_id": str(card.check_run_id) if card.check_run_id else None,
-        "competitors": competitors,
-        "created_at": utc_isoformat(card.created_at),
-        "updated_at": utc_isoformat(card.updated_at),
-    }
-
-
-VALID_STATUSES = {"draft", "in_review", "approved", "archived"}
-VALID_PRIORITIES = {"red", "yellow", "green"}
-VALID_EVENT_TYPES = {
-    "new_feature", "product_announcement", "partnership", "acquisition",
-    "acquired", "funding", "pricing_change", "leadership_change", "expansion", "other",
-}
-
 # Fields that are tracked for edit history
 TRACKED_FIELDS = {"title", "summary", "event_type", "priority"}
 
 
-def _comment_to_response(comment: AnalysisCardComment) -> dict:
-    """Serialize a comment to a dict matching CommentResponse."""
-    user_name = comment.user.name if comment.user else "Unknown"
-    replies = []
-    if comment.replies:
-        replies = [_comment_to_response(r) for r in comment.replies]
-    return {
-        "id": str(comment.id),
-        "analysis_card_id": str(comment.analysis_card_id),
-        "user_id": str(comment.user_id),
-        "user_name": user_name,
-        "content": comment.content,
-        "parent_comment_id": str(comment.parent_comment_id) if comment.parent_comment_id else None,
-        "resolved": comment.resolved,
-        "created_at": utc_isoformat(comment.created_at),
-        "updated_at": utc_isoformat(comment.updated_at),
-        "replies": replies,
-    }
-
-
-def _edit_to_response(edit: AnalysisCardEdit) -> dict:
-    """Serialize an edit to a dict matching EditResponse."""
-    user_name = edit.user.name if edit.user else "Unknown"
-    return {
-        "id": str(edit.id),
-        "analysis_card_id": str(edit.analysis_card_id),
-        "user_id": str(edit.user_id),
-        "user_name": user_name,
-        "field_changed": edit.field_changed,
-        "previous_value": edit.previous_value,
-        "new_value": edit.new_value,
-        "created_at": utc_isoformat(edit.created_at),
-    }
-
-
-def _get_card_or_404(card_id: str, db: Session) -> AnalysisCard:
-    """Fetch a card by ID or raise 404."""
+def _get_card_or_404(card_id: uuid.UUID, db: Session, loads: tuple = CARD_LOADS) -> AnalysisCard:
+    """Fetch a card by ID (eager-loading ``loads``) or raise 404."""
     card = (
         db.query(AnalysisCard)
-        .options(joinedload(AnalysisCard.competitors))
-        .filter(AnalysisCard.id == uuid.UUID(card_id))
+        .options(*loads)
+        .filter(AnalysisCard.id == card_id)
         .first()
     )
     if not card:
@@ -182,30 +145,88 @@ def _get_card_or_404(card_id: str, db: Session) -> AnalysisCard:
     return card
 
 
+def _require_card(card_id: uuid.UUID, db: Session) -> None:
+    """Raise 404 unless the card exists; reads only the primary key."""
+    if db.query(AnalysisCard.id).filter(AnalysisCard.id == card_id).scalar() is None:
+        raise HTTPException(status_code=404, detail="Card not found")
+
+
+# List items embed competitor names, and renaming a competitor (or linking
+# one) does not touch the card's updated_at, so the list ETag also covers
+# each card's linked competitors.
+_CARD_COMPETITORS_UPDATED = (
+    select(func.max(Competitor.updated_at))
+    .join(AnalysisCardCompetitor, AnalysisCardCompetitor.competitor_id == Competitor.id)
+    .where(AnalysisCardCompetitor.analysis_card_id == AnalysisCard.id)
+    .correlate(AnalysisCard)
+    .scalar_subquery()
+)
+_CARD_COMPETITORS_COUNT = (
+    select(func.count())
+    .select_from(AnalysisCardCompetitor)
+    .where(AnalysisCardCompetitor.analysis_card_id == AnalysisCard.id)
+    .correlate(AnalysisCard)
+    .scalar_subquery()
+)
+_CARD_LIST_VERSION_COLUMNS = (
+    AnalysisCard.id, AnalysisCard.updated_at, _CARD_COMPETITORS_UPDATED, _CARD_COMPETITORS_COUNT,
+)
+
+
+def _list_etag(versions: list[tuple]) -> str:
+    """Weak ETag for a list of rows, from each row's version columns."""
+    digest = hashlib.sha256()
+    for row in versions:
+        digest.update(("|".join(map(str, row)) + ";").encode())
+    return f'W/"{digest.hexdigest()[:32]}"'
+
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
 
-@router.get("", response_model=list[CardResponse])
+@router.get("", response_model=list[CardListItem])
 def list_cards(
-    status: Optional[str] = Query(None),
-    priority: Optional[str] = Query(None),
-    competitor_id: Optional[str] = Query(None),
+    request: Request,
+    response: Response,
+    status: Optional[CardStatus] = Query(None),
+    priority: Optional[Priority] = Query(None),
+    competitor_id: Optional[uuid.UUID] = Query(None),
     date_from: Optional[str] = Query(None),
     date_to: Optional[str] = Query(None),
+    q: Optional[str] = Query(None, description="Full-text search over the source feed item"),
+    limit: Optional[int] = Query(None, ge=1, le=200, description="Page size; omit for every matching card"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
     db: Session = Depends(get_db),
 ):
-    """List analysis cards with optional filtering."""
-    query = db.query(AnalysisCard).options(joinedload(AnalysisCard.competitors))
+    """List analysis cards with optional filtering, newest first.
+
+    With ``limit``, returns one page and, if more remain, the cursor for the
+    next page in the X-Next-Cursor header (keyset on created_at, id).
+
+    The ETag fingerprints the (id, updated_at) pairs of the page, read first
+    with a two-column query; a client that already has that page gets a 304
+    and the cards are never loaded or serialized.
+    """
+    query = db.query(AnalysisCard)
+
+    if q:
+        query = query.join(FeedItem, AnalysisCard.feed_item_id == FeedItem.id).filter(
+            FeedItem.search_tsv.op("@@")(func.plainto_tsquery("english", q))
+        )
 
     if status:
         query = query.filter(AnalysisCard.status == status)
     if priority:
         query = query.filter(AnalysisCard.priority == priority)
     if competitor_id:
-        query = query.join(AnalysisCardCompetitor).filter(
-            AnalysisCardCompetitor.competitor_id == uuid.UUID(competitor_id)
-        )
+        # Semi-join rather than JOIN: parent rows are never multiplied, so no
+        # DISTINCT or dedupe is needed, and the link index answers it alone.
+        query = query.filter(AnalysisCard.id.in_(
+            select(AnalysisCardCompetitor.analysis_card_id).where(
+                AnalysisCardCompetitor.competitor_id == competitor_id
+            )
+        ))
     if date_from:
         try:
             dt_from = datetime.fromisoformat(date_from)
@@ -219,117 +240,119 @@ def list_cards(
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid date_to format")
 
-    cards = query.order_by(AnalysisCard.created_at.desc()).all()
-    # Deduplicate due to joinedload + join
-    seen = set()
-    unique_cards = []
-    for card in cards:
-        if card.id not in seen:
-            seen.add(card.id)
-            unique_cards.append(card)
-    return [_card_to_response(c) for c in unique_cards]
+    if cursor:
+        try:
+            created_at, last_id = decode_cursor(cursor, 2)
+            after = tuple_(datetime.fromisoformat(created_at), uuid.UUID(last_id))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.filter(tuple_(AnalysisCard.created_at, AnalysisCard.id) < after)
+
+    query = query.order_by(AnalysisCard.created_at.desc(), AnalysisCard.id.desc())
+    if limit is not None:
+        query = query.limit(limit)
+
+    etag = _list_etag(query.with_entities(*_CARD_LIST_VERSION_COLUMNS).all())
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+    cards = query.options(*CARD_LIST_LOADS).all()
+    if limit is not None and len(cards) == limit:
+        last = cards[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor(last.created_at.isoformat(), str(last.id))
+    return cards
 
 
 
 @router.get("/{card_id}", response_model=CardResponse)
-def get_card(card_id: str, db: Session = Depends(get_db)):
+def get_card(card_id: uuid.UUID, db: Session = Depends(get_db)):
     """Get a single analysis card by ID."""
     card = (
         db.query(AnalysisCard)
-        .options(joinedload(AnalysisCard.competitors))
-        .filter(AnalysisCard.id == uuid.UUID(card_id))
+        .options(*CARD_DETAIL_LOADS)
+        .filter(AnalysisCard.id == card_id)
         .first()
     )
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
-    return _card_to_response(card)
+    return CardResponse.model_validate(card)
 
 
 @router.put("/{card_id}", response_model=CardResponse)
 def update_card(
-    card_id: str,
+    card_id: uuid.UUID,
     body: CardUpdate,
     request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Update an analysis card's editable fields and track changes."""
-    card = _get_card_or_404(card_id, db)
-
-    update_data = body.model_dump(exclude_unset=True)
-
-    if "event_type" in update_data and update_data["event_type"] not in VALID_EVENT_TYPES:
-        raise HTTPException(status_code=400, detail=f"Invalid event_type: {update_data['event_type']}")
-    if "priority" in update_data and update_data["priority"] not in VALID_PRIORITIES:
-        raise HTTPException(status_code=400, detail=f"Invalid priority: {update_data['priority']}")
-
-    # Track edits for each changed field
-    for field, new_value in update_data.items():
-        if field in TRACKED_FIELDS:
-            previous_value = getattr(card, field, "") or ""
-            if str(previous_value) != str(new_value):
-                edit = AnalysisCardEdit(
-                    id=uuid.uuid4(),
-                    analysis_card_id=card.id,
-                    user_id=current_user.id,
-                    field_changed=field,
-                    previous_value=str(previous_value),
-                    new_value=str(new_value),
-                )
-                db.add(edit)
-
-    for field, value in update_data.items():
+    card = _get_card_or_404(card_id, db, CARD_DETAIL_LOADS)
+
+    # Fields sent with their current value are neither audited nor written.
+    # CardUpdate only admits strings, so the values compare as they are.
+    changes = {
+        field: value
+        for field, value in body.model_dump(exclude_unset=True).items()
+        if getattr(card, field) != value
+    }
+
+    # The audit rows need no ORM objects: one executemany INSERT without
+    # RETURNING, flushed in the same transaction as the single card UPDATE.
+    edits = [
+        {
+            "analysis_card_id": card.id,
+            "user_id": current_user.id,
+            "field_changed": field,
+            "previous_value": getattr(card, field),
+            "new_value": value,
+        }
+        for field, value in changes.items()
+        if field in TRACKED_FIELDS
+    ]
+    if edits:
+        db.execute(insert(AnalysisCardEdit), edits)
+
+    for field, value in changes.items():
         setattr(card, field, value)
 
+    # The UPDATE returns the trigger-set updated_at (eager_defaults), so the
+    # loaded card is complete: serialize it before commit expires it.
+    db.flush()
+    result = CardResponse.model_validate(card)
     db.commit()
-    db.refresh(card)
-
-    # Re-load with competitors
-    card = (
-        db.query(AnalysisCard)
-        .options(joinedload(AnalysisCard.competitors))
-        .filter(AnalysisCard.id == card.id)
-        .first()
-    )
-    return _card_to_response(card)
+    return result
 
 
 @router.post("/{card_id}/status", response_model=CardResponse)
 def update_card_status(
-    card_id: str,
+    card_id: uuid.UUID,
     body: StatusUpdate,
     request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Change the status of an analysis card. Only admins can approve."""
-    if body.status not in VALID_STATUSES:
-        raise HTTPException(status_code=400, detail=f"Invalid status: {body.status}")
-
-    # Enforce admin-only approval
-    if body.status == "approved" and current_user.role != "admin":
-        raise HTTPException(status_code=403, detail="Only admin users can approve cards")
-
-    card = _get_card_or_404(card_id, db)
+    # Enforce admin-only approval, against the role in the database
+    if body.status == "approved":
+        current_user = reload_user(db, current_user)
+        if current_user.role != "admin":
+            raise HTTPException(status_code=403, detail="Only admin users can approve cards")
 
-    card.status = body.status
+    card = _get_card_or_404(card_id, db, CARD_DETAIL_LOADS)
 
-    # If approving, set approved_by and approved_at
+    # If approving, set approved_by and approved_at (the database's clock)
+    values = {"status": body.status}
     if body.status == "approved":
-        card.approved_by = current_user.id
-        card.approved_at = datetime.now(timezone.utc)
+        values.update(approved_by=current_user.id, approved_at=func.now())
 
+    update_returning(db, card, **values)
+    result = CardResponse.model_validate(card)
     db.commit()
-    db.refresh(card)
-
-    # Re-load with competitors
-    card = (
-        db.query(AnalysisCard)
-        .options(joinedload(AnalysisCard.competitors))
-        .filter(AnalysisCard.id == card.id)
-        .first()
-    )
-    return _card_to_response(card)
+    return result
 
 
 
@@ -339,21 +362,21 @@ def update_card_status(
 
 @router.get("/{card_id}/history", response_model=list[EditResponse])
 def get_card_history(
-    card_id: str,
+    card_id: uuid.UUID,
     db: Session = Depends(get_db),
 ):
     """Get the edit history for a card."""
-    # Verify card exists
-    _get_card_or_404(card_id, db)
-
     edits = (
         db.query(AnalysisCardEdit)
-        .options(joinedload(AnalysisCardEdit.user))
-        .filter(AnalysisCardEdit.analysis_card_id == uuid.UUID(card_id))
+        .options(*EDIT_LOADS)
+        .filter(AnalysisCardEdit.analysis_card_id == card_id)
         .order_by(AnalysisCardEdit.created_at.desc())
         .all()
     )
-    return [_edit_to_response(e) for e in edits]
+    # Rows prove the card exists; only an empty history needs the check.
+    if not edits:
+        _require_card(card_id, db)
+    return edits
 
 
 # ---------------------------------------------------------------------------
@@ -362,57 +385,73 @@ def get_card_history(
 
 @router.get("/{card_id}/comments", response_model=list[CommentResponse])
 def list_card_comments(
-    card_id: str,
+    card_id: uuid.UUID,
     db: Session = Depends(get_db),
 ):
     """List comments for a card (top-level only, with threaded replies)."""
-    # Verify card exists
-    _get_card_or_404(card_id, db)
-
-    # Fetch top-level comments (no parent) with their replies
+    # Fetch the whole thread in one query and assemble it in memory
     comments = (
         db.query(AnalysisCardComment)
-        .options(joinedload(AnalysisCardComment.user))
-        .filter(
-            AnalysisCardComment.analysis_card_id == uuid.UUID(card_id),
-            AnalysisCardComment.parent_comment_id.is_(None),
-        )
-        .order_by(AnalysisCardComment.created_at.desc())
+        .options(*COMMENT_LOADS)
+        .filter(AnalysisCardComment.analysis_card_id == card_id)
+        .order_by(AnalysisCardComment.created_at.asc())
         .all()
     )
+    # Rows prove the card exists; only an empty thread needs the check.
+    if not comments:
+        _require_card(card_id, db)
+    return _thread_comments(comments)
+
+
+def _thread_comments(comments: list[AnalysisCardComment]) -> list[AnalysisCardComment]:
+    """Attach replies to their parents; returns top-level comments, newest first.
 
-    # Eagerly load replies for each comment
+    ``comments`` must be ordered oldest first so replies keep that order.
+    """
+    children: dict[uuid.UUID | None, list[AnalysisCardComment]] = defaultdict(list)
     for comment in comments:
-        _load_replies(comment, db)
+        children[comment.parent_comment_id].append(comment)
+    for comment in comments:
+        set_committed_value(comment, "replies", children.get(comment.id, []))
+    return children[None][::-1]
 
-    return [_comment_to_response(c) for c in comments]
 
+def _load_comment_thread(db: Session, comment_id: uuid.UUID) -> AnalysisCardComment | None:
+    """Load a comment with all of its nested replies in one round trip.
 
-def _load_replies(comment: AnalysisCardComment, db: Session) -> None:
-    """Recursively load replies for a comment."""
-    replies = (
+    A recursive CTE collects the ids of the whole subtree, however deep, and
+    the rows are threaded in memory by _thread_comments.
+    """
+    thread = (
+        select(AnalysisCardComment.id)
+        .where(AnalysisCardComment.id == comment_id)
+        .cte("thread", recursive=True)
+    )
+    reply = aliased(AnalysisCardComment)
+    thread = thread.union_all(
+        select(reply.id).where(reply.parent_comment_id == thread.c.id)
+    )
+    comments = (
         db.query(AnalysisCardComment)
-        .options(joinedload(AnalysisCardComment.user))
-        .filter(AnalysisCardComment.parent_comment_id == comment.id)
+        .options(*COMMENT_LOADS)
+        .filter(AnalysisCardComment.id.in_(select(thread.c.id)))
         .order_by(AnalysisCardComment.created_at.asc())
         .all()
     )
-    comment.replies = replies
-    for reply in replies:
-        _load_replies(reply, db)
+    _thread_comments(comments)
+    return next((c for c in comments if c.id == comment_id), None)
 
 
 @router.post("/{card_id}/comments", response_model=CommentResponse, status_code=201)
 def add_comment(
-    card_id: str,
+    card_id: uuid.UUID,
     body: CommentCreate,
     request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Add a comment to a card."""
-    # Verify card exists
-    _get_card_or_404(card_id, db)
+    _require_card(card_id, db)
 
     # Validate parent comment if provided
     parent_comment_id = None
@@ -420,8 +459,8 @@ def add_comment(
         parent = (
             db.query(AnalysisCardComment)
             .filter(
-                AnalysisCardComment.id == uuid.UUID(body.parent_comment_id),
-                AnalysisCardComment.analysis_card_id == uuid.UUID(card_id),
+                AnalysisCardComment.id == body.parent_comment_id,
+                AnalysisCardComment.analysis_card_id == card_id,
             )
             .first()
         )
@@ -430,96 +469,64 @@ def add_comment(
         parent_comment_id = parent.id
 
     comment = AnalysisCardComment(
-        id=uuid.uuid4(),
-        analysis_card_id=uuid.UUID(card_id),
+        analysis_card_id=card_id,
         user_id=current_user.id,
         content=body.content,
         parent_comment_id=parent_comment_id,
         resolved=False,
     )
     db.add(comment)
+    # The INSERT returns the generated id and timestamps; the author is the
+    # current user and a new comment has no replies, so nothing is reloaded.
+    db.flush()
+    set_committed_value(comment, "user", current_user)
+    set_committed_value(comment, "replies", [])
+    result = CommentResponse.model_validate(comment)
     db.commit()
-    db.refresh(comment)
-
-    # Reload with user relationship
-    comment = (
-        db.query(AnalysisCardComment)
-        .options(joinedload(AnalysisCardComment.user))
-        .filter(AnalysisCardComment.id == comment.id)
-        .first()
-    )
-    return _comment_to_response(comment)
+    return result
 
 
 @router.put("/{card_id}/comments/{comment_id}", response_model=CommentResponse)
 def update_comment(
-    card_id: str,
-    comment_id: str,
+    card_id: uuid.UUID,
+    comment_id: uuid.UUID,
     body: CommentUpdate,
     request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Edit a comment. Only the comment author can edit."""
-    comment = (
-        db.query(AnalysisCardComment)
-        .options(joinedload(AnalysisCardComment.user))
-        .filter(
-            AnalysisCardComment.id == uuid.UUID(comment_id),
-            AnalysisCardComment.analysis_card_id == uuid.UUID(card_id),
-        )
-        .first()
-    )
-    if not comment:
+    # Load the comment with its author and reply subtree up front; the
+    # UPDATE returns updated_at, so the response needs no second read.
+    comment = _load_comment_thread(db, comment_id)
+    if not comment or comment.analysis_card_id != card_id:
         raise HTTPException(status_code=404, detail="Comment not found")
 
     if comment.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="You can only edit your own comments")
 
     comment.content = body.content
+    db.flush()
+    result = CommentResponse.model_validate(comment)
     db.commit()
-    db.refresh(comment)
-
-    # Reload with user
-    comment = (
-        db.query(AnalysisCardComment)
-        .options(joinedload(AnalysisCardComment.user))
-        .filter(AnalysisCardComment.id == comment.id)
-        .first()
-    )
-    return _comment_to_response(comment)
+    return result
 
 
 @router.post("/{card_id}/comments/{comment_id}/resolve", response_model=CommentResponse)
 def resolve_comment(
-    card_id: str,
-    comment_id: str,
+    card_id: uuid.UUID,
+    comment_id: uuid.UUID,
     request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Toggle resolve/unresolve a comment."""
-    comment = (
-        db.query(AnalysisCardComment)
-        .options(joinedload(AnalysisCardComment.user))
-        .filter(
-            AnalysisCardComment.id == uuid.UUID(comment_id),
-            AnalysisCardComment.analysis_card_id == uuid.UUID(card_id),
-        )
-        .first()
-    )
-    if not comment:
+    comment = _load_comment_thread(db, comment_id)
+    if not comment or comment.analysis_card_id != card_id:
         raise HTTPException(status_code=404, detail="Comment not found")
 
     comment.resolved = not comment.resolved
+    db.flush()
+    result = CommentResponse.model_validate(comment)
     db.commit()
-    db.refresh(comment)
-
-    # Reload with user
-    comment = (
-        db.query(AnalysisCardComment)
-        .options(joinedload(AnalysisCardComment.user))
-        .filter(AnalysisCardComment.id == comment.id)
-        .first()
-    )
-    return _comment_to_response(comment)
\ No newline at end of file
+    return result
\ No newline at end of file
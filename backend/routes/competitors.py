@@ -2,22 +2,28 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 
 from backend.database import get_db
 from backend.models.competitor import Competitor
 
 router = APIRouter()
 
+# Unloaded columns raise, so a lean row can never validate as a full
+# CompetitorResponse (or lazy-load its way into one).
+COMPETITOR_OPTION_LOADS = load_only(
+    Competitor.id, Competitor.name, Competitor.is_suggested, raiseload=True
+)
+
 
 # --- Pydantic schemas ---
 
 class CompetitorResponse(BaseModel):
-    id: str
+    id: uuid.UUID
     name: str
     description: str
     key_products: str
@@ -30,32 +36,21 @@ class CompetitorResponse(BaseModel):
     is_active: bool
     is_suggested: bool
     suggested_reason: str | None
-    created_by: str | None
+    created_by: uuid.UUID | None
     created_at: datetime
     updated_at: datetime
 
     model_config = {"from_attributes": True}
 
-    @classmethod
-    def from_orm_model(cls, obj: Competitor) -> "CompetitorResponse":
-        return cls(
-            id=str(obj.id),
-            name=obj.name,
-            description=obj.description,
-            key_products=obj.key_products,
-            target_customers=obj.target_customers,
-            known_strengths=obj.known_strengths,
-            known_weaknesses=obj.known_weaknesses,
-            augment_overlap=obj.augment_overlap,
-            pricing=obj.pricing,
-            content_types=obj.content_types,
-            is_active=obj.is_active,
-            is_suggested=obj.is_suggested,
-            suggested_reason=obj.suggested_reason,
-            created_by=str(obj.created_by) if obj.created_by else None,
-            created_at=obj.created_at,
-            updated_at=obj.updated_at,
-        )
+
+class CompetitorOption(BaseModel):
+    """The columns a competitor picker needs (``GET /competitors?lean=true``)."""
+
+    id: uuid.UUID
+    name: str
+    is_suggested: bool
+
+    model_config = {"from_attributes": True}
 
 
 class CompetitorCreate(BaseModel):
@@ -86,18 +81,23 @@ class CompetitorUpdate(BaseModel):
 
 # --- Routes ---
 
-@router.get("", response_model=list[CompetitorResponse])
+@router.get("", response_model=Union[list[CompetitorResponse], list[CompetitorOption]])
 def list_competitors(
     is_suggested: Optional[bool] = Query(None),
+    lean: bool = Query(False),
     db: Session = Depends(get_db),
 ):
-    """List competitors, optionally filtered by is_suggested."""
+    """List competitors, optionally filtered by is_suggested.
+
+    ``lean=true`` reads only the picker columns and skips the profile text.
+    """
     query = db.query(Competitor).filter(Competitor.is_active == True)
+    if lean:
+        query = query.options(COMPETITOR_OPTION_LOADS)
     if is_suggested is not None:
         query = query.filter(Competitor.is_suggested == is_suggested)
     query = query.order_by(Competitor.name)
-    competitors = query.all()
-    return [CompetitorResponse.from_orm_model(c) for c in competitors]
+    return query.all()
 
 
 @router.post("", response_model=CompetitorResponse, status_code=201)
@@ -126,7 +126,7 @@ def create_competitor(
     db.add(competitor)
     db.commit()
     db.refresh(competitor)
-    return CompetitorResponse.from_orm_model(competitor)
+    return CompetitorResponse.model_validate(competitor)
 
 
 @router.get("/{competitor_id}", response_model=CompetitorResponse)
@@ -135,7 +135,7 @@ def get_competitor(competitor_id: uuid.UUID, db: Session = Depends(get_db)):
     competitor = db.query(Competitor).filter(Competitor.id == competitor_id).first()
     if not competitor:
         raise HTTPException(status_code=404, detail="Competitor not found")
-    return CompetitorResponse.from_orm_model(competitor)
+    return CompetitorResponse.model_validate(competitor)
 
 
 
@@ -166,7 +166,7 @@ def update_competitor(
 
     db.commit()
     db.refresh(competitor)
-    return CompetitorResponse.from_orm_model(competitor)
+    return CompetitorResponse.model_validate(competitor)
 
 
 @router.delete("/{competitor_id}", status_code=204)
@@ -191,7 +191,7 @@ def approve_competitor(competitor_id: uuid.UUID, db: Session = Depends(get_db)):
     competitor.is_suggested = False
     db.commit()
     db.refresh(competitor)
-    return CompetitorResponse.from_orm_model(competitor)
+    return CompetitorResponse.model_validate(competitor)
 
 
 @router.post("/{competitor_id}/reject", status_code=204)
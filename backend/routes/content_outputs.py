@@ -2,25 +2,28 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import re
 import uuid
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
 from backend.services.content_generator import ContentGenerator
-from pydantic import BaseModel
-from sqlalchemy.orm import Session, joinedload
+from pydantic import AliasPath, BaseModel, Field, field_validator
+from sqlalchemy import and_, func
+from sqlalchemy.orm import Session
 
 from backend.database import get_db
 from backend.models.analysis_card import AnalysisCard, AnalysisCardCompetitor
 from backend.models.competitor import Competitor
-from backend.models.content_output import ContentOutput
+from backend.models.content_output import ContentOutput, ContentOutputStatus
 from backend.models.content_template import ContentTemplate
+from backend.models.loaders import CONTENT_OUTPUT_LIST_LOADS, CONTENT_OUTPUT_LOADS
 from backend.models.user import User
-from backend.routes.auth import get_current_user
-from backend.utils import utc_isoformat
+from backend.routes.auth import get_current_user, reload_user
+from backend.utils import UtcDatetime, utc_isoformat
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -30,31 +33,58 @@ logger = logging.getLogger(__name__)
 # Pydantic schemas
 # ---------------------------------------------------------------------------
 
-class ContentOutputResponse(BaseModel):
-    id: str
-    competitor_id: str
-    competitor_name: str
+class ContentOutputListItem(BaseModel):
+    """A content output as listed; the body and its sections are for single views."""
+
+    id: uuid.UUID
+    competitor_id: uuid.UUID
+    competitor_name: str = Field("", validation_alias=AliasPath("competitor", "name"))
     content_type: str
-    title: Optional[str] = None
-    content: str
-    sections: Optional[list[dict]] = None
-    source_card_ids: Optional[list[str]] = None
+    title: str = ""
+    source_card_ids: list[str] = []
     version: int
     status: str
-    template_id: Optional[str] = None
+    template_id: Optional[uuid.UUID] = None
     google_doc_id: Optional[str] = None
     google_doc_url: Optional[str] = None
-    approved_by: Optional[str] = None
-    approved_at: Optional[str] = None
-    published_at: Optional[str] = None
+    approved_by: Optional[uuid.UUID] = None
+    approved_at: Optional[UtcDatetime] = None
+    published_at: Optional[UtcDatetime] = None
     error_message: Optional[str] = None
-    created_at: str
-    updated_at: str
+    created_at: UtcDatetime
+    updated_at: UtcDatetime
+
+    model_config = {"from_attributes": True}
+
+    @field_validator("title", mode="before")
+    @classmethod
+    def _null_title_as_empty(cls, value: Any) -> Any:
+        return "" if value is None else value
+
+    @field_validator("source_card_ids", mode="before")
+    @classmethod
+    def _null_card_ids_as_empty(cls, value: Any) -> Any:
+        return [] if value is None else value
+
+
+class ContentOutputResponse(ContentOutputListItem):
+    content: str = ""
+    sections: list[dict] = []
+
+    @field_validator("content", mode="before")
+    @classmethod
+    def _null_content_as_empty(cls, value: Any) -> Any:
+        return "" if value is None else value
+
+    @field_validator("sections", mode="before")
+    @classmethod
+    def _null_sections_as_empty(cls, value: Any) -> Any:
+        return [] if value is None else value
 
 
 class ContentOutputCreate(BaseModel):
-    competitor_id: str
-    template_id: str
+    competitor_id: uuid.UUID
+    template_id: uuid.UUID
 
 
 class ContentOutputUpdate(BaseModel):
@@ -63,7 +93,7 @@ class ContentOutputUpdate(BaseModel):
 
 
 class StatusUpdate(BaseModel):
-    status: str
+    status: ContentOutputStatus
 
 
 class StaleContentItem(BaseModel):
@@ -82,73 +112,52 @@ class StaleContentItem(BaseModel):
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _output_to_response(co: ContentOutput) -> dict:
-    """Serialize a ContentOutput to a dict matching ContentOutputResponse."""
-    competitor_name = ""
-    if co.competitor:
-        competitor_name = co.competitor.name
+# Generated content is a JSON object of section title -> body; edited or
+# failed content may be plain text or markdown.
+_JSON_OBJECT_START = re.compile(r"\s*\{")
 
-    # Parse content as sections if it's JSON
-    sections = None
-    try:
-        parsed = json.loads(co.content) if co.content else None
-        if isinstance(parsed, dict):
-            sections = [{"title": k, "body": v} for k, v in parsed.items()]
-    except (json.JSONDecodeError, TypeError):
-        pass
-
-    return {
-        "id": str(co.id),
-        "competitor_id": str(co.competitor_id),
-        "competitor_name": competitor_name,
-        "content_type": co.content_type or "",
-        "title": co.title or "",
-        "content": co.content or "",
-        "sections": sections or [],
-        "source_card_ids": co.source_card_ids or [],
-        "version": co.version,
-        "status": co.status,
-        "template_id": str(co.template_id) if co.template_id else None,
-        "google_doc_id": co.google_doc_id,
-        "google_doc_url": co.google_doc_url,
-        "approved_by": str(co.approved_by) if co.approved_by else None,
-        "approved_at": utc_isoformat(co.approved_at),
-        "published_at": utc_isoformat(co.published_at),
-        "error_message": co.error_message,
-        "created_at": utc_isoformat(co.created_at),
-        "updated_at": utc_isoformat(co.updated_at),
-    }
-
-
-VALID_STATUSES = {"draft", "in_review", "approved", "published", "failed"}
 
+def _content_sections(content: str | None) -> list[dict]:
+    """Split JSON-object content into title/body sections; [] for anything else.
 
+    Called whenever content is written; responses read the stored sections.
+    Content that cannot be a JSON object (the common markdown case) is
+    rejected by a prefix check without running the decoder.
+    """
+    if not content or not _JSON_OBJECT_START.match(content):
+        return []
+    try:
+        parsed = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return []
+    if not isinstance(parsed, dict):
+        return []
+    return [{"title": k, "body": v} for k, v in parsed.items()]
 
 
 # ---------------------------------------------------------------------------
 # Route handlers
 # ---------------------------------------------------------------------------
 
-@router.get("", response_model=list[ContentOutputResponse])
+@router.get("", response_model=list[ContentOutputListItem])
 def list_content_outputs(
-    competitor_id: Optional[str] = Query(None),
+    competitor_id: Optional[uuid.UUID] = Query(None),
     content_type: Optional[str] = Query(None),
-    status: Optional[str] = Query(None),
+    status: Optional[ContentOutputStatus] = Query(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """List content outputs with optional filters."""
-    query = db.query(ContentOutput).options(joinedload(ContentOutput.competitor))
+    query = db.query(ContentOutput).options(*CONTENT_OUTPUT_LIST_LOADS)
 
     if competitor_id:
-        query = query.filter(ContentOutput.competitor_id == uuid.UUID(competitor_id))
+        query = query.filter(ContentOutput.competitor_id == competitor_id)
     if content_type:
         query = query.filter(ContentOutput.content_type == content_type)
     if status:
         query = query.filter(ContentOutput.status == status)
 
-    outputs = query.order_by(ContentOutput.updated_at.desc()).all()
-    return [_output_to_response(co) for co in outputs]
+    return query.order_by(ContentOutput.updated_at.desc()).all()
 
 
 @router.get("/stale", response_model=list[StaleContentItem])
@@ -162,12 +171,38 @@ def get_stale_content(
     published/approved content_output for that content_type.
     Missing: a competitor has content_types configured but no content_output at all.
     """
-    competitors = db.query(Competitor).filter(Competitor.is_active == True).all()
+    # Four set-based reads, however many competitors and content types: the
+    # configured pairs, the templates, the latest approved/published output
+    # per (competitor, content_type), and the newest card approval per
+    # competitor.
+    competitors = (
+        db.query(Competitor.id, Competitor.name, Competitor.content_types)
+        .filter(Competitor.is_active == True)
+        .all()
+    )
 
     # Pre-load content templates keyed by content_type for lookups
-    templates = db.query(ContentTemplate).all()
-    template_by_type: dict[str, ContentTemplate] = {t.content_type: t for t in templates}
+    templates = db.query(ContentTemplate.id, ContentTemplate.name, ContentTemplate.content_type).all()
+    template_by_type = {t.content_type: t for t in templates}
+
+    latest_outputs = (
+        db.query(ContentOutput.competitor_id, ContentOutput.content_type, ContentOutput.id, ContentOutput.updated_at)
+        .filter(ContentOutput.status.in_(["approved", "published"]))
+        .distinct(ContentOutput.competitor_id, ContentOutput.content_type)
+        .order_by(ContentOutput.competitor_id, ContentOutput.content_type, ContentOutput.updated_at.desc())
+        .all()
+    )
+    latest_output_by_key = {(co.competitor_id, co.content_type): co for co in latest_outputs}
+
+    latest_approval_by_competitor = dict(
+        db.query(AnalysisCardCompetitor.competitor_id, func.max(AnalysisCard.approved_at))
+        .join(AnalysisCard, AnalysisCard.id == AnalysisCardCompetitor.analysis_card_id)
+        .filter(AnalysisCard.status == "approved")
+        .group_by(AnalysisCardCompetitor.competitor_id)
+        .all()
+    )
 
+    now = datetime.now(timezone.utc)
     results: list[dict] = []
 
     for comp in competitors:
@@ -178,18 +213,7 @@ def get_stale_content(
         for ct in configured_types:
             # Look up template for this content_type
             tmpl = template_by_type.get(ct)
-
-            # Find latest content output for this competitor + content_type
-            latest_co = (
-                db.query(ContentOutput)
-                .filter(
-                    ContentOutput.competitor_id == comp.id,
-                    ContentOutput.content_type == ct,
-                    ContentOutput.status.in_(["approved", "published"]),
-                )
-                .order_by(ContentOutput.updated_at.desc())
-                .first()
-            )
+            latest_co = latest_output_by_key.get((comp.id, ct))
 
             if not latest_co:
                 # Missing: no content output exists
@@ -206,21 +230,11 @@ def get_stale_content(
                 })
                 continue
 
-            # Check if there are approved analysis cards newer than the content output
-            latest_card = (
-                db.query(AnalysisCard)
-                .join(AnalysisCardCompetitor)
-                .filter(
-                    AnalysisCardCompetitor.competitor_id == comp.id,
-                    AnalysisCard.status == "approved",
-                    AnalysisCard.approved_at > latest_co.updated_at,
-                )
-                .order_by(AnalysisCard.approved_at.desc())
-                .first()
-            )
-
-            if latest_card:
-                days_stale = (datetime.now(timezone.utc) - latest_co.updated_at.replace(tzinfo=timezone.utc)).days
+            # Stale: a card was approved after the latest output
+            latest_approval = latest_approval_by_competitor.get(comp.id)
+            last_output_at = latest_co.updated_at
+            if latest_approval is not None and latest_approval > last_output_at:
+                days_stale = (now - last_output_at).days
                 results.append({
                     "competitor_id": str(comp.id),
                     "competitor_name": comp.name,
@@ -238,20 +252,20 @@ def get_stale_content(
 
 @router.get("/{output_id}", response_model=ContentOutputResponse)
 def get_content_output(
-    output_id: str,
+    output_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Get a single content output by ID."""
     co = (
         db.query(ContentOutput)
-        .options(joinedload(ContentOutput.competitor))
-        .filter(ContentOutput.id == uuid.UUID(output_id))
+        .options(*CONTENT_OUTPUT_LOADS)
+        .filter(ContentOutput.id == output_id)
         .first()
     )
     if not co:
         raise HTTPException(status_code=404, detail="Content output not found")
-    return _output_to_response(co)
+    return co
 
 
 @router.post("/generate", response_model=ContentOutputResponse, status_code=200)
@@ -265,77 +279,75 @@ def generate_content(
     Creates a ContentOutput, calls the LLM inline, and returns the
     completed (or failed) content output.
     """
-    # Validate competitor exists
-    competitor = db.query(Competitor).filter(Competitor.id == uuid.UUID(body.competitor_id)).first()
-    if not competitor:
-        raise HTTPException(status_code=404, detail="Competitor not found")
-
-    # Validate template exists and is active
-    template = db.query(ContentTemplate).filter(
-        ContentTemplate.id == uuid.UUID(body.template_id),
-        ContentTemplate.is_active == True,
-    ).first()
-    if not template:
+    # Competitor and active template in one round-trip; only a miss pays
+    # a second primary-key lookup to say which of the two is missing.
+    found = (
+        db.query(Competitor, ContentTemplate)
+        .join(ContentTemplate, and_(ContentTemplate.id == body.template_id, ContentTemplate.is_active == True))
+        .filter(Competitor.id == body.competitor_id)
+        .first()
+    )
+    if found is None:
+        if db.get(Competitor, body.competitor_id) is None:
+            raise HTTPException(status_code=404, detail="Competitor not found")
         raise HTTPException(status_code=404, detail="Template not found or inactive")
+    competitor, template = found
 
     # Create content output record with "draft" status
     co = ContentOutput(
-        competitor_id=uuid.UUID(body.competitor_id),
+        competitor_id=body.competitor_id,
         content_type=template.content_type,
         title="",
         content="",
         version=1,
         status="draft",
-        template_id=uuid.UUID(body.template_id),
+        template_id=body.template_id,
     )
     db.add(co)
     db.commit()
     db.refresh(co)
 
+    # Title from template + competitor, built while both are still loaded:
+    # the generator ends the transaction (expiring them) before its LLM call.
+    if template.doc_name_pattern:
+        title = template.doc_name_pattern.replace("{competitor}", competitor.name)
+    else:
+        title = f"Battle Card - {competitor.name}"
+
     # Generate content SYNCHRONOUSLY
     try:
         generator = ContentGenerator()
-        result = generator.generate_content(
-            db,
-            competitor_id=uuid.UUID(body.competitor_id),
-            template_id=uuid.UUID(body.template_id),
-        )
+        result = generator.generate_content(db, competitor=competitor, template=template)
 
         co.content = result.get("content", "")
+        co.sections = _content_sections(co.content)
         co.raw_llm_output = result.get("raw_llm_output")
         co.source_card_ids = result.get("source_card_ids", [])
         co.content_type = result.get("content_type", co.content_type)
-
-        # Generate title from template + competitor
-        if template and competitor and template.doc_name_pattern:
-            co.title = template.doc_name_pattern.replace("{competitor}", competitor.name)
-        elif competitor:
-            co.title = f"Battle Card - {competitor.name}"
-
+        co.title = title
         co.status = "draft"
         db.commit()
-        db.refresh(co)
         logger.info("Content generation complete for output %s", co.id)
     except Exception as e:
         logger.exception("Content generation failed for output %s", co.id)
         co.status = "failed"
         co.error_message = str(e)
         db.commit()
-        db.refresh(co)
 
-    # Reload with competitor relationship for serialization
+    # Reload with competitor relationship for serialization; this also
+    # refreshes the attributes the commit expired.
     co = (
         db.query(ContentOutput)
-        .options(joinedload(ContentOutput.competitor))
+        .options(*CONTENT_OUTPUT_LOADS)
         .filter(ContentOutput.id == co.id)
         .first()
     )
-    return _output_to_response(co)
+    return co
 
 
 @router.put("/{output_id}", response_model=ContentOutputResponse)
 def update_content_output(
-    output_id: str,
+    output_id: uuid.UUID,
     body: ContentOutputUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -343,8 +355,8 @@ def update_content_output(
     """Update editable fields of a content output (title, content)."""
     co = (
         db.query(ContentOutput)
-        .options(joinedload(ContentOutput.competitor))
-        .filter(ContentOutput.id == uuid.UUID(output_id))
+        .options(*CONTENT_OUTPUT_LOADS)
+        .filter(ContentOutput.id == output_id)
         .first()
     )
     if not co:
@@ -353,20 +365,22 @@ def update_content_output(
     update_data = body.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(co, field, value)
+    if "content" in update_data:
+        co.sections = _content_sections(co.content)
 
     db.commit()
     db.refresh(co)
-    return _output_to_response(co)
+    return co
 
 
 @router.delete("/{output_id}", status_code=204)
 def delete_content_output(
-    output_id: str,
+    output_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Hard-delete a content output. Content outputs are regenerable."""
-    co = db.query(ContentOutput).filter(ContentOutput.id == uuid.UUID(output_id)).first()
+    co = db.query(ContentOutput).filter(ContentOutput.id == output_id).first()
     if not co:
         raise HTTPException(status_code=404, detail="Content output not found")
     db.delete(co)
@@ -376,7 +390,7 @@ def delete_content_output(
 
 @router.patch("/{output_id}/status", response_model=ContentOutputResponse)
 def update_content_output_status(
-    output_id: str,
+    output_id: uuid.UUID,
     body: StatusUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -385,16 +399,10 @@ def update_content_output_status(
 
     Approval requires admin role.
     """
-    if body.status not in VALID_STATUSES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid status. Must be one of: {', '.join(sorted(VALID_STATUSES))}",
-        )
-
     co = (
         db.query(ContentOutput)
-        .options(joinedload(ContentOutput.competitor))
-        .filter(ContentOutput.id == uuid.UUID(output_id))
+        .options(*CONTENT_OUTPUT_LOADS)
+        .filter(ContentOutput.id == output_id)
         .first()
     )
     if not co:
@@ -402,6 +410,7 @@ def update_content_output_status(
 
     # Approval requires admin
     if body.status == "approved":
+        current_user = reload_user(db, current_user)
         if current_user.role != "admin":
             raise HTTPException(status_code=403, detail="Only admins can approve content")
         co.approved_by = current_user.id
@@ -411,12 +420,12 @@ def update_content_output_status(
     db.commit()
     db.refresh(co)
 
-    return _output_to_response(co)
+    return co
 
 
 @router.post("/{output_id}/publish", response_model=ContentOutputResponse, status_code=200)
 def publish_content_output(
-    output_id: str,
+    output_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -427,12 +436,12 @@ def publish_content_output(
     Calls Google Docs service synchronously.
     On failure: keeps status as 'approved', stores error in error_message.
     """
+    # The fresh row also carries the OAuth tokens the user cache leaves out.
+    current_user = reload_user(db, current_user)
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Only admins can publish content")
 
-    co = db.query(ContentOutput).options(
-        joinedload(ContentOutput.competitor)
-    ).filter(ContentOutput.id == uuid.UUID(output_id)).first()
+    co = db.query(ContentOutput).options(*CONTENT_OUTPUT_LOADS).filter(ContentOutput.id == output_id).first()
     if not co:
         raise HTTPException(status_code=404, detail="Content output not found")
 
@@ -456,7 +465,5 @@ def publish_content_output(
         # Keep status as "approved" — don't revert to "failed"
 
     # Reload for serialization
-    co = db.query(ContentOutput).options(
-        joinedload(ContentOutput.competitor)
-    ).filter(ContentOutput.id == co.id).first()
-    return _output_to_response(co)
+    co = db.query(ContentOutput).options(*CONTENT_OUTPUT_LOADS).filter(ContentOutput.id == co.id).first()
+    return co
@@ -3,17 +3,17 @@
 from __future__ import annotations
 
 import uuid
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from sqlalchemy.orm import Session
 
 from backend.database import get_db
 from backend.models.content_template import ContentTemplate
 from backend.models.user import User
-from backend.routes.auth import get_current_user
-from backend.utils import utc_isoformat
+from backend.routes.auth import get_current_user, reload_user
+from backend.utils import UtcDatetime
 
 router = APIRouter()
 
@@ -46,33 +46,27 @@ class TemplateUpdate(BaseModel):
 
 
 class TemplateResponse(BaseModel):
-    id: str
+    id: uuid.UUID
     content_type: str
     name: str
     description: Optional[str] = None
-    sections: Optional[list[dict]] = None
+    sections: list[dict] = []
     doc_name_pattern: Optional[str] = None
     is_active: bool
-    created_at: str
-    updated_at: str
+    created_at: UtcDatetime
+    updated_at: UtcDatetime
 
+    model_config = {"from_attributes": True}
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
+    @field_validator("sections", mode="before")
+    @classmethod
+    def _null_sections_as_empty(cls, value: Any) -> Any:
+        return [] if value is None else value
 
-def _template_to_response(t: ContentTemplate) -> dict:
-    return {
-        "id": str(t.id),
-        "content_type": t.content_type,
-        "name": t.name,
-        "description": t.description,
-        "sections": t.sections or [],
-        "doc_name_pattern": t.doc_name_pattern,
-        "is_active": t.is_active,
-        "created_at": utc_isoformat(t.created_at),
-        "updated_at": utc_isoformat(t.updated_at),
-    }
+
+class TemplateDeleteResponse(BaseModel):
+    ok: bool
+    id: str
 
 
 # ---------------------------------------------------------------------------
@@ -88,17 +82,16 @@ def list_templates(
     query = db.query(ContentTemplate)
     if not include_inactive:
         query = query.filter(ContentTemplate.is_active == True)
-    templates = query.order_by(ContentTemplate.name).all()
-    return [_template_to_response(t) for t in templates]
+    return query.order_by(ContentTemplate.name).all()
 
 
 @router.get("/{template_id}", response_model=TemplateResponse)
-def get_template(template_id: str, db: Session = Depends(get_db)):
+def get_template(template_id: uuid.UUID, db: Session = Depends(get_db)):
     """Get a single content template by ID."""
-    t = db.query(ContentTemplate).filter(ContentTemplate.id == uuid.UUID(template_id)).first()
+    t = db.query(ContentTemplate).filter(ContentTemplate.id == template_id).first()
     if not t:
         raise HTTPException(status_code=404, detail="Template not found")
-    return _template_to_response(t)
+    return t
 
 
 @router.post("", response_model=TemplateResponse, status_code=201)
@@ -108,6 +101,7 @@ def create_template(
     current_user: User = Depends(get_current_user),
 ):
     """Create a new content template. Admin only."""
+    current_user = reload_user(db, current_user)
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Only admins can create templates")
 
@@ -117,57 +111,59 @@ def create_template(
         raise HTTPException(status_code=409, detail=f"Template with content_type '{body.content_type}' already exists")
 
     t = ContentTemplate(
-        id=uuid.uuid4(),
         content_type=body.content_type,
         name=body.name,
         description=body.description,
-        sections=[s.model_dump() for s in body.sections] if body.sections else [],
+        sections=body.model_dump(include={"sections"})["sections"],
         doc_name_pattern=body.doc_name_pattern,
         is_active=True,
     )
     db.add(t)
     db.commit()
     db.refresh(t)
-    return _template_to_response(t)
+    return t
 
 
 @router.put("/{template_id}", response_model=TemplateResponse)
 def update_template(
-    template_id: str,
+    template_id: uuid.UUID,
     body: TemplateUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Update a content template. Admin only."""
+    current_user = reload_user(db, current_user)
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Only admins can update templates")
 
-    t = db.query(ContentTemplate).filter(ContentTemplate.id == uuid.UUID(template_id)).first()
+    t = db.query(ContentTemplate).filter(ContentTemplate.id == template_id).first()
     if not t:
         raise HTTPException(status_code=404, detail="Template not found")
 
-    update_data = body.model_dump(exclude_unset=True)
-    if "sections" in update_data and update_data["sections"] is not None:
-        update_data["sections"] = [s.model_dump() if hasattr(s, "model_dump") else s for s in body.sections]
+    update_data = body.model_dump(exclude_unset=True, exclude={"sections"})
+    if "sections" in body.model_fields_set:
+        # Dumped separately: exclude_unset would also drop section defaults.
+        update_data["sections"] = body.model_dump(include={"sections"})["sections"]
     for field, value in update_data.items():
         setattr(t, field, value)
 
     db.commit()
     db.refresh(t)
-    return _template_to_response(t)
+    return t
 
 
-@router.delete("/{template_id}", status_code=200)
+@router.delete("/{template_id}", status_code=200, response_model=TemplateDeleteResponse)
 def delete_template(
-    template_id: str,
+    template_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Soft-delete a content template (set is_active=false). Admin only."""
+    current_user = reload_user(db, current_user)
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Only admins can delete templates")
 
-    t = db.query(ContentTemplate).filter(ContentTemplate.id == uuid.UUID(template_id)).first()
+    t = db.query(ContentTemplate).filter(ContentTemplate.id == template_id).first()
     if not t:
         raise HTTPException(status_code=404, detail="Template not found")
 
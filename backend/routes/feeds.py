@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 import feedparser
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
@@ -13,7 +12,7 @@ from sqlalchemy.orm import Session, joinedload
 
 from backend.database import get_db, SessionLocal
 from backend.models.feed import RSSFeed
-from backend.utils import utc_isoformat
+from backend.utils import run_coroutine, utc_isoformat
 from backend.models.feed_item import FeedItem
 from backend.models.competitor import Competitor
 from backend.models.twitter_source_config import TwitterSourceConfig
@@ -33,7 +32,7 @@ router = APIRouter()
 class FeedCreate(BaseModel):
     name: str
     url: Optional[str] = None
-    competitor_id: Optional[str] = None
+    competitor_id: Optional[uuid.UUID] = None
     feed_type: Optional[str] = "rss"
     css_selector: Optional[str] = None
     # Twitter-specific fields
@@ -46,7 +45,8 @@ class FeedCreate(BaseModel):
 class FeedUpdate(BaseModel):
     name: Optional[str] = None
     url: Optional[str] = None
-    competitor_id: Optional[str] = None
+    # "" detaches the feed from its competitor.
+    competitor_id: Optional[uuid.UUID | Literal[""]] = None
     is_active: Optional[bool] = None
     feed_type: Optional[str] = None
     css_selector: Optional[str] = None
@@ -236,7 +236,7 @@ def create_feed(
     # Validate competitor_id if provided
     competitor_id_val = None
     if body.competitor_id:
-        comp = db.query(Competitor).filter(Competitor.id == uuid.UUID(body.competitor_id)).first()
+        comp = db.query(Competitor).filter(Competitor.id == body.competitor_id).first()
         if not comp:
             raise HTTPException(status_code=404, detail="Competitor not found.")
         competitor_id_val = comp.id
@@ -261,27 +261,11 @@ def create_feed(
         clean_username = body.x_username.lstrip("@").strip()
 
         # Resolve username to get x_user_id synchronously
-        ingester = TwitterIngester()
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    user_data = pool.submit(
-                        asyncio.run,
-                        ingester.resolve_username(clean_username),
-                    ).result()
-            else:
-                user_data = loop.run_until_complete(
-                    ingester.resolve_username(clean_username)
-                )
-        except RuntimeError:
-            user_data = asyncio.run(ingester.resolve_username(clean_username))
+        user_data = run_coroutine(_resolve_twitter_username(clean_username))
 
         x_user_id = user_data["id"]
 
         twitter_config = TwitterSourceConfig(
-            id=uuid.uuid4(),
             feed_id=feed_id,
             x_username=clean_username,
             x_user_id=x_user_id,
@@ -309,31 +293,24 @@ def create_feed(
 
 
 
+async def _resolve_twitter_username(username: str) -> dict:
+    ingester = TwitterIngester()
+    try:
+        return await ingester.resolve_username(username)
+    finally:
+        await ingester.close()
+
+
 @router.post("/validate-twitter", response_model=ValidateTwitterResponse)
-def validate_twitter(body: ValidateTwitterRequest):
+async def validate_twitter(body: ValidateTwitterRequest):
     """Validate a Twitter/X username by resolving it via the X API.
 
     Returns user info if valid, or an error message if not found / API error.
+    Pure HTTP with no database work, so it awaits on the event loop instead of
+    occupying a worker thread.
     """
-    ingester = TwitterIngester()
-
-    async def _resolve():
-        try:
-            return await ingester.resolve_username(body.username)
-        finally:
-            await ingester.close()
-
     try:
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    user_data = pool.submit(asyncio.run, _resolve()).result()
-            else:
-                user_data = loop.run_until_complete(_resolve())
-        except RuntimeError:
-            user_data = asyncio.run(_resolve())
+        user_data = await _resolve_twitter_username(body.username)
 
         metrics = user_data.get("public_metrics", {})
         return {
@@ -360,12 +337,12 @@ def validate_twitter(body: ValidateTwitterRequest):
 
 
 @router.put("/{feed_id}", response_model=FeedResponse)
-def update_feed(feed_id: str, body: FeedUpdate, db: Session = Depends(get_db)):
+def update_feed(feed_id: uuid.UUID, body: FeedUpdate, db: Session = Depends(get_db)):
     """Update an existing feed."""
     feed = (
         db.query(RSSFeed)
         .options(joinedload(RSSFeed.competitor), joinedload(RSSFeed.twitter_config))
-        .filter(RSSFeed.id == uuid.UUID(feed_id))
+        .filter(RSSFeed.id == feed_id)
         .first()
     )
     if not feed:
@@ -383,7 +360,7 @@ def update_feed(feed_id: str, body: FeedUpdate, db: Session = Depends(get_db)):
         if body.competitor_id == "":
             feed.competitor_id = None
         else:
-            comp = db.query(Competitor).filter(Competitor.id == uuid.UUID(body.competitor_id)).first()
+            comp = db.query(Competitor).filter(Competitor.id == body.competitor_id).first()
             if not comp:
                 raise HTTPException(status_code=404, detail="Competitor not found.")
             feed.competitor_id = comp.id
@@ -409,9 +386,9 @@ def update_feed(feed_id: str, body: FeedUpdate, db: Session = Depends(get_db)):
 
 
 @router.delete("/{feed_id}", status_code=204)
-def delete_feed(feed_id: str, db: Session = Depends(get_db)):
+def delete_feed(feed_id: uuid.UUID, db: Session = Depends(get_db)):
     """Soft-delete a feed by setting is_active=False."""
-    feed = db.query(RSSFeed).filter(RSSFeed.id == uuid.UUID(feed_id)).first()
+    feed = db.query(RSSFeed).filter(RSSFeed.id == feed_id).first()
     if not feed:
         raise HTTPException(status_code=404, detail="Feed not found.")
 
@@ -421,9 +398,9 @@ def delete_feed(feed_id: str, db: Session = Depends(get_db)):
 
 
 @router.post("/{feed_id}/test", response_model=TestFeedResponse)
-def test_feed(feed_id: str, db: Session = Depends(get_db)):
+def test_feed(feed_id: uuid.UUID, db: Session = Depends(get_db)):
     """Test-fetch an existing feed's URL and report success/failure with item count."""
-    feed = db.query(RSSFeed).filter(RSSFeed.id == uuid.UUID(feed_id)).first()
+    feed = db.query(RSSFeed).filter(RSSFeed.id == feed_id).first()
     if not feed:
         raise HTTPException(status_code=404, detail="Feed not found.")
 
@@ -473,26 +450,11 @@ def _test_web_scrape_url(url: str, css_selector: str | None = None) -> dict:
 
     This is lightweight — it does NOT crawl individual articles, so it completes quickly.
     """
-    import asyncio
     from backend.services.web_scraper import WebScraper
 
     try:
         scraper = WebScraper()
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    result = pool.submit(
-                        asyncio.run,
-                        scraper.test_listing(url, css_selector),
-                    ).result()
-            else:
-                result = loop.run_until_complete(
-                    scraper.test_listing(url, css_selector)
-                )
-        except RuntimeError:
-            result = asyncio.run(scraper.test_listing(url, css_selector))
+        result = run_coroutine(scraper.test_listing(url, css_selector))
 
         if not result.get("valid"):
             return {
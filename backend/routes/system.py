@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from backend.database import get_db, SessionLocal
+from backend.check_run_events import check_run_listener
+from backend.database import get_db, pool_stats, SessionLocal
 from backend.utils import utc_isoformat
 from backend.models.check_run import CheckRun
-from backend.services.briefing_generator import BriefingGenerator
+from backend.services.briefing_generator import BriefingGenerator, analysis_pending
 from backend.services.feed_checker import FeedChecker
 from backend.services.llm_analyzer import LLMAnalyzer
 from backend.services.profile_reviewer import ProfileReviewer
@@ -72,6 +74,7 @@ def _check_run_to_response(
 def _run_background_analysis(
     check_run_id: str,
     generate_briefing: bool,
+    batch: bool = False,
 ) -> None:
     """Background task: run LLM analysis and optional briefing generation.
 
@@ -83,18 +86,24 @@ def _run_background_analysis(
     try:
         # LLM analysis
         analyzer = LLMAnalyzer()
-        cards_generated = analyzer.process_unprocessed_items(
-            db, check_run_id=_uuid.UUID(check_run_id),
-        )
-        logger.info("Background LLM analysis complete: %d cards generated for check_run %s", cards_generated, check_run_id)
-
-        # Update check_run with analysis results
         check_run = db.query(CheckRun).filter(CheckRun.id == _uuid.UUID(check_run_id)).first()
-        if check_run:
-            check_run.cards_generated = cards_generated
+        if batch and check_run:
+            # Records cards_generated on each run as its batch is collected.
+            cards_generated = analyzer.process_unprocessed_items_batched(db, check_run)
+        else:
+            cards_generated = analyzer.process_unprocessed_items(
+                db, check_run_id=_uuid.UUID(check_run_id),
+            )
+            # Update check_run with analysis results
+            if check_run:
+                check_run.cards_generated = cards_generated
+        logger.info("Background LLM analysis complete: %d cards generated for check_run %s", cards_generated, check_run_id)
 
-        # Briefing generation if requested
-        if generate_briefing:
+        # Briefing generation if requested, unless the batch is still out;
+        # a briefing now would miss its cards.
+        if generate_briefing and analysis_pending(db):
+            logger.info("Skipping briefing: card-analysis batch for check_run %s still processing", check_run_id)
+        elif generate_briefing:
             try:
                 generator = BriefingGenerator()
                 briefing = generator.generate_briefing(db)
@@ -116,6 +125,7 @@ def _run_background_analysis(
 def trigger_check_feeds(
     background_tasks: BackgroundTasks,
     generate_briefing: bool = Query(False, description="Generate a morning briefing after the feed check"),
+    batch: bool = Query(False, description="Evaluate new items through the Message Batches API (scheduled runs)"),
     db: Session = Depends(get_db),
 ):
     """Trigger a full feed check run.
@@ -126,6 +136,10 @@ def trigger_check_feeds(
 
     Pass generate_briefing=true to also generate a daily briefing from recent cards
     (intended for the 9:05 AM morning run).
+
+    Pass batch=true from Cloud Scheduler to evaluate items as one Message Batch:
+    half the token cost and no rate-limit pacing, but cards arrive minutes
+    later instead of item by item. Manual "run now" checks leave it off.
     """
     try:
         checker = FeedChecker(db)
@@ -138,6 +152,7 @@ def trigger_check_feeds(
                 _run_background_analysis,
                 check_run_id=str(check_run.id),
                 generate_briefing=generate_briefing,
+                batch=batch,
             )
             analysis_status = "pending"
         else:
@@ -167,6 +182,29 @@ def list_check_runs(
     return [_check_run_to_response(cr) for cr in runs]
 
 
+@router.websocket("/check-runs/stream")
+async def stream_check_runs(websocket: WebSocket):
+    """Push {"id", "status", "cards_generated"} whenever a check run is created or updated."""
+    await websocket.accept()
+    with check_run_listener.subscribe() as events:
+
+        async def forward() -> None:
+            while True:
+                await websocket.send_text(await events.get())
+
+        sender = asyncio.create_task(forward())
+        try:
+            # Nothing is expected from the client; this returns when it disconnects.
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            sender.cancel()
+            (result,) = await asyncio.gather(sender, return_exceptions=True)
+            if isinstance(result, Exception):
+                logger.warning("Check run stream sender failed: %r", result)
+
 
 # ---------------------------------------------------------------------------
 # Profile Review
@@ -300,4 +338,22 @@ def upsert_kv_setting(key: str, body: KVSettingUpdate, db: Session = Depends(get
         db.add(setting)
     db.commit()
     db.refresh(setting)
-    return {"key": setting.key, "value": setting.value}
\ No newline at end of file
+    return {"key": setting.key, "value": setting.value}
+
+
+# ---------------------------------------------------------------------------
+# Database pool monitoring
+# ---------------------------------------------------------------------------
+
+class PoolStatsResponse(BaseModel):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    status: str
+
+
+@router.get("/db-pool", response_model=PoolStatsResponse)
+def get_db_pool_stats():
+    """Current connection pool usage, for monitoring and pool sizing."""
+    return pool_stats()
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
 
 from authlib.integrations.starlette_client import OAuth
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 
+from backend.cache import user_cache
 from backend.config import settings
 from backend.models.user import User
 from backend.utils import utc_isoformat
@@ -40,6 +40,29 @@ def validate_domain(email: str) -> bool:
     return domain == settings.ALLOWED_DOMAIN.lower()
 
 
+# Cached per signed-in user. The OAuth tokens stay out of process memory;
+# code that needs them (Google Docs publishing) re-reads the row.
+_CACHED_USER_COLUMNS = ("id", "email", "name", "role", "google_id", "created_at", "updated_at")
+
+
+def get_user_cached(db: Session, user_id: str) -> User | None:
+    """Return the user with this id, from user_cache when possible.
+
+    A cache hit is a fresh detached User carrying the cached columns; reading
+    an uncached column (the tokens) on it raises DetachedInstanceError.
+    """
+    values = user_cache.get(user_id)
+    if values is None:
+        user = db.get(User, uuid.UUID(user_id))
+        if user is not None:
+            user_cache.set(user_id, {column: getattr(user, column) for column in _CACHED_USER_COLUMNS})
+        return user
+
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
+
 def get_or_create_user(db: Session, google_id: str, email: str, name: str) -> User:
     """Find existing user by google_id or create a new one.
 
@@ -50,7 +73,6 @@ def get_or_create_user(db: Session, google_id: str, email: str, name: str) -> Us
         # Update name/email in case they changed in Google
         user.name = name
         user.email = email
-        user.updated_at = datetime.now(timezone.utc)
         db.commit()
         db.refresh(user)
         return user
@@ -60,7 +82,6 @@ def get_or_create_user(db: Session, google_id: str, email: str, name: str) -> Us
     if user is not None:
         user.google_id = google_id
         user.name = name
-        user.updated_at = datetime.now(timezone.utc)
         db.commit()
         db.refresh(user)
         return user
@@ -68,7 +89,6 @@ def get_or_create_user(db: Session, google_id: str, email: str, name: str) -> Us
     # Create new user
     role = "admin" if email.lower() in ADMIN_EMAILS else "viewer"
     user = User(
-        id=uuid.uuid4(),
         email=email,
         name=name,
         role=role,
@@ -2,23 +2,25 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import random
+import threading
 import time
-import uuid
 from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
-import anthropic
+import orjson
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from backend.config import settings
+from backend.database import SessionLocal
 from backend.models.analysis_card import AnalysisCard
-from backend.models.augment_profile import AugmentProfile
 from backend.models.briefing import Briefing, BriefingCard
-from backend.models.competitor import Competitor
+from backend.models.check_run import CheckRun
+from backend.models.loaders import CARD_LOADS
 from backend.prompts.briefing import build_briefing_prompt
+from backend.services.profile_context import get_prompt_context
 from backend.utils import utc_isoformat
 
 logger = logging.getLogger(__name__)
@@ -28,11 +30,35 @@ MAX_RETRIES = 5
 BASE_DELAY = 15  # seconds
 RATE_LIMIT_MIN_DELAY = 60  # minimum seconds to wait on rate limit (per-minute quota)
 
+# Cards from this far back go into a briefing.
+RECENT_CARD_WINDOW = timedelta(hours=24)
+
+# After a failed on-demand generation, the day is reported "failed" for this
+# long instead of being queued again on the next poll.
+FAILED_RETRY_COOLDOWN = 600  # seconds
+
+# Caps outbound briefing calls per process. Generations run in threadpool
+# threads (background tasks), so this is a thread semaphore.
+_inflight = threading.BoundedSemaphore(settings.BRIEFING_MAX_INFLIGHT)
+
+# Dates with an on-demand generation running in this process, so repeated
+# POST /api/briefings/generate calls do not queue a second Claude call.
+# Another worker can still start its own; the unique briefing date keeps
+# that one from being stored twice.
+_generating: set[date] = set()
+_generating_lock = threading.Lock()
+
+# Dates whose last on-demand generation failed, with the monotonic time of
+# the failure. Guarded by _generating_lock.
+_failed: dict[date, float] = {}
+
 
 class BriefingGenerator:
     """Generates daily morning briefings from recent analysis cards."""
 
     def __init__(self) -> None:
+        import anthropic  # deferred: the SDK takes over a second to import
+
         self.client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
 
     # ------------------------------------------------------------------
@@ -59,8 +85,7 @@ class BriefingGenerator:
             return None
 
         # Load context
-        augment_profile_text = self._load_augment_profile(db)
-        competitor_profiles_text = self._load_competitor_profiles(db)
+        augment_profile_text, competitor_profiles_text = get_prompt_context(db)
 
         # Build card summaries for the prompt
         cards_json = self._cards_to_json(cards)
@@ -76,7 +101,6 @@ class BriefingGenerator:
 
         # Create the briefing record
         briefing = Briefing(
-            id=uuid.uuid4(),
             date=today,
             content=briefing_content,
             raw_llm_output={"content": briefing_content, "model": MODEL},
@@ -85,13 +109,11 @@ class BriefingGenerator:
         db.add(briefing)
         db.flush()
 
-        # Link constituent analysis cards
-        for card in cards:
-            link = BriefingCard(
-                briefing_id=briefing.id,
-                analysis_card_id=card.id,
-            )
-            db.add(link)
+        # Link constituent analysis cards with one multi-row INSERT
+        db.execute(
+            insert(BriefingCard),
+            [{"briefing_id": briefing.id, "analysis_card_id": card.id} for card in cards],
+        )
 
         db.commit()
         db.refresh(briefing)
@@ -107,56 +129,22 @@ class BriefingGenerator:
 
     def _gather_recent_cards(self, db: Session) -> list[AnalysisCard]:
         """Get all analysis cards from the past 24 hours."""
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
+        cutoff = datetime.now(timezone.utc) - RECENT_CARD_WINDOW
         cards = (
             db.query(AnalysisCard)
+            .options(*CARD_LOADS)
             .filter(AnalysisCard.created_at >= cutoff)
             .order_by(AnalysisCard.created_at.desc())
             .all()
         )
         return cards
 
-    def _load_augment_profile(self, db: Session) -> str:
-        """Load the Augment company profile as text."""
-        profile = db.query(AugmentProfile).first()
-        if not profile:
-            return "No Augment profile configured yet."
-        return (
-            f"Company: {profile.company_description}\n"
-            f"Differentiators: {profile.key_differentiators}\n"
-            f"Target Customers: {profile.target_customer_segments}\n"
-            f"Capabilities: {profile.product_capabilities}\n"
-            f"Strategic Priorities: {profile.strategic_priorities}\n"
-            f"Pricing: {profile.pricing}"
-        )
-
-    def _load_competitor_profiles(self, db: Session) -> str:
-        """Load all active competitor profiles as text."""
-        competitors = (
-            db.query(Competitor)
-            .filter(Competitor.is_active == True)  # noqa: E712
-            .order_by(Competitor.name)
-            .all()
-        )
-        if not competitors:
-            return "No competitors configured yet."
-        parts: list[str] = []
-        for c in competitors:
-            parts.append(
-                f"--- {c.name} ---\n"
-                f"Description: {c.description}\n"
-                f"Key Products: {c.key_products}\n"
-                f"Target Customers: {c.target_customers}\n"
-                f"Strengths: {c.known_strengths}\n"
-                f"Weaknesses: {c.known_weaknesses}\n"
-                f"Overlap with Augment: {c.augment_overlap}\n"
-                f"Pricing: {c.pricing}"
-            )
-        return "\n\n".join(parts)
-
-
     def _cards_to_json(self, cards: list[AnalysisCard]) -> str:
-        """Serialize analysis cards to a JSON string for the LLM prompt."""
+        """Serialize analysis cards to a JSON string for the LLM prompt.
+
+        orjson writes non-ASCII text as UTF-8 rather than \\u escapes, which
+        also keeps competitor names readable (and shorter) in the prompt.
+        """
         card_dicts: list[dict[str, Any]] = []
         for card in cards:
             competitor_names = []
@@ -174,7 +162,7 @@ class BriefingGenerator:
                 "competitors": competitor_names,
                 "created_at": utc_isoformat(card.created_at),
             })
-        return json.dumps(card_dicts, indent=2)
+        return orjson.dumps(card_dicts, option=orjson.OPT_INDENT_2).decode()
 
     def _call_claude(self, system_prompt: str, user_prompt: str) -> str:
         """Call Claude API with rate-limit-aware retry.
@@ -182,14 +170,17 @@ class BriefingGenerator:
         For RateLimitError (429): waits at least 60s (per-minute quota) plus jitter.
         For other APIErrors: uses exponential backoff with BASE_DELAY.
         """
+        import anthropic
+
         for attempt in range(MAX_RETRIES):
             try:
-                message = self.client.messages.create(
-                    model=MODEL,
-                    max_tokens=4096,
-                    system=system_prompt,
-                    messages=[{"role": "user", "content": user_prompt}],
-                )
+                with _inflight:
+                    message = self.client.messages.create(
+                        model=MODEL,
+                        max_tokens=4096,
+                        system=system_prompt,
+                        messages=[{"role": "user", "content": user_prompt}],
+                    )
                 response_text = message.content[0].text
                 logger.info(
                     "Briefing Claude API call: input_tokens=%d, output_tokens=%d",
@@ -218,4 +209,60 @@ class BriefingGenerator:
                     time.sleep(delay)
                 else:
                     raise
-        raise RuntimeError("Exhausted retries calling Claude API for briefing")
\ No newline at end of file
+        raise RuntimeError("Exhausted retries calling Claude API for briefing")
+
+
+def has_recent_cards(db: Session) -> bool:
+    """Whether any analysis card is recent enough to go into a briefing."""
+    cutoff = datetime.now(timezone.utc) - RECENT_CARD_WINDOW
+    return db.query(AnalysisCard.id).filter(AnalysisCard.created_at >= cutoff).first() is not None
+
+
+def analysis_pending(db: Session) -> bool:
+    """Whether a card-analysis batch is still out; its cards belong in the briefing."""
+    return db.query(CheckRun.id).filter(CheckRun.llm_batch_id.isnot(None)).first() is not None
+
+
+def generation_failed(day: date) -> bool:
+    """Whether day's last generation here failed within FAILED_RETRY_COOLDOWN."""
+    with _generating_lock:
+        failed_at = _failed.get(day)
+        return failed_at is not None and time.monotonic() - failed_at < FAILED_RETRY_COOLDOWN
+
+
+def claim_generation(day: date) -> bool:
+    """Mark day's generation as running here; False if it already is."""
+    with _generating_lock:
+        if day in _generating:
+            return False
+        _generating.add(day)
+        return True
+
+
+def _record_failure(day: date) -> None:
+    with _generating_lock:
+        # Only the current day is ever polled; drop earlier ones.
+        _failed.clear()
+        _failed[day] = time.monotonic()
+
+
+def generate_briefing_task(day: date) -> None:
+    """Background task: generate day's briefing in a session of its own.
+
+    Releases the claim taken with claim_generation() when done. A failure
+    is recorded so generation_failed() reports it during the cooldown.
+    """
+    db = SessionLocal()
+    try:
+        briefing = BriefingGenerator().generate_briefing(db)
+        if briefing:
+            logger.info("Background briefing generated: %s", briefing.id)
+        else:
+            logger.info("No briefing generated (no recent cards)")
+    except Exception:
+        logger.exception("Background briefing generation failed")
+        _record_failure(day)
+    finally:
+        db.close()
+        with _generating_lock:
+            _generating.discard(day)
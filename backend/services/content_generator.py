@@ -9,13 +9,13 @@ import time
 import uuid
 from typing import Any
 
-import anthropic
 from sqlalchemy.orm import Session
 
 from backend.config import settings
 from backend.models.analysis_card import AnalysisCard, AnalysisCardCompetitor
-from backend.models.augment_profile import AugmentProfile
 from backend.models.competitor import Competitor
+from backend.models.content_template import ContentTemplate
+from backend.services.profile_context import load_augment_profile_text
 from backend.utils import utc_isoformat
 
 logger = logging.getLogger(__name__)
@@ -31,6 +31,8 @@ class ContentGenerator:
     """Generates battle card content from competitor profiles and approved analysis cards."""
 
     def __init__(self) -> None:
+        import anthropic  # deferred: the SDK takes over a second to import
+
         self.client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
 
     # ------------------------------------------------------------------
@@ -40,11 +42,19 @@ class ContentGenerator:
     def generate_content(
         self,
         db: Session,
-        competitor_id: uuid.UUID,
-        template_id: uuid.UUID,
+        competitor: Competitor,
+        template: ContentTemplate,
     ) -> dict[str, Any]:
         """Generate content for a competitor using a content template.
 
+        The caller passes the competitor and template rows it has already
+        loaded and validated.
+
+        Commits the session once the prompt is built and before calling
+        Claude, so no pooled connection sits idle in a transaction through
+        the call. The commit expires the caller's loaded rows; callers must
+        have nothing pending that they mean to roll back.
+
         Returns a dict with:
             - content: JSON string of per-section generated content
             - raw_llm_output: full LLM response metadata
@@ -52,19 +62,10 @@ class ContentGenerator:
             - competitor_id: the competitor UUID
             - content_type: the template name/type
         """
-        # Load competitor
-        competitor = db.query(Competitor).filter(Competitor.id == competitor_id).first()
-        if not competitor:
-            raise ValueError(f"Competitor not found: {competitor_id}")
-
-        # Load template (imported inside method to avoid circular/timing issues)
-        from backend.models.content_template import ContentTemplate
-        template = db.query(ContentTemplate).filter(ContentTemplate.id == template_id).first()
-        if not template:
-            raise ValueError(f"Content template not found: {template_id}")
+        competitor_id = competitor.id
 
         # Load Augment profile
-        augment_profile_text = self._load_augment_profile(db)
+        augment_profile_text = load_augment_profile_text(db)
 
         # Load approved analysis cards for this competitor
         cards = self._load_approved_cards(db, competitor_id)
@@ -82,6 +83,12 @@ class ContentGenerator:
             sections=sections,
         )
 
+        content_type = template.name
+
+        # Everything the prompt needs is loaded. End the read transaction so
+        # the pooled connection is not held idle through a minutes-long call.
+        db.commit()
+
         # Call Claude
         raw_response = self._call_claude(prompt)
         parsed = self._parse_json_response(raw_response)
@@ -96,27 +103,13 @@ class ContentGenerator:
             },
             "source_card_ids": source_card_ids,
             "competitor_id": str(competitor_id),
-            "content_type": template.name if hasattr(template, "name") else str(template_id),
+            "content_type": content_type,
         }
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _load_augment_profile(self, db: Session) -> str:
-        """Load the Augment company profile as text."""
-        profile = db.query(AugmentProfile).first()
-        if not profile:
-            return "No Augment profile configured yet."
-        return (
-            f"Company: {profile.company_description}\n"
-            f"Differentiators: {profile.key_differentiators}\n"
-            f"Target Customers: {profile.target_customer_segments}\n"
-            f"Capabilities: {profile.product_capabilities}\n"
-            f"Strategic Priorities: {profile.strategic_priorities}\n"
-            f"Pricing: {profile.pricing}"
-        )
-
     def _load_approved_cards(self, db: Session, competitor_id: uuid.UUID) -> list[AnalysisCard]:
         """Load all approved analysis cards linked to a competitor, newest first."""
         cards = (
@@ -217,6 +210,8 @@ Return ONLY a valid JSON object with section titles as keys and generated conten
         For RateLimitError (429): waits at least 60s (per-minute quota) plus jitter.
         For other APIErrors: uses exponential backoff with BASE_DELAY.
         """
+        import anthropic
+
         for attempt in range(MAX_RETRIES):
             try:
                 message = self.client.messages.create(
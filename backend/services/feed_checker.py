@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 import uuid
 from datetime import datetime, timezone
@@ -11,10 +10,11 @@ from sqlalchemy.orm import Session
 
 from backend.models.check_run import CheckRun
 from backend.models.feed import RSSFeed
-from backend.models.feed_item import FeedItem
+from backend.services.feed_item_loader import insert_feed_items
 from backend.services.llm_analyzer import LLMAnalyzer
 from backend.services.twitter_ingester import TwitterIngester
 from backend.services.web_scraper import WebScraper
+from backend.utils import run_coroutine
 
 logger = logging.getLogger(__name__)
 
@@ -125,7 +125,6 @@ class FeedChecker:
         """Create a new check_run record with status='running'."""
         now = datetime.now(timezone.utc)
         check_run = CheckRun(
-            id=uuid.uuid4(),
             scheduled_time=now,
             started_at=now,
             status="running",
@@ -158,25 +157,15 @@ class FeedChecker:
             error_msg = str(parsed.bozo_exception) if parsed.bozo_exception else "Unknown parse error"
             raise RuntimeError(f"Failed to parse feed: {error_msg}")
 
-        new_count = 0
+        items = []
         for entry in parsed.entries:
             guid = self._extract_guid(entry)
             if not guid:
                 continue
+            items.append(self._entry_to_feed_item(feed.id, entry, guid))
 
-            # Dedup: skip if (feed_id, guid) already exists
-            existing = (
-                self.db.query(FeedItem.id)
-                .filter(FeedItem.feed_id == feed.id, FeedItem.guid == guid)
-                .first()
-            )
-            if existing:
-                continue
-
-            item = self._entry_to_feed_item(feed.id, entry, guid)
-            if item:
-                self.db.add(item)
-                new_count += 1
+        # Dedup on (feed_id, guid) happens in the database
+        new_count = insert_feed_items(self.db, items)
 
         # Success: reset error state, update timestamps
         feed.last_successful_at = now
@@ -204,8 +193,8 @@ class FeedChecker:
             return str(link)
         return None
 
-    def _entry_to_feed_item(self, feed_id: uuid.UUID, entry, guid: str) -> Optional[FeedItem]:
-        """Convert a feedparser entry to a FeedItem model instance."""
+    def _entry_to_feed_item(self, feed_id: uuid.UUID, entry, guid: str) -> dict:
+        """Convert a feedparser entry to a FeedItem-compatible dict."""
         title = getattr(entry, "title", "") or "Untitled"
         link = getattr(entry, "link", "") or ""
 
@@ -218,17 +207,15 @@ class FeedChecker:
         # Content: prefer content field, fall back to summary/description
         raw_content = self._extract_content(entry)
 
-        return FeedItem(
-            id=uuid.uuid4(),
-            feed_id=feed_id,
-            guid=guid,
-            title=title[:500] if title else "Untitled",
-            url=link[:2000] if link else "",
-            author=author[:500] if author else None,
-            published_at=published_at,
-            raw_content=raw_content or "",
-            is_processed=False,
-        )
+        return {
+            "feed_id": feed_id,
+            "guid": guid,
+            "title": title[:500] if title else "Untitled",
+            "url": link[:2000] if link else "",
+            "author": author[:500] if author else None,
+            "published_at": published_at,
+            "raw_content": raw_content or "",
+        }
 
     def _parse_published(self, entry) -> datetime:
         """Parse the published date from a feed entry."""
@@ -289,55 +276,25 @@ class FeedChecker:
             finally:
                 await ingester.close()
 
-        # Run async fetch in sync context
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    tweets = pool.submit(asyncio.run, _fetch()).result()
-            else:
-                tweets = loop.run_until_complete(_fetch())
-        except RuntimeError:
-            tweets = asyncio.run(_fetch())
+        tweets = run_coroutine(_fetch())
 
-        new_count = 0
+        items = []
         latest_tweet_id: str | None = None
 
         for tweet in tweets:
             item_dict = ingester.tweet_to_feed_item(
                 tweet, feed_id=feed.id, x_username=config.x_username,
             )
-            guid = item_dict["guid"]
-
-            # Dedup: skip if (feed_id, guid) already exists
-            existing = (
-                self.db.query(FeedItem.id)
-                .filter(FeedItem.feed_id == feed.id, FeedItem.guid == guid)
-                .first()
-            )
-            if existing:
-                continue
-
-            item = FeedItem(
-                id=uuid.uuid4(),
-                feed_id=item_dict["feed_id"],
-                guid=guid,
-                title=item_dict["title"],
-                url=item_dict["url"],
-                author=item_dict["author"],
-                published_at=item_dict["published_at"],
-                raw_content=item_dict["raw_content"],
-                raw_metadata=item_dict["raw_metadata"],
-                is_processed=False,
-            )
-            self.db.add(item)
-            new_count += 1
+            items.append(item_dict)
 
             # Track the highest tweet ID for since_id on next run
+            guid = item_dict["guid"]
             if latest_tweet_id is None or guid > latest_tweet_id:
                 latest_tweet_id = guid
 
+        # Dedup on (feed_id, guid) happens in the database
+        new_count = insert_feed_items(self.db, items)
+
         # Update config state
         if latest_tweet_id:
             config.last_tweet_id = latest_tweet_id
@@ -0,0 +1,123 @@
+"""Bulk loading of fetched feed items.
+
+Every feed poll produces a batch of candidate items, most of which already
+exist. Rather than one dedup SELECT plus one INSERT per item, the batch is
+written with ``ON CONFLICT (feed_id, guid) DO NOTHING`` in one go. Typical
+polls (a few dozen entries) use a single multi-row ``INSERT ... VALUES``;
+large batches are streamed into a temporary staging table with
+``COPY ... FROM STDIN`` and merged with ``INSERT ... SELECT``.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from backend.models.feed_item import FeedItem
+
+# Below this many rows the staging-table round trips (CREATE, TRUNCATE, COPY,
+# INSERT) cost more than binding every value into one statement.
+COPY_MIN_ROWS = 500
+
+COPY_COLUMNS = (
+    "feed_id", "guid", "title", "url", "author", "published_at", "raw_content", "raw_metadata",
+)
+
+# ON COMMIT DROP keeps pooled connections from accumulating temp tables.
+_CREATE_STAGE_SQL = """
+    CREATE TEMP TABLE IF NOT EXISTS feed_items_stage (
+        feed_id uuid NOT NULL,
+        guid varchar NOT NULL,
+        title varchar,
+        url varchar NOT NULL,
+        author varchar,
+        published_at timestamptz NOT NULL,
+        raw_content text NOT NULL,
+        raw_metadata jsonb
+    ) ON COMMIT DROP
+"""
+
+# Every field is written quoted, so FORCE_NULL is what turns empty values in
+# the nullable columns back into NULLs.
+_COPY_SQL = (
+    f"COPY feed_items_stage ({', '.join(COPY_COLUMNS)}) FROM STDIN "
+    "WITH (FORMAT csv, FORCE_NULL (title, author, raw_metadata))"
+)
+
+_MERGE_SQL = f"""
+    INSERT INTO feed_items ({', '.join(COPY_COLUMNS)}, is_processed)
+    SELECT DISTINCT ON (feed_id, guid) {', '.join(COPY_COLUMNS)}, false
+    FROM feed_items_stage
+    ON CONFLICT (feed_id, guid) DO NOTHING
+"""
+
+
+def _to_csv(items: Iterable[dict[str, Any]]) -> io.StringIO:
+    buf = io.StringIO()
+    writer = csv.writer(buf, quoting=csv.QUOTE_ALL)
+    for item in items:
+        metadata = item.get("raw_metadata")
+        writer.writerow([
+            item["feed_id"],
+            item["guid"],
+            item.get("title"),
+            item.get("url") or "",
+            item.get("author"),
+            item["published_at"].isoformat(),
+            item.get("raw_content") or "",
+            json.dumps(metadata) if metadata is not None else None,
+        ])
+    buf.seek(0)
+    return buf
+
+
+def copy_feed_items(db: Session, items: list[dict[str, Any]]) -> int:
+    """Insert feed item dicts that are not already stored. Returns the number inserted.
+
+    Runs on the session's connection, so the rows commit (or roll back) with
+    the caller's transaction.
+    """
+    if not items:
+        return 0
+
+    with db.connection().connection.cursor() as cursor:
+        cursor.execute(_CREATE_STAGE_SQL)
+        cursor.execute("TRUNCATE feed_items_stage")
+        cursor.copy_expert(_COPY_SQL, _to_csv(items))
+        cursor.execute(_MERGE_SQL)
+        return cursor.rowcount
+
+
+def insert_feed_items(db: Session, items: list[dict[str, Any]]) -> int:
+    """Insert feed item dicts that are not already stored. Returns the number inserted.
+
+    Batches of COPY_MIN_ROWS or more go through copy_feed_items. Either way
+    the rows commit (or roll back) with the caller's transaction.
+    """
+    if not items:
+        return 0
+    if len(items) >= COPY_MIN_ROWS:
+        return copy_feed_items(db, items)
+
+    rows = [
+        {
+            "feed_id": item["feed_id"],
+            "guid": item["guid"],
+            "title": item.get("title"),
+            "url": item.get("url") or "",
+            "author": item.get("author"),
+            "published_at": item["published_at"],
+            "raw_content": item.get("raw_content") or "",
+            "raw_metadata": item.get("raw_metadata"),
+            "is_processed": False,
+        }
+        for item in items
+    ]
+    stmt = insert(FeedItem).values(rows).on_conflict_do_nothing(index_elements=["feed_id", "guid"])
+    return db.execute(stmt).rowcount
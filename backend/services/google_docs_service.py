@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime, timezone
 from typing import Any
@@ -26,6 +25,11 @@ class GoogleDocsService:
         Raises an exception if credentials are missing or publish fails.
         Sets google_doc_id, google_doc_url, published_at, and status on success.
         Does NOT set status on failure — caller handles that.
+
+        Owns its transactions: it commits once after its reads, before the
+        Google API calls, so no pooled connection is held across them, and
+        again to store the result. Callers must have nothing pending that
+        they mean to roll back.
         """
         credentials = self._build_credentials(user)
         if credentials is None:
@@ -36,15 +40,21 @@ class GoogleDocsService:
         docs_service = build("docs", "v1", credentials=credentials)
         drive_service = build("drive", "v3", credentials=credentials)
 
-        sections = self._parse_content(content_output.content)
+        sections = content_output.sections or self._plain_sections(content_output.content)
         title = content_output.title or "Untitled Content"
+        existing_doc_id = content_output.google_doc_id
+        folder_id = None if existing_doc_id else self._get_folder_id(db)
+
+        # End the read transaction so the pooled connection is not held
+        # through the Google API round-trips below.
+        db.commit()
 
-        if content_output.google_doc_id:
-            self._update_existing_doc(docs_service, content_output.google_doc_id, title, sections)
-            logger.info("Updated existing Google Doc: %s", content_output.google_doc_id)
+        if existing_doc_id:
+            self._update_existing_doc(docs_service, existing_doc_id, title, sections)
+            logger.info("Updated existing Google Doc: %s", existing_doc_id)
         else:
             doc_id, doc_url = self._create_new_doc(
-                docs_service, drive_service, title, sections, db
+                docs_service, drive_service, title, sections, folder_id
             )
             content_output.google_doc_id = doc_id
             content_output.google_doc_url = doc_url
@@ -83,15 +93,9 @@ class GoogleDocsService:
             logger.error("Failed to build Google credentials: %s", e)
             return None
 
-    def _parse_content(self, content: str) -> list[dict[str, str]]:
-        """Parse content JSON into a list of {title, body} sections."""
-        try:
-            data = json.loads(content) if isinstance(content, str) else content
-            if isinstance(data, dict):
-                return [{"title": k, "body": v} for k, v in data.items()]
-            return []
-        except (json.JSONDecodeError, TypeError):
-            return [{"title": "Content", "body": str(content)}]
+    def _plain_sections(self, content: str | None) -> list[dict[str, str]]:
+        """Wrap content without stored sections (plain text or markdown) as one section."""
+        return [{"title": "Content", "body": content}] if content else []
 
     def _create_new_doc(
         self,
@@ -99,7 +103,7 @@ class GoogleDocsService:
         drive_service: Any,
         title: str,
         sections: list[dict[str, str]],
-        db: Session,
+        folder_id: str | None,
     ) -> tuple[str, str]:
         """Create a new Google Doc and return (doc_id, doc_url)."""
         # Create the document
@@ -108,7 +112,6 @@ class GoogleDocsService:
         doc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
 
         # Move to folder if configured
-        folder_id = self._get_folder_id(db)
         if folder_id:
             try:
                 drive_service.files().update(
@@ -128,8 +131,6 @@ class GoogleDocsService:
 
         return doc_id, doc_url
 
-
-
     def _update_existing_doc(
         self,
         docs_service: Any,
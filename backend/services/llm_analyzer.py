@@ -10,17 +10,18 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-import anthropic
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session, joinedload
 
 from backend.config import settings
 from backend.models.analysis_card import AnalysisCard, AnalysisCardCompetitor
-from backend.models.augment_profile import AugmentProfile
+from backend.models.check_run import CheckRun
 from backend.models.competitor import Competitor
 from backend.models.feed_item import FeedItem
 from backend.models.feed import RSSFeed
 from backend.utils import utc_isoformat
 from backend.prompts.feed_evaluation import build_feed_evaluation_prompt
+from backend.services.profile_context import get_prompt_context
 
 logger = logging.getLogger(__name__)
 
@@ -36,12 +37,17 @@ MAX_RETRIES = 5
 BASE_DELAY = 15  # seconds
 RATE_LIMIT_MIN_DELAY = 60  # minimum seconds to wait on rate limit (per-minute quota)
 INTER_ITEM_DELAY = 3  # seconds between consecutive LLM calls
+BATCH_POLL_INTERVAL = 30  # seconds between Message Batch status checks
+BATCH_POLL_TIMEOUT = 60 * 60  # stop waiting after this; a later run collects the batch
+MAX_BATCH_REQUESTS = 10_000  # API limit is 100k requests / 256 MB per batch
 
 
 class LLMAnalyzer:
     """Evaluates feed items via Claude and creates analysis cards."""
 
     def __init__(self) -> None:
+        import anthropic  # deferred: the SDK takes over a second to import
+
         self.client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
 
     # ------------------------------------------------------------------
@@ -64,8 +70,7 @@ class LLMAnalyzer:
             return 0
 
         # Load context once
-        augment_profile_text = self._load_augment_profile(db)
-        competitor_profiles_text = self._load_competitor_profiles(db)
+        augment_profile_text, competitor_profiles_text = get_prompt_context(db)
 
         cards_created = 0
         for idx, item in enumerate(items):
@@ -90,44 +95,135 @@ class LLMAnalyzer:
         return cards_created
 
     # ------------------------------------------------------------------
-    # Internal helpers
+    # Message Batches (scheduled runs)
     # ------------------------------------------------------------------
 
-    def _load_augment_profile(self, db: Session) -> str:
-        profile = db.query(AugmentProfile).first()
-        if not profile:
-            return "No Augment profile configured yet."
-        return (
-            f"Company: {profile.company_description}\n"
-            f"Differentiators: {profile.key_differentiators}\n"
-            f"Target Customers: {profile.target_customer_segments}\n"
-            f"Capabilities: {profile.product_capabilities}\n"
-            f"Strategic Priorities: {profile.strategic_priorities}\n"
-            f"Pricing: {profile.pricing}"
+    def process_unprocessed_items_batched(self, db: Session, check_run: CheckRun) -> int:
+        """Evaluate unprocessed items as one Message Batch and wait for the results.
+
+        Batched requests cost half as much and skip the per-item rate-limit
+        pacing, but finish in minutes rather than seconds, so this is meant for
+        scheduled runs. Returns the number of cards created; 0 if the batch is
+        still processing after BATCH_POLL_TIMEOUT, in which case a later run
+        collects it.
+        """
+        self.collect_pending_batches(db)
+        batch_id = self.submit_batch(db, check_run)
+        if not batch_id:
+            return 0
+
+        deadline = time.monotonic() + BATCH_POLL_TIMEOUT
+        while time.monotonic() < deadline:
+            # Each status check reads check_run, opening a transaction; end it
+            # so the pooled connection is not left idle in transaction while
+            # waiting.
+            db.commit()
+            time.sleep(BATCH_POLL_INTERVAL)
+            cards_created = self.collect_batch(db, check_run)
+            if cards_created is not None:
+                return cards_created
+        db.commit()
+        logger.warning("Batch %s still processing; a later run will collect it", batch_id)
+        return 0
+
+    def submit_batch(self, db: Session, check_run: CheckRun) -> str | None:
+        """Submit every unprocessed item as one Message Batch. Returns the batch id, if any."""
+        pending = db.query(CheckRun.id).filter(CheckRun.llm_batch_id.isnot(None)).first()
+        if pending is not None:
+            # Its items are still unprocessed; submitting them again would pay twice.
+            logger.info("Earlier batch for check run %s not collected yet; deferring new items", pending.id)
+            return None
+
+        items = (
+            db.query(FeedItem)
+            .options(joinedload(FeedItem.feed))
+            .filter(FeedItem.is_processed == False)  # noqa: E712
+            .limit(MAX_BATCH_REQUESTS)
+            .all()
         )
+        if not items:
+            logger.info("No unprocessed feed items found.")
+            return None
 
-    def _load_competitor_profiles(self, db: Session) -> str:
-        competitors = (
-            db.query(Competitor)
-            .filter(Competitor.is_active == True)  # noqa: E712
-            .order_by(Competitor.name)
+        augment_profile_text, competitor_profiles_text = get_prompt_context(db)
+        requests = []
+        for item in items:
+            system_blocks, prompt = self._build_item_prompt(item, augment_profile_text, competitor_profiles_text)
+            requests.append({
+                "custom_id": str(item.id),
+                "params": {
+                    "model": MODEL,
+                    "max_tokens": 2048,
+                    "system": system_blocks,
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            })
+
+        batch = self.client.messages.batches.create(requests=requests)
+        check_run.llm_batch_id = batch.id
+        db.commit()
+        logger.info("Submitted batch %s with %d feed items", batch.id, len(requests))
+        return batch.id
+
+    def collect_batch(self, db: Session, check_run: CheckRun) -> int | None:
+        """Apply the results of check_run's batch once it has ended.
+
+        Returns the number of cards created, or None while the batch is still
+        processing. Items whose request errored or expired stay unprocessed
+        and are picked up by the next run.
+        """
+        batch = self.client.messages.batches.retrieve(check_run.llm_batch_id)
+        if batch.processing_status != "ended":
+            return None
+
+        results = {
+            result.custom_id: result.result
+            for result in self.client.messages.batches.results(batch.id)
+        }
+        items = (
+            db.query(FeedItem)
+            .filter(FeedItem.id.in_([uuid.UUID(custom_id) for custom_id in results]))
             .all()
         )
-        if not competitors:
-            return "No competitors configured yet."
-        parts: list[str] = []
-        for c in competitors:
-            parts.append(
-                f"--- {c.name} ---\n"
-                f"Description: {c.description}\n"
-                f"Key Products: {c.key_products}\n"
-                f"Target Customers: {c.target_customers}\n"
-                f"Strengths: {c.known_strengths}\n"
-                f"Weaknesses: {c.known_weaknesses}\n"
-                f"Overlap with Augment: {c.augment_overlap}\n"
-                f"Pricing: {c.pricing}"
-            )
-        return "\n\n".join(parts)
+
+        cards_created = 0
+        for item in items:
+            result = results[str(item.id)]
+            if result.type != "succeeded":
+                continue
+            if item.is_processed:
+                # Evaluated by a "run now" check while the batch was queued.
+                continue
+            try:
+                if self._apply_evaluation(db, item, result.message.content[0].text, check_run.id):
+                    cards_created += 1
+            except Exception:
+                logger.exception("Failed to process feed item %s", item.id)
+                item.is_processed = True
+                item.is_relevant = False
+                item.irrelevance_reason = "Processing error"
+                db.commit()
+
+        logger.info(
+            "Collected batch %s: %d succeeded, %d errored, %d expired; %d cards created",
+            batch.id, batch.request_counts.succeeded, batch.request_counts.errored,
+            batch.request_counts.expired, cards_created,
+        )
+        check_run.cards_generated = (check_run.cards_generated or 0) + cards_created
+        check_run.llm_batch_id = None
+        db.commit()
+        return cards_created
+
+    def collect_pending_batches(self, db: Session) -> int:
+        """Collect any ended batches left behind by earlier runs. Returns cards created."""
+        cards_created = 0
+        for check_run in db.query(CheckRun).filter(CheckRun.llm_batch_id.isnot(None)).all():
+            cards_created += self.collect_batch(db, check_run) or 0
+        return cards_created
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
 
     def _process_single_item(
         self,
@@ -138,6 +234,17 @@ class LLMAnalyzer:
         check_run_id: uuid.UUID | None,
     ) -> bool:
         """Process one feed item. Returns True if an analysis card was created."""
+        system_blocks, prompt = self._build_item_prompt(item, augment_profile_text, competitor_profiles_text)
+        raw_response = self._call_claude(system_blocks, prompt)
+        return self._apply_evaluation(db, item, raw_response, check_run_id)
+
+    def _build_item_prompt(
+        self,
+        item: FeedItem,
+        augment_profile_text: str,
+        competitor_profiles_text: str,
+    ) -> tuple[list[dict[str, Any]], str]:
+        """Build the (system_blocks, user_prompt) evaluation prompt for one feed item."""
         feed: RSSFeed = item.feed
         feed_name = feed.name if feed else "Unknown Feed"
 
@@ -158,7 +265,7 @@ class LLMAnalyzer:
             item_title = item.title
             item_content = item.raw_content[:8000]  # Truncate very long content
 
-        prompt = build_feed_evaluation_prompt(
+        return build_feed_evaluation_prompt(
             augment_profile=augment_profile_text,
             competitor_list_with_profiles=competitor_profiles_text,
             feed_name=feed_name,
@@ -168,7 +275,14 @@ class LLMAnalyzer:
             item_published_at=utc_isoformat(item.published_at) or "Unknown",
         )
 
-        raw_response = self._call_claude(prompt)
+    def _apply_evaluation(
+        self,
+        db: Session,
+        item: FeedItem,
+        raw_response: str,
+        check_run_id: uuid.UUID | None,
+    ) -> bool:
+        """Record Claude's verdict on a feed item. Returns True if an analysis card was created."""
         parsed = self._parse_json_response(raw_response)
 
         if parsed is None:
@@ -202,23 +316,31 @@ class LLMAnalyzer:
         logger.info("Created analysis card %s for feed item %s", card.id, item.id)
         return True
 
-    def _call_claude(self, prompt: str) -> str:
+    def _call_claude(self, system: list[dict[str, Any]], prompt: str) -> str:
         """Call Claude API with rate-limit-aware retry.
 
+        ``system`` carries a prompt-cache breakpoint, so consecutive items in a
+        run reuse the cached instructions and profile context.
+
         For RateLimitError (429): waits at least 60s (per-minute quota) plus jitter.
         For other APIErrors: uses exponential backoff with BASE_DELAY.
         """
+        import anthropic
+
         for attempt in range(MAX_RETRIES):
             try:
                 message = self.client.messages.create(
                     model=MODEL,
                     max_tokens=2048,
+                    system=system,
                     messages=[{"role": "user", "content": prompt}],
                 )
                 response_text = message.content[0].text
                 logger.info(
-                    "Claude API call: input_tokens=%d, output_tokens=%d",
+                    "Claude API call: input_tokens=%d, cache_read=%d, cache_write=%d, output_tokens=%d",
                     message.usage.input_tokens,
+                    message.usage.cache_read_input_tokens or 0,
+                    message.usage.cache_creation_input_tokens or 0,
                     message.usage.output_tokens,
                 )
                 return response_text
@@ -281,7 +403,6 @@ class LLMAnalyzer:
         status = "approved" if priority == "green" else "draft"
 
         card = AnalysisCard(
-            id=uuid.uuid4(),
             feed_item_id=item.id,
             event_type=event_type,
             priority=priority,
@@ -304,26 +425,28 @@ class LLMAnalyzer:
         parsed: dict[str, Any],
     ) -> None:
         """Link analysis card to mentioned competitors by name matching."""
-        competitor_names = parsed.get("competitor_names", [])
-        if not competitor_names:
+        names = {name.lower() for name in parsed.get("competitor_names") or [] if isinstance(name, str) and name}
+        if not names:
             return
 
-        for name in competitor_names:
-            # Case-insensitive match
-            competitor = (
-                db.query(Competitor)
+        # One case-insensitive lookup for every name, and one multi-row
+        # INSERT for the links, instead of a query and an INSERT per name.
+        competitor_ids = [
+            competitor_id
+            for (competitor_id,) in (
+                db.query(Competitor.id)
                 .filter(
                     Competitor.is_active == True,  # noqa: E712
-                    Competitor.name.ilike(name),
+                    func.lower(Competitor.name).in_(names),
                 )
-                .first()
+                .all()
+            )
+        ]
+        if competitor_ids:
+            db.execute(
+                insert(AnalysisCardCompetitor),
+                [{"analysis_card_id": card.id, "competitor_id": competitor_id} for competitor_id in competitor_ids],
             )
-            if competitor:
-                link = AnalysisCardCompetitor(
-                    analysis_card_id=card.id,
-                    competitor_id=competitor.id,
-                )
-                db.add(link)
 
     def _handle_suggested_competitor(
         self,
@@ -358,7 +481,6 @@ class LLMAnalyzer:
 
         # Create new suggested competitor
         new_competitor = Competitor(
-            id=uuid.uuid4(),
             name=name,
             description=suggestion.get("description", ""),
             key_products="",
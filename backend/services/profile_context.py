@@ -0,0 +1,134 @@
+"""Augment and competitor profile text for LLM prompts.
+
+Card analysis, briefing generation and content generation all put the same
+profile text into their prompts. It is built once and kept in
+``backend.cache.profile_cache`` until a profile or competitor is written.
+When it is rebuilt, only competitors whose ``updated_at`` moved are re-read
+and re-formatted.
+
+Commit hooks only see writes made by this process, so ``get_prompt_context``
+additionally checks the profiles' timestamps: an edit made through another
+worker is picked up on the next run rather than after the cache TTL.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from backend.cache import profile_cache
+from backend.models.augment_profile import AUGMENT_PROFILE_ID, AugmentProfile
+from backend.models.competitor import Competitor
+
+# Formatted competitor sections keyed by (id, updated_at). The set_updated_at()
+# trigger moves updated_at on every write, so an edited competitor misses.
+_competitor_sections: dict[tuple[uuid.UUID, datetime], str] = {}
+
+# One round trip that changes whenever either prompt text would: any write
+# moves updated_at, deactivation included, and deletes change the count.
+_PROMPT_CONTEXT_PROBE = select(
+    select(AugmentProfile.updated_at).where(AugmentProfile.id == AUGMENT_PROFILE_ID).scalar_subquery(),
+    select(func.max(Competitor.updated_at)).where(Competitor.is_active == True).scalar_subquery(),  # noqa: E712
+    select(func.count()).select_from(Competitor).where(Competitor.is_active == True).scalar_subquery(),  # noqa: E712
+)
+
+# (probe row, (augment text, competitor text)) from the last get_prompt_context.
+_prompt_context: tuple[tuple, tuple[str, str]] | None = None
+
+
+def get_prompt_context(db: Session) -> tuple[str, str]:
+    """Return (augment profile text, competitor profiles text) for a prompt.
+
+    Costs one cheap probe query while neither profile has changed.
+    """
+    global _prompt_context
+    key = tuple(db.execute(_PROMPT_CONTEXT_PROBE).one())
+    cached = _prompt_context
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    context = (
+        _format_augment_profile(db.get(AugmentProfile, AUGMENT_PROFILE_ID)),
+        _build_competitor_profiles_text(db),
+    )
+    profile_cache.set("augment", context[0])
+    profile_cache.set("competitors", context[1])
+    _prompt_context = (key, context)
+    return context
+
+
+def load_augment_profile_text(db: Session) -> str:
+    """Return the Augment company profile as prompt text."""
+    text = profile_cache.get("augment")
+    if text is None:
+        text = _format_augment_profile(db.query(AugmentProfile).first())
+        profile_cache.set("augment", text)
+    return text
+
+
+def load_competitor_profiles_text(db: Session) -> str:
+    """Return all active competitor profiles as prompt text, ordered by name."""
+    text = profile_cache.get("competitors")
+    if text is None:
+        text = _build_competitor_profiles_text(db)
+        profile_cache.set("competitors", text)
+    return text
+
+
+def _build_competitor_profiles_text(db: Session) -> str:
+    # Cheap probe first; full rows are read only for new or edited competitors.
+    keys = [
+        (competitor_id, updated_at)
+        for competitor_id, updated_at in (
+            db.query(Competitor.id, Competitor.updated_at)
+            .filter(Competitor.is_active == True)  # noqa: E712
+            .order_by(Competitor.name)
+            .all()
+        )
+    ]
+    if not keys:
+        return "No competitors configured yet."
+
+    stale = {key[0]: key for key in keys if key not in _competitor_sections}
+    if stale:
+        for competitor in db.query(Competitor).filter(Competitor.id.in_(list(stale))).all():
+            _competitor_sections[stale[competitor.id]] = _format_competitor_profile(competitor)
+
+    # Forget edited, deactivated and deleted competitors. Requests run in a
+    # threadpool, so iterate over a snapshot and tolerate concurrent removals.
+    live = set(keys)
+    for key in list(_competitor_sections):
+        if key not in live:
+            _competitor_sections.pop(key, None)
+
+    # A competitor deleted between the probe and the fetch has no section.
+    return "\n\n".join(_competitor_sections[key] for key in keys if key in _competitor_sections)
+
+
+def _format_augment_profile(profile: AugmentProfile | None) -> str:
+    if not profile:
+        return "No Augment profile configured yet."
+    return (
+        f"Company: {profile.company_description}\n"
+        f"Differentiators: {profile.key_differentiators}\n"
+        f"Target Customers: {profile.target_customer_segments}\n"
+        f"Capabilities: {profile.product_capabilities}\n"
+        f"Strategic Priorities: {profile.strategic_priorities}\n"
+        f"Pricing: {profile.pricing}"
+    )
+
+
+def _format_competitor_profile(c: Competitor) -> str:
+    return (
+        f"--- {c.name} ---\n"
+        f"Description: {c.description}\n"
+        f"Key Products: {c.key_products}\n"
+        f"Target Customers: {c.target_customers}\n"
+        f"Strengths: {c.known_strengths}\n"
+        f"Weaknesses: {c.known_weaknesses}\n"
+        f"Overlap with Augment: {c.augment_overlap}\n"
+        f"Pricing: {c.pricing}"
+    )
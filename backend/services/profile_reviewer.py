@@ -9,7 +9,6 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-import anthropic
 from sqlalchemy.orm import Session
 
 from backend.config import settings
@@ -32,6 +31,8 @@ class ProfileReviewer:
     """Reviews profiles against recent approved analysis cards and generates suggestions."""
 
     def __init__(self, db: Session) -> None:
+        import anthropic  # deferred: the SDK takes over a second to import
+
         self.db = db
         self.client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
 
@@ -222,7 +223,6 @@ class ProfileReviewer:
                 source_ids = []
 
             suggestion = ProfileUpdateSuggestion(
-                id=uuid.uuid4(),
                 target_type=target_type,
                 competitor_id=competitor_id,
                 field=field,
@@ -241,6 +241,8 @@ class ProfileReviewer:
 
     def _call_claude(self, messages: list[dict[str, str]]) -> str:
         """Call Claude API with exponential backoff retry."""
+        import anthropic
+
         for attempt in range(MAX_RETRIES):
             try:
                 message = self.client.messages.create(
@@ -2,10 +2,8 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import re
-import uuid
 from datetime import datetime, timezone
 from typing import Optional
 from urllib.parse import urljoin, urlparse
@@ -13,7 +11,8 @@ from urllib.parse import urljoin, urlparse
 from sqlalchemy.orm import Session
 
 from backend.models.feed import RSSFeed
-from backend.models.feed_item import FeedItem
+from backend.services.feed_item_loader import insert_feed_items
+from backend.utils import run_coroutine
 
 logger = logging.getLogger(__name__)
 
@@ -247,23 +246,7 @@ class WebScraper:
         feed.last_checked_at = now
 
         # Run async scraping from sync context
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    articles = pool.submit(
-                        asyncio.run,
-                        self.scrape_listing(feed.url, feed.css_selector),
-                    ).result()
-            else:
-                articles = loop.run_until_complete(
-                    self.scrape_listing(feed.url, feed.css_selector)
-                )
-        except RuntimeError:
-            articles = asyncio.run(
-                self.scrape_listing(feed.url, feed.css_selector)
-            )
+        articles = run_coroutine(self.scrape_listing(feed.url, feed.css_selector))
 
         if not articles:
             logger.info("No articles found for web scrape feed '%s' (%s)", feed.name, feed.url)
@@ -273,29 +256,20 @@ class WebScraper:
             db.commit()
             return 0
 
-        new_count = 0
-        for article in articles:
-            article_url = article["url"]
-            existing = (
-                db.query(FeedItem.id)
-                .filter(FeedItem.feed_id == feed.id, FeedItem.guid == article_url)
-                .first()
-            )
-            if existing:
-                continue
-            item = FeedItem(
-                id=uuid.uuid4(),
-                feed_id=feed.id,
-                guid=article_url,
-                title=article.get("title", "Untitled")[:500],
-                url=article_url[:2000],
-                author=None,
-                published_at=article.get("published_at", now),
-                raw_content=article.get("content", ""),
-                is_processed=False,
-            )
-            db.add(item)
-            new_count += 1
+        items = [
+            {
+                "feed_id": feed.id,
+                "guid": article["url"],
+                "title": article.get("title", "Untitled")[:500],
+                "url": article["url"][:2000],
+                "author": None,
+                "published_at": article.get("published_at", now),
+                "raw_content": article.get("content", ""),
+            }
+            for article in articles
+        ]
+        # Dedup on (feed_id, guid) happens in the database
+        new_count = insert_feed_items(db, items)
 
         feed.last_successful_at = now
         feed.error_count = 0
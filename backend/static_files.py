@@ -0,0 +1,119 @@
+"""Static file serving for the built frontend."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import stat
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+# Build-time compressed siblings (app.js.br, app.js.gz), in order of preference.
+PRECOMPRESSED_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that remembers successful path lookups for the process lifetime.
+
+    The built frontend does not change while the container is running (Vite
+    emits content-hashed asset names), so a cached ``os.stat`` result never
+    goes stale. Serving from the cache skips the per-request stat and the
+    worker-thread hop Starlette uses for it. Misses are not cached, so probing
+    for nonexistent paths cannot grow the cache.
+
+    When the client accepts it, a precompressed ``.br`` or ``.gz`` sibling
+    written by the frontend build is served instead of the original, with the
+    original's content type.
+
+    ``cache_control``, if given, is sent on every file served.
+    """
+
+    def __init__(self, *args, cache_control: str | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+        self._lookup_cache: dict[str, tuple[str, os.stat_result]] = {}
+        self._precompressed: dict[str, tuple[tuple[str, str, os.stat_result], ...]] = {}
+
+    def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
+        cached = self._lookup_cache.get(path)
+        if cached is not None:
+            return cached
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is not None:
+            if stat.S_ISREG(stat_result.st_mode):
+                self._precompressed[full_path] = self._find_precompressed(full_path)
+            self._lookup_cache[path] = (full_path, stat_result)
+        return full_path, stat_result
+
+    @staticmethod
+    def _find_precompressed(full_path: str) -> tuple[tuple[str, str, os.stat_result], ...]:
+        variants = []
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES:
+            try:
+                stat_result = os.stat(full_path + suffix)
+            except OSError:
+                continue
+            if stat.S_ISREG(stat_result.st_mode):
+                variants.append((encoding, full_path + suffix, stat_result))
+        return tuple(variants)
+
+    def file_response(
+        self, full_path: str, stat_result: os.stat_result, scope: Scope, status_code: int = 200
+    ) -> Response:
+        response = self._encoded_file_response(full_path, stat_result, scope, status_code)
+        if self.cache_control:
+            response.headers["Cache-Control"] = self.cache_control
+        return response
+
+    def _encoded_file_response(
+        self, full_path: str, stat_result: os.stat_result, scope: Scope, status_code: int
+    ) -> Response:
+        variants = self._precompressed.get(full_path)
+        if not variants:
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        accepted = {
+            token.split(";")[0].strip() for token in Headers(scope=scope).get("accept-encoding", "").split(",")
+        }
+        for encoding, variant_path, variant_stat in variants:
+            if encoding in accepted:
+                # FileResponse takes the content type from "app.js" in
+                # "app.js.br", so only the encoding needs setting.
+                response = super().file_response(variant_path, variant_stat, scope, status_code)
+                if response.status_code == status_code:
+                    response.headers["Content-Encoding"] = encoding
+                break
+        else:
+            response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        cached = self._lookup_cache.get(path)
+        if cached is not None and scope["method"] in ("GET", "HEAD") and stat.S_ISREG(cached[1].st_mode):
+            return self.file_response(cached[0], cached[1], scope)
+        return await super().get_response(path, scope)
+
+
+class SPAIndex:
+    """The SPA's index.html, read once and served from memory.
+
+    Every client-side route falls back to this document, so keeping the bytes
+    and their ETag in memory saves a stat and a read per page load. Responses
+    carry ``Cache-Control: no-cache`` so browsers revalidate (cheaply, via the
+    ETag) and pick up a deploy's new asset hashes.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.body = path.read_bytes()
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+
+    def response(self, if_none_match: str | None = None) -> Response:
+        headers = {"ETag": self.etag, "Cache-Control": "no-cache"}
+        if if_none_match and self.etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=headers)
+        return Response(self.body, media_type="text/html", headers=headers)
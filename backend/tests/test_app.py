@@ -0,0 +1,69 @@
+"""Tests for app-wide route configuration in backend.main."""
+
+from __future__ import annotations
+
+import uuid
+from typing import Optional
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import RedirectResponse, StreamingResponse
+from fastapi.routing import APIRoute
+
+from backend.main import app
+from backend.routes import (
+    augment_profile, auth, briefings, cards, competitors, content_outputs,
+    content_templates, feeds, suggestions, system,
+)
+
+ROUTERS = (
+    auth, feeds, competitors, augment_profile, cards, briefings, suggestions, system,
+    content_outputs, content_templates,
+)
+
+
+def _api_routes():
+    for module in ROUTERS:
+        for route in module.router.routes:
+            if isinstance(route, APIRoute):
+                yield module.__name__, route
+
+
+class TestJSONSerialization:
+    """API responses take FastAPI's direct-to-bytes Pydantic serialization path."""
+
+    def test_default_response_class_is_untouched(self):
+        """A custom default response class would disable the fast path for every route."""
+        assert isinstance(app.router.default_response_class, DefaultPlaceholder)
+
+    def test_json_routes_declare_response_models(self):
+        """Routes without a response model fall back to jsonable_encoder + json.dumps."""
+        missing = [
+            f"{name} {route.path}"
+            for name, route in _api_routes()
+            if route.response_field is None
+            and route.status_code != 204
+            and route.response_class not in (RedirectResponse, StreamingResponse)
+        ]
+        assert missing == []
+
+
+class TestIdParameters:
+    """Malformed ids are rejected with a 422 at validation, not a 500 in the handler."""
+
+    def test_id_path_params_are_uuids(self):
+        untyped = [
+            f"{name} {route.path} {param.name}"
+            for name, route in _api_routes()
+            for param in route.dependant.path_params
+            if param.name.endswith("_id") and param.field_info.annotation is not uuid.UUID
+        ]
+        assert untyped == []
+
+    def test_id_query_params_are_uuids(self):
+        untyped = [
+            f"{name} {route.path} {param.name}"
+            for name, route in _api_routes()
+            for param in route.dependant.query_params
+            if param.name.endswith("_id") and param.field_info.annotation != Optional[uuid.UUID]
+        ]
+        assert untyped == []
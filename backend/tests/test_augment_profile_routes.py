@@ -0,0 +1,84 @@
+"""Tests for backend.routes.augment_profile singleton loading and updates."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from backend.models.augment_profile import AUGMENT_PROFILE_ID
+from backend.routes.augment_profile import AugmentProfileUpdate, _get_or_create_profile, update_augment_profile
+
+
+class TestGetOrCreateProfile:
+    """The hot path is one primary-key lookup; creation is a single upsert."""
+
+    def test_existing_profile_is_one_lookup(self, mock_db):
+        profile = MagicMock()
+        mock_db.get.return_value = profile
+
+        assert _get_or_create_profile(mock_db) is profile
+
+        mock_db.get.assert_called_once()
+        assert mock_db.get.call_args.args[1] == AUGMENT_PROFILE_ID
+        mock_db.scalars.assert_not_called()
+        mock_db.commit.assert_not_called()
+
+    def test_missing_profile_is_created_with_fixed_id(self, mock_db):
+        created = MagicMock()
+        mock_db.get.return_value = None
+        mock_db.scalars.return_value.one_or_none.return_value = created
+
+        assert _get_or_create_profile(mock_db) is created
+
+        stmt = mock_db.scalars.call_args.args[0]
+        assert "ON CONFLICT (id) DO NOTHING" in str(stmt.compile(dialect=_pg()))
+        mock_db.add.assert_not_called()
+        mock_db.commit.assert_called_once()
+
+    def test_lost_race_rereads_the_winner(self, mock_db):
+        winner = MagicMock()
+        mock_db.get.side_effect = [None, winner]
+        mock_db.scalars.return_value.one_or_none.return_value = None
+
+        assert _get_or_create_profile(mock_db) is winner
+        assert mock_db.get.call_count == 2
+
+
+class TestUpdateAugmentProfile:
+    """The edited profile is serialized from the flushed row, not re-read."""
+
+    def test_update_flushes_then_commits_without_refresh(self, mock_db):
+        now = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        profile = SimpleNamespace(
+            id=AUGMENT_PROFILE_ID, company_description="", key_differentiators="",
+            target_customer_segments="", product_capabilities="", strategic_priorities="",
+            pricing="", updated_by=uuid.uuid4(), created_at=now, updated_at=now,
+        )
+        mock_db.get.return_value = profile
+
+        result = update_augment_profile(AugmentProfileUpdate(pricing="Per seat"), db=mock_db)
+
+        assert result.pricing == "Per seat"
+        assert result.model_dump(mode="json")["id"] == str(AUGMENT_PROFILE_ID)
+        assert [c[0] for c in mock_db.method_calls if c[0] in ("flush", "commit")] == ["flush", "commit"]
+        mock_db.refresh.assert_not_called()
+
+    def test_timestamps_serialize_with_utc_offset(self, mock_db):
+        naive = datetime(2026, 1, 2, 9, 30)
+        profile = SimpleNamespace(
+            id=AUGMENT_PROFILE_ID, company_description="", key_differentiators="",
+            target_customer_segments="", product_capabilities="", strategic_priorities="",
+            pricing="", updated_by=uuid.uuid4(), created_at=naive, updated_at=naive,
+        )
+        mock_db.get.return_value = profile
+
+        body = update_augment_profile(AugmentProfileUpdate(), db=mock_db).model_dump(mode="json")
+
+        assert body["created_at"] == body["updated_at"] == "2026-01-02T09:30:00+00:00"
+
+
+def _pg():
+    from sqlalchemy.dialects import postgresql
+    return postgresql.dialect()
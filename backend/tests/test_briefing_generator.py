@@ -0,0 +1,59 @@
+"""Tests for backend.services.briefing_generator prompt data and concurrency limits."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from backend.config import Settings
+from backend.services import briefing_generator
+from backend.services.briefing_generator import BriefingGenerator
+
+
+def test_claude_call_holds_an_inflight_slot():
+    """Each outbound call takes a slot from the per-process cap and returns it."""
+    # Skip __init__: it imports the SDK and builds a real client.
+    generator = BriefingGenerator.__new__(BriefingGenerator)
+    generator.client = MagicMock()
+    slots = briefing_generator.settings.BRIEFING_MAX_INFLIGHT
+    seen = []
+
+    def create(**kwargs):
+        seen.append(briefing_generator._inflight._value)
+        return SimpleNamespace(
+            content=[SimpleNamespace(text="# Briefing")],
+            usage=SimpleNamespace(input_tokens=1, output_tokens=1),
+        )
+
+    generator.client.messages.create.side_effect = create
+
+    assert generator._call_claude("system", "user") == "# Briefing"
+    assert seen == [slots - 1]
+    assert briefing_generator._inflight._value == slots
+
+
+def test_cards_json_matches_stdlib_layout():
+    """The prompt JSON keeps json.dumps(indent=2) layout, with UTF-8 text left unescaped."""
+    generator = BriefingGenerator.__new__(BriefingGenerator)
+    card = SimpleNamespace(
+        id=uuid.uuid4(), title="Lancement à Paris", event_type="expansion", priority="red",
+        summary="S", impact_assessment="I", suggested_counter_moves="M", status="draft",
+        competitors=[SimpleNamespace(name="Zoë AI")], created_at=datetime(2026, 1, 2, tzinfo=timezone.utc),
+    )
+
+    text = generator._cards_to_json([card])
+
+    assert text == json.dumps(json.loads(text), indent=2, ensure_ascii=False)
+    assert "Zoë AI" in text
+
+
+def test_inflight_cap_must_allow_a_call():
+    """BRIEFING_MAX_INFLIGHT=0 would make every generation wait forever."""
+    with pytest.raises(ValidationError):
+        Settings(BRIEFING_MAX_INFLIGHT=0)
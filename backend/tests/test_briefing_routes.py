@@ -0,0 +1,232 @@
+"""Tests for backend.routes.briefings listing, generation and bulk approval."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from fastapi import BackgroundTasks, HTTPException, Response
+from pydantic import ValidationError
+from sqlalchemy.orm import make_transient_to_detached
+
+from backend.cache import briefing_cache
+from backend.models.briefing import Briefing
+from backend.models.loaders import BRIEFING_BODY_LOADS
+from backend.services import briefing_generator
+from backend.routes.briefings import (
+    StatusUpdate, approve_all_briefing_cards, generate_briefing, list_briefings,
+)
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    briefing_cache.clear()
+    yield
+    briefing_cache.clear()
+
+
+def _list(mock_db, **params):
+    args = dict(status=None, limit=None, cursor=None)
+    args.update(params)
+    return list_briefings(response=Response(), db=mock_db, **args)
+
+
+def _briefing(**overrides):
+    now = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    defaults = dict(
+        id=uuid.uuid4(), date=date(2026, 1, 2), status="draft", card_count=3, created_at=now, updated_at=now,
+    )
+    defaults.update(overrides)
+    return SimpleNamespace(**defaults)
+
+
+class TestListBriefings:
+    """The list endpoint reads the denormalized card_count."""
+
+    def test_card_count_comes_from_column(self, mock_db):
+        """Linked cards are not loaded just to be counted."""
+        mock_db.all.return_value = [_briefing(card_count=7)]
+
+        result = _list(mock_db)
+
+        assert result[0].card_count == 7
+        mock_db.options.assert_not_called()
+
+    def test_repeat_requests_are_served_from_cache(self, mock_db):
+        """A second identical request does not query the database."""
+        mock_db.all.return_value = [_briefing()]
+
+        first = _list(mock_db, status="draft")
+        second = _list(mock_db, status="draft")
+
+        assert second == first
+        assert mock_db.all.call_count == 1
+
+    def test_cache_is_keyed_by_status(self, mock_db):
+        """Different status filters are cached separately."""
+        _list(mock_db, status="draft")
+        _list(mock_db, status="approved")
+
+        assert mock_db.all.call_count == 2
+
+    def test_status_update_rejects_unknown_status(self):
+        """Invalid statuses fail request validation instead of reaching the handler."""
+        with pytest.raises(ValidationError):
+            StatusUpdate(status="published")
+
+
+class TestListBriefingsPagination:
+    """Opt-in keyset pagination on the unique briefing date."""
+
+    def test_full_page_returns_next_cursor(self, mock_db):
+        mock_db.limit.return_value = mock_db
+        mock_db.all.return_value = [_briefing(date=date(2026, 1, 3)), _briefing(date=date(2026, 1, 2))]
+        response = Response()
+
+        list_briefings(response=response, status=None, limit=2, cursor=None, db=mock_db)
+
+        mock_db.limit.assert_called_once_with(2)
+        cursor = response.headers["X-Next-Cursor"]
+        mock_db.all.return_value = []
+        list_briefings(response=Response(), status=None, limit=2, cursor=cursor, db=mock_db)
+        clause = mock_db.filter.call_args.args[0]
+        assert clause.right.value == date(2026, 1, 2)
+
+    def test_last_page_has_no_cursor(self, mock_db):
+        mock_db.limit.return_value = mock_db
+        mock_db.all.return_value = [_briefing()]
+        response = Response()
+
+        list_briefings(response=response, status=None, limit=2, cursor=None, db=mock_db)
+
+        assert "X-Next-Cursor" not in response.headers
+
+    def test_malformed_cursor_is_rejected(self, mock_db):
+        with pytest.raises(HTTPException) as exc_info:
+            _list(mock_db, limit=2, cursor="not-a-cursor")
+        assert exc_info.value.status_code == 400
+
+
+class TestApproveAllBriefingCards:
+    """Bulk approval updates the linked cards without loading them."""
+
+    def _approve(self, mock_db, user, card_count):
+        now = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        briefing = Briefing(
+            id=uuid.uuid4(), date=date(2026, 1, 2), content="# Briefing", status="draft",
+            approved_by=None, approved_at=None, card_count=card_count, created_at=now, updated_at=now,
+        )
+        make_transient_to_detached(briefing)
+        mock_db.first.return_value = briefing
+        mock_db.get.return_value = user
+        mock_db.update.return_value = card_count
+        # RETURNING status, approved_by, approved_at, card_count, updated_at
+        mock_db.execute.return_value.one.return_value = ("approved", user.id, now, card_count, now)
+        return approve_all_briefing_cards(briefing.id, request=None, db=mock_db, current_user=user)
+
+    def test_cards_are_approved_through_a_subquery(self, mock_db, make_user):
+        result = self._approve(mock_db, make_user(role="admin"), card_count=4)
+
+        assert result["cards_approved"] == 4
+        assert result["status"] == "approved"
+        assert result["approved_at"] == "2026-01-02T00:00:00+00:00"
+        mock_db.options.assert_called_once_with(*BRIEFING_BODY_LOADS)
+        clause = mock_db.filter.call_args_list[-1].args[0]
+        assert "briefing_cards" in str(clause)
+
+    def test_briefing_without_cards_skips_the_update(self, mock_db, make_user):
+        result = self._approve(mock_db, make_user(role="admin"), card_count=0)
+
+        assert result["cards_approved"] == 0
+        mock_db.update.assert_not_called()
+
+
+class TestGenerateBriefing:
+    """Generation is queued and answered with 202 instead of held in the request."""
+
+    @pytest.fixture(autouse=True)
+    def _no_pending_batch(self):
+        with patch("backend.routes.briefings.analysis_pending", return_value=False) as pending:
+            yield pending
+
+    def test_pending_analysis_batch_defers_generation(self, mock_db, make_user, _no_pending_batch):
+        mock_db.scalar.return_value = None
+        mock_db.first.return_value = (uuid.uuid4(),)  # a recent card
+        _no_pending_batch.return_value = True
+        response, tasks = Response(), BackgroundTasks()
+
+        result = generate_briefing(response, tasks, db=mock_db, current_user=make_user())
+
+        assert result.status == "pending"
+        assert tasks.tasks == []
+        assert not briefing_generator._generating
+
+    def test_generation_is_queued(self, mock_db, make_user):
+        mock_db.scalar.return_value = None
+        mock_db.first.return_value = (uuid.uuid4(),)  # a recent card
+        response, tasks = Response(), BackgroundTasks()
+
+        result = generate_briefing(response, tasks, db=mock_db, current_user=make_user())
+
+        assert result.status == "pending"
+        assert result.briefing_id is None
+        assert len(tasks.tasks) == 1
+
+        # Polling while it runs queues nothing more; finishing releases the date.
+        again = generate_briefing(Response(), BackgroundTasks(), db=mock_db, current_user=make_user())
+        assert again.status == "pending"
+        with patch.object(briefing_generator, "BriefingGenerator"), patch.object(briefing_generator, "SessionLocal"):
+            tasks.tasks[0].func(*tasks.tasks[0].args)
+        retry = BackgroundTasks()
+        generate_briefing(Response(), retry, db=mock_db, current_user=make_user())
+        assert len(retry.tasks) == 1
+        briefing_generator._generating.clear()
+
+    def test_failed_generation_is_reported_until_cooldown(self, mock_db, make_user):
+        mock_db.scalar.return_value = None
+        mock_db.first.return_value = (uuid.uuid4(),)  # a recent card
+        tasks = BackgroundTasks()
+        generate_briefing(Response(), tasks, db=mock_db, current_user=make_user())
+
+        with patch.object(briefing_generator, "BriefingGenerator") as generator, patch.object(
+            briefing_generator, "SessionLocal"
+        ):
+            generator.return_value.generate_briefing.side_effect = RuntimeError("Claude down")
+            tasks.tasks[0].func(*tasks.tasks[0].args)
+
+        response, retry = Response(), BackgroundTasks()
+        result = generate_briefing(response, retry, db=mock_db, current_user=make_user())
+        assert (result.status, response.status_code) == ("failed", 200)
+        assert retry.tasks == []
+
+        # Once the cooldown has passed the next poll queues a fresh attempt.
+        day = result.date
+        briefing_generator._failed[day] -= briefing_generator.FAILED_RETRY_COOLDOWN
+        generate_briefing(Response(), retry, db=mock_db, current_user=make_user())
+        assert len(retry.tasks) == 1
+        briefing_generator._generating.clear()
+        briefing_generator._failed.clear()
+
+    def test_no_recent_cards_is_reported(self, mock_db, make_user):
+        mock_db.scalar.return_value = None
+        mock_db.first.return_value = None
+        response, tasks = Response(), BackgroundTasks()
+
+        result = generate_briefing(response, tasks, db=mock_db, current_user=make_user())
+
+        assert (result.status, response.status_code) == ("no_cards", 200)
+        assert tasks.tasks == []
+
+    def test_existing_briefing_is_returned(self, mock_db, make_user):
+        existing_id = uuid.uuid4()
+        mock_db.scalar.return_value = existing_id
+        response, tasks = Response(), BackgroundTasks()
+
+        result = generate_briefing(response, tasks, db=mock_db, current_user=make_user())
+
+        assert (result.status, result.briefing_id) == ("complete", existing_id)
+        assert response.status_code == 200
+        assert tasks.tasks == []
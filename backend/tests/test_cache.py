@@ -0,0 +1,235 @@
+"""Tests for backend.cache."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, insert, update
+
+from backend.cache import (
+    TTLCache,
+    _invalidate_on_commit,
+    _note_writes,
+    briefing_cache,
+    profile_cache,
+    user_cache,
+)
+from backend.database import SessionLocal, update_returning
+from backend.models.briefing import Briefing
+from backend.models.competitor import Competitor
+from backend.models.user import User
+from backend.services import profile_context
+from backend.services.auth_service import get_user_cached
+from backend.services.profile_context import get_prompt_context, load_augment_profile_text, load_competitor_profiles_text
+
+
+@pytest.fixture
+def briefing_db():
+    """A real SessionLocal session on SQLite holding one briefing row."""
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE briefings (id CHAR(32) PRIMARY KEY, date DATE, content TEXT, raw_llm_output TEXT, "
+            "status VARCHAR, approved_by CHAR(32), approved_at TIMESTAMP, card_count INTEGER, "
+            "created_at TIMESTAMP, updated_at TIMESTAMP)"
+        )
+        briefing_id = uuid.uuid4()
+        conn.execute(insert(Briefing).values(
+            id=briefing_id, date=date(2026, 1, 2), content="# Briefing", status="draft", card_count=0,
+            created_at=datetime(2026, 1, 2), updated_at=datetime(2026, 1, 2),
+        ))
+    db = SessionLocal(bind=engine)
+    yield db, briefing_id
+    db.close()
+    briefing_cache.clear()
+
+
+def _session(new=(), dirty=(), deleted=()):
+    return SimpleNamespace(new=list(new), dirty=list(dirty), deleted=list(deleted), info={})
+
+
+class TestTTLCache:
+    """Expiry and disabling."""
+
+    def test_entries_expire(self):
+        cache = TTLCache(ttl=60)
+        with patch("backend.cache.time.monotonic", return_value=100.0):
+            cache.set("k", [1])
+        with patch("backend.cache.time.monotonic", return_value=159.0):
+            assert cache.get("k") == [1]
+        with patch("backend.cache.time.monotonic", return_value=160.0):
+            assert cache.get("k") is None
+
+    def test_set_drops_expired_entries(self):
+        cache = TTLCache(ttl=60)
+        with patch("backend.cache.time.monotonic", return_value=100.0):
+            cache.set("old", [1])
+        with patch("backend.cache.time.monotonic", return_value=170.0):
+            cache.set("new", [2])
+        assert list(cache._entries) == ["new"]
+
+    def test_size_is_capped_oldest_first(self):
+        cache = TTLCache(ttl=60, max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == (None, "b", "c")
+
+    def test_zero_ttl_disables(self):
+        cache = TTLCache(ttl=0)
+        cache.set("k", [1])
+        assert cache.get("k") is None
+
+
+class TestInvalidation:
+    """Committed writes clear only the caches built from the written models."""
+
+    def test_briefing_write_clears_on_commit(self):
+        briefing_cache.set("list:", ["stale"])
+        session = _session(dirty=[Briefing()])
+
+        _note_writes(session, None)
+        assert briefing_cache.get("list:") == ["stale"]  # not before the commit
+        _invalidate_on_commit(session)
+
+        assert briefing_cache.get("list:") is None
+
+    def test_update_returning_clears_on_commit(self, briefing_db):
+        """Status changes written through update_returning drop cached briefings."""
+        db, briefing_id = briefing_db
+        briefing = db.get(Briefing, briefing_id)
+        briefing_cache.set(f"detail:{briefing_id}", ["draft"])
+
+        update_returning(db, briefing, status="approved")
+        db.commit()
+
+        assert briefing_cache.get(f"detail:{briefing_id}") is None
+        assert db.get(Briefing, briefing_id).status == "approved"
+
+    def test_statement_update_clears_on_commit(self, briefing_db):
+        """2.0-style UPDATE statements bypass flush but still invalidate."""
+        db, _ = briefing_db
+        briefing_cache.set("list:", ["stale"])
+
+        db.execute(update(Briefing).values(status="in_review"))
+        assert briefing_cache.get("list:") == ["stale"]  # not before the commit
+        db.commit()
+
+        assert briefing_cache.get("list:") is None
+
+    def test_unrelated_writes_keep_cache(self):
+        briefing_cache.set("list:", ["fresh"])
+        profile_cache.set("competitors", "stale")
+        session = _session(new=[Competitor()])
+
+        _note_writes(session, None)
+        _invalidate_on_commit(session)
+
+        assert briefing_cache.get("list:") == ["fresh"]
+        assert profile_cache.get("competitors") is None
+        briefing_cache.clear()
+
+
+class TestProfileContext:
+    """Prompt profile text is built once per TTL."""
+
+    def test_competitor_text_is_cached(self, mock_db):
+        profile_cache.clear()
+        acme = Competitor(id=uuid.uuid4(), name="Acme", description="Rival", updated_at=datetime(2026, 1, 1))
+        mock_db.all.side_effect = [[(acme.id, acme.updated_at)], [acme]]
+
+        first = load_competitor_profiles_text(mock_db)
+        second = load_competitor_profiles_text(mock_db)
+
+        assert first == second
+        assert first.startswith("--- Acme ---\nDescription: Rival")
+        assert mock_db.all.call_count == 2  # probe + fetch, then served from cache
+        profile_cache.clear()
+
+    def test_only_edited_competitors_are_refetched(self, mock_db):
+        """After invalidation, unchanged competitors reuse their formatted section."""
+        profile_cache.clear()
+        acme = Competitor(id=uuid.uuid4(), name="Acme", description="Old", updated_at=datetime(2026, 1, 1))
+        beta = Competitor(id=uuid.uuid4(), name="Beta", description="Same", updated_at=datetime(2026, 1, 1))
+        mock_db.all.side_effect = [
+            [(acme.id, acme.updated_at), (beta.id, beta.updated_at)], [acme, beta],
+        ]
+        load_competitor_profiles_text(mock_db)
+        profile_cache.clear()
+
+        edited = Competitor(id=acme.id, name="Acme", description="New", updated_at=datetime(2026, 1, 2))
+        mock_db.all.side_effect = [[(acme.id, edited.updated_at), (beta.id, beta.updated_at)], [edited]]
+        text = load_competitor_profiles_text(mock_db)
+
+        assert "Description: New" in text and "Description: Same" in text
+        fetch_filter = mock_db.filter.call_args.args[0]
+        assert list(fetch_filter.right.value) == [acme.id]
+        profile_cache.clear()
+
+    def test_missing_profile_text_is_cached(self, mock_db):
+        profile_cache.clear()
+
+        assert load_augment_profile_text(mock_db) == "No Augment profile configured yet."
+        load_augment_profile_text(mock_db)
+
+        mock_db.first.assert_called_once()
+        profile_cache.clear()
+
+    def test_prompt_context_rebuilds_only_when_timestamps_move(self, mock_db, monkeypatch):
+        """Unchanged profiles cost one probe; an edit from any worker is seen next run."""
+        monkeypatch.setattr(profile_context, "_prompt_context", None)
+        probe = mock_db.execute.return_value.one
+        probe.return_value = (datetime(2026, 1, 1), datetime(2026, 1, 1), 2)
+        mock_db.get.return_value = None
+
+        with patch.object(profile_context, "_build_competitor_profiles_text", return_value="C") as build:
+            assert get_prompt_context(mock_db) == ("No Augment profile configured yet.", "C")
+            get_prompt_context(mock_db)
+            assert build.call_count == 1
+
+            probe.return_value = (datetime(2026, 1, 1), datetime(2026, 1, 2), 2)
+            get_prompt_context(mock_db)
+            assert build.call_count == 2
+        assert probe.call_count == 3
+        profile_cache.clear()
+
+
+class TestUserCache:
+    """get_current_user reads the user row once per TTL."""
+
+    def test_hit_skips_the_database(self, mock_db, make_user):
+        user_cache.clear()
+        user = make_user(role="admin")
+        user.google_id = "g-1"
+        mock_db.get.return_value = user
+
+        assert get_user_cached(mock_db, str(user.id)) is user
+        cached = get_user_cached(mock_db, str(user.id))
+
+        mock_db.get.assert_called_once()
+        assert (cached.id, cached.email, cached.role) == (user.id, user.email, "admin")
+        user_cache.clear()
+
+    def test_tokens_are_not_cached(self, mock_db, make_user):
+        user_cache.clear()
+        user = make_user()
+        user.google_id = "g-1"
+        user.google_refresh_token = "secret"
+        mock_db.get.return_value = user
+        get_user_cached(mock_db, str(user.id))
+
+        assert "secret" not in repr(user_cache.get(str(user.id)))
+        user_cache.clear()
+
+    def test_user_write_clears_on_commit(self):
+        user_cache.set("id", {"role": "viewer"})
+        session = _session(dirty=[User()])
+
+        _note_writes(session, None)
+        _invalidate_on_commit(session)
+
+        assert user_cache.get("id") is None
+
@@ -0,0 +1,449 @@
+"""Tests for backend.routes.cards list filtering and comment threading."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException, Response
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+import backend.models  # noqa: F401  (configure all mappers)
+from backend.models.analysis_card import AnalysisCard, AnalysisCardComment
+from backend.models.briefing import Briefing
+from backend.models.content_output import ContentOutput
+from backend.models.feed_item import FeedItem
+from backend.models.loaders import CARD_LIST_LOADS, COMMENT_LOADS
+from backend.routes.cards import (
+    CardListItem, CardResponse, CardUpdate, CommentCreate, CommentResponse, CommentUpdate, StatusUpdate, _CARD_LIST_VERSION_COLUMNS, _list_etag, _load_comment_thread, _thread_comments,
+    add_comment, list_card_comments, list_cards, router as cards_router, update_comment, update_card,
+)
+
+
+def _list(mock_db, **params):
+    args = dict(
+        status=None, priority=None, competitor_id=None, date_from=None, date_to=None, q=None,
+        limit=None, cursor=None, request=SimpleNamespace(headers={}), response=Response(),
+    )
+    args.update(params)
+    return list_cards(db=mock_db, **args)
+
+
+class TestListCardsSearch:
+    """Full-text search via the q parameter."""
+
+    def test_no_query_skips_feed_item_join(self, mock_db):
+        """Without q the card list does not touch feed_items."""
+        assert _list(mock_db) == []
+        mock_db.join.assert_not_called()
+
+    def test_query_uses_tsvector_match(self, mock_db):
+        """q joins the source feed item and matches its search_tsv index column."""
+        mock_db.join.return_value = mock_db
+
+        _list(mock_db, q="pricing change")
+
+        assert mock_db.join.call_args.args[0] is FeedItem
+        clause = mock_db.filter.call_args_list[0].args[0]
+        sql = str(clause.compile(dialect=postgresql.dialect()))
+        assert "feed_items.search_tsv @@ plainto_tsquery" in sql
+
+
+class TestListCardsCompetitorFilter:
+    """Filtering by competitor must not multiply card rows."""
+
+    def test_competitor_filter_is_a_semi_join(self, mock_db):
+        competitor_id = uuid.uuid4()
+
+        _list(mock_db, competitor_id=str(competitor_id))
+
+        mock_db.join.assert_not_called()
+        clause = mock_db.filter.call_args_list[0].args[0]
+        sql = str(clause.compile(dialect=postgresql.dialect()))
+        assert "analysis_cards.id IN (SELECT analysis_card_competitors.analysis_card_id" in sql
+
+
+class TestListCardsPagination:
+    """Opt-in keyset pagination on (created_at, id)."""
+
+    def test_cursor_round_trips_into_row_comparison(self, mock_db):
+        last = SimpleNamespace(created_at=datetime(2026, 1, 2, tzinfo=timezone.utc), id=uuid.uuid4())
+        mock_db.limit.return_value = mock_db
+        mock_db.all.return_value = [last]
+        response = Response()
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(CardListItem, "model_validate", staticmethod(lambda card: card))
+            _list(mock_db, limit=1, response=response)
+            mock_db.all.return_value = []
+            _list(mock_db, limit=1, cursor=response.headers["X-Next-Cursor"])
+
+        clause = mock_db.filter.call_args.args[0]
+        sql = str(clause.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+        assert sql.startswith("(analysis_cards.created_at, analysis_cards.id) < (")
+        assert str(last.id) in sql
+        order = [str(c) for c in mock_db.order_by.call_args.args]
+        assert order == ["analysis_cards.created_at DESC", "analysis_cards.id DESC"]
+
+
+class TestCommentThreading:
+    """list_card_comments builds the reply tree from a single flat query."""
+
+    @staticmethod
+    def _comment(minutes, parent=None):
+        return AnalysisCardComment(
+            id=uuid.uuid4(),
+            analysis_card_id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            content=f"at {minutes}",
+            parent_comment_id=parent.id if parent else None,
+            created_at=datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=minutes),
+        )
+
+    def test_replies_nest_under_parents(self):
+        """Replies attach oldest first; top-level comments come back newest first."""
+        first = self._comment(0)
+        second = self._comment(1)
+        reply = self._comment(2, parent=first)
+        nested = self._comment(3, parent=reply)
+
+        roots = _thread_comments([first, second, reply, nested])
+
+        assert roots == [second, first]
+        assert first.replies == [reply]
+        assert reply.replies == [nested]
+        assert second.replies == []
+
+    def test_subtree_loads_with_one_recursive_query(self, mock_db):
+        """Reloading one comment fetches its whole reply tree in a single query."""
+        root = self._comment(0)
+        reply = self._comment(1, parent=root)
+        nested = self._comment(2, parent=reply)
+        mock_db.all.return_value = [root, reply, nested]
+
+        assert _load_comment_thread(mock_db, root.id) is root
+        assert root.replies == [reply]
+        assert reply.replies == [nested]
+        mock_db.all.assert_called_once()
+        clause = mock_db.filter.call_args.args[0]
+        assert "WITH RECURSIVE thread" in str(clause.compile(dialect=postgresql.dialect()))
+
+    def test_list_is_one_thread_query(self, mock_db):
+        """A non-empty thread comes back in one flat query; its rows prove the card exists."""
+        root = self._comment(0)
+        reply = self._comment(1, parent=root)
+        for comment in (root, reply):
+            comment.resolved = False
+            comment.updated_at = comment.created_at
+            set_committed_value(comment, "user", SimpleNamespace(name="Ada"))
+        mock_db.all.return_value = [root, reply]
+
+        result = list_card_comments(root.analysis_card_id, db=mock_db)
+
+        assert [c.id for c in result] == [root.id]
+        assert result[0].replies[0].id == reply.id
+        mock_db.query.assert_called_once_with(AnalysisCardComment)
+        mock_db.scalar.assert_not_called()
+        assert mock_db.options.call_args.args == COMMENT_LOADS
+
+    def test_empty_list_checks_the_card_by_primary_key(self, mock_db):
+        mock_db.scalar.return_value = uuid.uuid4()
+
+        assert list_card_comments(mock_db.scalar.return_value, db=mock_db) == []
+        assert mock_db.query.call_args_list[1].args == (AnalysisCard.id,)
+
+    def test_list_for_missing_card_is_404(self, mock_db):
+        mock_db.scalar.return_value = None
+        with pytest.raises(HTTPException) as exc_info:
+            list_card_comments(uuid.uuid4(), db=mock_db)
+        assert exc_info.value.status_code == 404
+
+    def test_thread_serializes_from_the_orm_rows(self):
+        """The threaded rows validate straight into the response model, replies included."""
+        root = self._comment(0)
+        reply = self._comment(1, parent=root)
+        for comment in (root, reply):
+            comment.resolved = False
+            comment.updated_at = comment.created_at
+            set_committed_value(comment, "user", SimpleNamespace(name="Ada"))
+        _thread_comments([root, reply])
+
+        body = CommentResponse.model_validate(root).model_dump(mode="json")
+
+        assert body["id"] == str(root.id)
+        assert body["user_name"] == "Ada"
+        assert body["created_at"] == "2026-01-01T00:00:00+00:00"
+        assert body["replies"][0]["parent_comment_id"] == str(root.id)
+        assert body["replies"][0]["replies"] == []
+
+    def test_route_serializes_the_orm_thread_in_one_pass(self, mock_db):
+        """The handler returns ORM rows; FastAPI's response field validates them from attributes."""
+        root = self._comment(0)
+        reply = self._comment(1, parent=root)
+        for comment in (root, reply):
+            comment.resolved = False
+            comment.updated_at = comment.created_at
+            set_committed_value(comment, "user", SimpleNamespace(name="Ada"))
+        mock_db.scalar.return_value = root.analysis_card_id
+        mock_db.all.return_value = [root, reply]
+        route = next(r for r in cards_router.routes if getattr(r, "endpoint", None) is list_card_comments)
+
+        value, errors = route.response_field.validate(list_card_comments(root.analysis_card_id, db=mock_db))
+
+        assert errors == []
+        body = json.loads(route.response_field.serialize_json(value))
+        assert [c["id"] for c in body] == [str(root.id)]
+        assert body[0]["replies"][0]["user_name"] == "Ada"
+
+
+class TestCardLazyLoading:
+    """Card relationships must be eager-loaded explicitly."""
+
+    def test_unloaded_competitors_raise(self):
+        """Serializing a card whose competitors were not loaded fails loudly (as a 500)."""
+        card = AnalysisCard(id=uuid.uuid4(), title="t")
+        make_transient_to_detached(card)
+        with pytest.raises(ValidationError, match="lazy='raise'"):
+            CardResponse.model_validate(card)
+
+
+class TestDeferredColumns:
+    """Large payload columns stay out of list queries."""
+
+    @pytest.mark.parametrize("column", [
+        AnalysisCard.raw_llm_output, Briefing.content, Briefing.raw_llm_output, ContentOutput.raw_llm_output,
+    ])
+    def test_column_is_deferred(self, column):
+        assert column.property.deferred
+
+    def test_list_serialization_reads_only_list_columns(self):
+        """A card loaded with just the list columns serializes for lists without further loads."""
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        card = AnalysisCard(
+            id=uuid.uuid4(), title="t", event_type="other", priority="green", summary="s",
+            status="draft", feed_item_id=None,
+            approved_by=None, approved_at=None, check_run_id=None, comments_count=0,
+            created_at=now, updated_at=now,
+        )
+        make_transient_to_detached(card)
+        set_committed_value(card, "competitors", [])
+
+        body = CardListItem.model_validate(card).model_dump()
+        assert not {"raw_llm_output", "impact_assessment", "suggested_counter_moves"} & body.keys()
+        with pytest.raises(ValidationError, match="deferred load operation of attribute 'raw_llm_output'"):
+            CardResponse.model_validate(card)
+
+
+class TestListCardsColumns:
+    """The list query leaves the long text columns in the heap."""
+
+    def test_list_query_uses_load_only(self, mock_db):
+        _list(mock_db)
+
+        options = mock_db.options.call_args.args
+        assert options == CARD_LIST_LOADS
+
+
+class TestListCardsETag:
+    """An unchanged page is answered with a 304 from a two-column read."""
+
+    @staticmethod
+    def _versions(mock_db):
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        versions = [(uuid.uuid4(), now, now, 1)]
+        mock_db.with_entities.return_value.all.return_value = versions
+        return versions
+
+    def test_page_carries_etag(self, mock_db):
+        versions = self._versions(mock_db)
+        response = Response()
+
+        _list(mock_db, response=response)
+
+        assert response.headers["ETag"] == _list_etag(versions)
+        assert response.headers["Cache-Control"] == "private, no-cache"
+        mock_db.with_entities.assert_called_once_with(*_CARD_LIST_VERSION_COLUMNS)
+
+    def test_matching_etag_skips_loading_cards(self, mock_db):
+        etag = _list_etag(self._versions(mock_db))
+
+        result = _list(mock_db, request=SimpleNamespace(headers={"if-none-match": f'"x", {etag}'}))
+
+        assert result.status_code == 304
+        assert result.headers["ETag"] == etag
+        mock_db.options.assert_not_called()
+        mock_db.all.assert_not_called()
+
+    def test_etag_changes_with_updated_at(self):
+        card_id = uuid.uuid4()
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        assert _list_etag([(card_id, now)]) != _list_etag([(card_id, now + timedelta(seconds=1))])
+
+    def test_etag_changes_with_linked_competitors(self):
+        """Renaming or linking a competitor changes the page's ETag."""
+        card_id = uuid.uuid4()
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        base = _list_etag([(card_id, now, now, 1)])
+        assert base != _list_etag([(card_id, now, now + timedelta(seconds=1), 1)])
+        assert base != _list_etag([(card_id, now, now, 2)])
+
+
+class TestCardSerialization:
+    """Response models read ORM rows directly but keep the wire format."""
+
+    def test_ids_and_timestamps_serialize_as_before(self):
+        naive = datetime(2026, 1, 1)
+        card = TestUpdateCard._card(approved_at=naive, competitors=[SimpleNamespace(id=uuid.uuid4(), name="Acme")])
+
+        body = CardResponse.model_validate(card).model_dump(mode="json")
+
+        assert body["id"] == str(card.id)
+        assert body["created_at"] == "2026-01-01T00:00:00+00:00"
+        assert body["approved_at"] == "2026-01-01T00:00:00+00:00"  # naive taken as UTC
+        assert body["competitors"] == [{"id": str(card.competitors[0].id), "name": "Acme"}]
+
+    def test_timestamps_are_only_formatted_for_json(self):
+        card = TestUpdateCard._card(approved_at=None)
+        model = CardResponse.model_validate(card)
+
+        assert model.model_dump()["created_at"] is card.created_at
+        assert model.model_dump(mode="json")["approved_at"] is None
+
+
+class TestUpdateCard:
+    """Edits are audited with one INSERT and committed once."""
+
+    @staticmethod
+    def _card(**fields):
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        card = dict(
+            id=uuid.uuid4(), feed_item_id=None, event_type="other", priority="green", title="t",
+            summary="s", impact_assessment="i", suggested_counter_moves="m", raw_llm_output=None,
+            status="draft", approved_by=None, approved_at=None, check_run_id=None, competitors=[],
+            comments_count=0, created_at=now, updated_at=now,
+        )
+        card.update(fields)
+        return SimpleNamespace(**card)
+
+    def test_changed_fields_insert_edit_rows_in_one_statement(self, mock_db, make_user):
+        card = self._card(title="Old", summary="Same")
+        mock_db.first.return_value = card
+        user = make_user()
+
+        response = update_card(
+            str(card.id), CardUpdate(title="New", summary="Same", priority="red"),
+            request=None, db=mock_db, current_user=user,
+        )
+
+        mock_db.execute.assert_called_once()
+        stmt, rows = mock_db.execute.call_args.args
+        assert stmt.table.name == "analysis_card_edits"
+        assert [(r["field_changed"], r["previous_value"], r["new_value"]) for r in rows] == [
+            ("title", "Old", "New"), ("priority", "green", "red"),
+        ]
+        mock_db.add.assert_not_called()
+        mock_db.commit.assert_called_once()
+        assert response.title == "New"
+
+    def test_unchanged_fields_skip_insert(self, mock_db, make_user):
+        card = self._card(title="Same")
+        mock_db.first.return_value = card
+
+        update_card(str(card.id), CardUpdate(title="Same"), request=None, db=mock_db, current_user=make_user())
+
+        mock_db.execute.assert_not_called()
+
+    def test_response_built_before_commit_without_reload(self, mock_db, make_user):
+        """One SELECT; the flushed UPDATE returns updated_at, so nothing is re-read."""
+        card = self._card(title="Old")
+        mock_db.first.return_value = card
+        calls = []
+        mock_db.flush.side_effect = lambda: calls.append("flush")
+        mock_db.commit.side_effect = lambda: calls.append("commit")
+
+        update_card(str(card.id), CardUpdate(title="New"), request=None, db=mock_db, current_user=make_user())
+
+        assert calls == ["flush", "commit"]
+        mock_db.query.assert_called_once()
+        mock_db.refresh.assert_not_called()
+
+
+class TestRequestValidation:
+    """Enumerated fields are validated by the request models, before the handler runs."""
+
+    @pytest.mark.parametrize("field", ["event_type", "priority"])
+    def test_card_update_rejects_unknown_values(self, field):
+        with pytest.raises(ValidationError):
+            CardUpdate(**{field: "bogus"})
+
+    def test_card_update_accepts_known_values(self):
+        body = CardUpdate(event_type="funding", priority="red")
+        assert body.model_dump(exclude_unset=True) == {"event_type": "funding", "priority": "red"}
+
+    def test_status_update_rejects_unknown_status(self):
+        with pytest.raises(ValidationError):
+            StatusUpdate(status="published")
+
+    def test_comment_create_parses_parent_id(self):
+        parent_id = uuid.uuid4()
+        assert CommentCreate(content="Hi", parent_comment_id=str(parent_id)).parent_comment_id == parent_id
+        with pytest.raises(ValidationError):
+            CommentCreate(content="Hi", parent_comment_id="not-a-uuid")
+
+
+class TestCommentWrites:
+    """Comment writes serialize from the flushed row instead of re-reading it."""
+
+    @staticmethod
+    def _flush_order(mock_db):
+        return [c[0] for c in mock_db.method_calls if c[0] in ("flush", "commit", "refresh")]
+
+    def test_add_comment_uses_the_current_user(self, mock_db, make_user):
+        user = make_user(name="Ada")
+        card_id = uuid.uuid4()
+        mock_db.scalar.return_value = card_id
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        def flush():
+            comment = mock_db.add.call_args.args[0]
+            comment.id, comment.created_at, comment.updated_at = uuid.uuid4(), now, now
+
+        mock_db.flush.side_effect = flush
+
+        result = add_comment(card_id, CommentCreate(content="Hi"), request=None, db=mock_db, current_user=user)
+
+        assert (result.user_name, result.content, result.replies) == ("Ada", "Hi", [])
+        assert self._flush_order(mock_db) == ["flush", "commit"]
+        mock_db.all.assert_not_called()
+
+    def test_update_comment_loads_the_thread_once(self, mock_db, make_user):
+        user = make_user(name="Ada")
+        comment = TestCommentThreading._comment(0)
+        comment.user_id, comment.resolved, comment.updated_at = user.id, False, comment.created_at
+        set_committed_value(comment, "user", user)
+        mock_db.all.return_value = [comment]
+
+        result = update_comment(
+            comment.analysis_card_id, comment.id, CommentUpdate(content="Edited"),
+            request=None, db=mock_db, current_user=user,
+        )
+
+        assert result.content == "Edited"
+        mock_db.all.assert_called_once()
+        assert self._flush_order(mock_db) == ["flush", "commit"]
+
+    def test_update_comment_on_another_card_is_404(self, mock_db, make_user):
+        comment = TestCommentThreading._comment(0)
+        mock_db.all.return_value = [comment]
+        with pytest.raises(HTTPException) as exc_info:
+            update_comment(
+                uuid.uuid4(), comment.id, CommentUpdate(content="x"),
+                request=None, db=mock_db, current_user=make_user(),
+            )
+        assert exc_info.value.status_code == 404
@@ -0,0 +1,101 @@
+"""Tests for backend.check_run_events LISTEN/NOTIFY fan-out and the check run stream."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import nullcontext
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+from backend.check_run_events import SUBSCRIBER_QUEUE_SIZE, CheckRunListener, check_run_listener
+from backend.routes.system import stream_check_runs
+
+
+def _listener_with(notifies):
+    listener = CheckRunListener()
+    listener._conn = SimpleNamespace(poll=lambda: None, notifies=[SimpleNamespace(payload=p) for p in notifies])
+    return listener
+
+
+class TestCheckRunListener:
+    """Notifications reach every current subscriber."""
+
+    def test_drain_fans_out_to_subscribers(self):
+        listener = _listener_with(['{"id": "a"}', '{"id": "b"}'])
+        with listener.subscribe() as first, listener.subscribe() as second:
+            listener._drain()
+            assert [first.get_nowait(), first.get_nowait()] == ['{"id": "a"}', '{"id": "b"}']
+            assert second.qsize() == 2
+        assert listener._conn.notifies == []
+
+    def test_unsubscribed_queues_get_nothing(self):
+        listener = _listener_with(['{"id": "a"}'])
+        with listener.subscribe() as queue:
+            pass
+        listener._drain()
+        assert queue.empty()
+
+    def test_slow_subscriber_drops_instead_of_blocking(self):
+        listener = CheckRunListener()
+        with listener.subscribe() as queue:
+            for i in range(SUBSCRIBER_QUEUE_SIZE + 5):
+                listener.publish(str(i))
+            assert queue.qsize() == SUBSCRIBER_QUEUE_SIZE
+
+    def test_lost_connection_reconnects(self):
+        listener = CheckRunListener()
+        listener._loop = MagicMock()
+        conn = MagicMock()
+        conn.poll.side_effect = OSError("server closed the connection")
+        listener._conn = conn
+
+        listener._drain()
+
+        conn.close.assert_called_once()
+        assert listener._conn is None
+        listener._loop.call_later.assert_called_once()
+
+    def test_lost_connection_removes_reader_even_when_fileno_fails(self):
+        """A connection psycopg2 already marked closed still loses its reader and is closed."""
+        listener = CheckRunListener()
+        listener._loop = MagicMock()
+        conn = MagicMock()
+        conn.poll.side_effect = OSError("server closed the connection")
+        conn.fileno.side_effect = Exception("connection already closed")
+        listener._conn = conn
+        listener._fd = 7
+
+        listener._drain()
+        listener._drain()  # a stale callback after the disconnect is a no-op
+
+        listener._loop.remove_reader.assert_called_once_with(7)
+        conn.close.assert_called_once()
+        assert listener._fd is None
+        listener._loop.call_later.assert_called_once()
+
+
+class TestCheckRunStream:
+    """The WebSocket handler reaps its sender task when the client goes away."""
+
+    @pytest.mark.asyncio
+    async def test_sender_failure_is_awaited(self, caplog):
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        queue.put_nowait('{"id": "1"}')
+        received = asyncio.Event()
+
+        async def receive_text():
+            await received.wait()
+            raise WebSocketDisconnect()
+
+        async def send_text(_):
+            received.set()
+            raise RuntimeError("socket closed")
+
+        websocket = SimpleNamespace(accept=AsyncMock(), receive_text=receive_text, send_text=send_text)
+        with patch.object(check_run_listener, "subscribe", return_value=nullcontext(queue)):
+            await stream_check_runs(websocket)
+
+        assert "socket closed" in caplog.text
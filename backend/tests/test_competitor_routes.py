@@ -0,0 +1,58 @@
+"""Tests for backend.routes.competitors list projections."""
+
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+import backend.models  # noqa: F401  (configure all mappers)
+from backend.models.competitor import Competitor
+from backend.routes.competitors import COMPETITOR_OPTION_LOADS, list_competitors, router
+
+
+def _response_field():
+    route = next(r for r in router.routes if getattr(r, "endpoint", None) is list_competitors)
+    return route.response_field
+
+
+def _serialize(rows):
+    field = _response_field()
+    value, errors = field.validate(rows)
+    assert errors == []
+    return json.loads(field.serialize_json(value))
+
+
+class TestListCompetitors:
+    """The picker list reads three columns; the default list keeps the full profile."""
+
+    def test_default_list_loads_full_rows(self, mock_db):
+        list_competitors(is_suggested=None, lean=False, db=mock_db)
+        mock_db.options.assert_not_called()
+
+    def test_lean_list_uses_load_only(self, mock_db):
+        list_competitors(is_suggested=None, lean=True, db=mock_db)
+        assert mock_db.options.call_args.args == (COMPETITOR_OPTION_LOADS,)
+
+    def test_full_rows_serialize_as_competitor_responses(self):
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        row = Competitor(
+            id=uuid.uuid4(), name="Acme", description="d", key_products="", target_customers="",
+            known_strengths="", known_weaknesses="", augment_overlap="", pricing="",
+            content_types=None, is_active=True, is_suggested=False, suggested_reason=None,
+            created_by=None, created_at=now, updated_at=now,
+        )
+        make_transient_to_detached(row)
+
+        (body,) = _serialize([row])
+        assert body["description"] == "d"
+
+    def test_lean_rows_serialize_as_options(self):
+        row = Competitor()
+        for key, value in dict(id=uuid.uuid4(), name="Acme", is_suggested=True).items():
+            set_committed_value(row, key, value)
+
+        assert _serialize([row]) == [{"id": str(row.id), "name": "Acme", "is_suggested": True}]
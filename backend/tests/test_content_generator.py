@@ -0,0 +1,32 @@
+"""Tests for backend.services.content_generator transaction handling."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from backend.services.content_generator import ContentGenerator
+
+
+def test_transaction_ends_before_claude_call(mock_db, make_competitor, make_content_template):
+    """The read transaction is committed before the minutes-long LLM call."""
+    # Skip __init__: it imports the SDK and builds a real client.
+    generator = ContentGenerator.__new__(ContentGenerator)
+    events = []
+    mock_db.commit.side_effect = lambda: events.append("commit")
+
+    def call_claude(prompt):
+        events.append("claude")
+        return '{"Overview": "Acme sells widgets."}'
+
+    with patch("backend.services.content_generator.load_augment_profile_text", return_value=""), patch.object(
+        generator, "_load_approved_cards", return_value=[SimpleNamespace(id="card-1")]
+    ), patch.object(generator, "_format_cards", return_value=""), patch.object(
+        generator, "_format_competitor", return_value=""
+    ), patch.object(
+        generator, "_call_claude", side_effect=call_claude
+    ):
+        result = generator.generate_content(mock_db, competitor=make_competitor(), template=make_content_template())
+
+    assert events == ["commit", "claude"]
+    assert result["source_card_ids"] == ["card-1"]
@@ -9,21 +9,27 @@ from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from pydantic import ValidationError
 
-from backend.routes.content_outputs import _output_to_response, VALID_STATUSES
+from backend.routes.content_outputs import ContentOutputResponse, _content_sections
+
+
+def _serialize(co):
+    """The JSON a route returning ``co`` sends."""
+    return ContentOutputResponse.model_validate(co).model_dump(mode="json")
 
 
 # ---------------------------------------------------------------------------
-# _output_to_response helper — serialization
+# ContentOutputResponse — serialization from ORM rows
 # ---------------------------------------------------------------------------
 
 class TestOutputToResponseBasic:
-    """Basic field serialization for _output_to_response."""
+    """Basic field serialization for ContentOutputResponse."""
 
     def test_basic_fields(self, make_content_output):
         """Core fields are serialized correctly."""
         co = make_content_output(status="draft")
-        result = _output_to_response(co)
+        result = _serialize(co)
 
         assert result["id"] == str(co.id)
         assert result["competitor_id"] == str(co.competitor_id)
@@ -37,7 +43,7 @@ class TestOutputToResponseBasic:
         """competitor_name comes from co.competitor.name."""
         comp = make_competitor(name="Acme Corp")
         co = make_content_output(competitor=comp)
-        result = _output_to_response(co)
+        result = _serialize(co)
 
         assert result["competitor_name"] == "Acme Corp"
 
@@ -45,14 +51,14 @@ class TestOutputToResponseBasic:
         """When competitor is None, competitor_name is empty string."""
         co = make_content_output()
         co.competitor = None
-        result = _output_to_response(co)
+        result = _serialize(co)
 
         assert result["competitor_name"] == ""
 
     def test_timestamps_serialized(self, make_content_output):
         """created_at and updated_at are ISO-formatted strings."""
         co = make_content_output()
-        result = _output_to_response(co)
+        result = _serialize(co)
 
         assert result["created_at"] is not None
         assert result["updated_at"] is not None
@@ -62,49 +68,55 @@ class TestOutputToResponseBasic:
 
 
 class TestOutputToResponseContent:
-    """Content and sections parsing in _output_to_response."""
+    """Content and sections in ContentOutputResponse."""
 
-    def test_json_content_parsed_to_sections(self, make_content_output):
-        """Valid JSON dict content is parsed into sections list."""
-        co = make_content_output(content='{"Overview": "Some text", "Details": "More text"}')
-        result = _output_to_response(co)
+    def test_stored_sections_returned(self, make_content_output):
+        """Sections come from the stored column; content is not re-parsed."""
+        sections = [{"title": "Overview", "body": "Some text"}]
+        co = make_content_output(content="edited since", sections=sections)
+        result = _serialize(co)
 
-        assert len(result["sections"]) == 2
-        titles = [s["title"] for s in result["sections"]]
-        assert "Overview" in titles
-        assert "Details" in titles
-
-    def test_non_json_content_empty_sections(self, make_content_output):
-        """Non-JSON content results in empty sections list."""
-        co = make_content_output(content="plain text content")
-        result = _output_to_response(co)
-
-        assert result["sections"] == []
-        assert result["content"] == "plain text content"
+        assert result["sections"] == sections
+        assert result["content"] == "edited since"
 
     def test_null_content(self, make_content_output):
         """None content results in empty string and empty sections."""
         co = make_content_output(content=None)
-        result = _output_to_response(co)
+        result = _serialize(co)
 
         assert result["content"] == ""
         assert result["sections"] == []
 
-    def test_json_array_content_empty_sections(self, make_content_output):
-        """JSON array (not dict) results in empty sections."""
-        co = make_content_output(content='["a", "b"]')
-        result = _output_to_response(co)
 
-        assert result["sections"] == []
+class TestContentSections:
+    """Sections are split out of content when it is written."""
+
+    def test_json_content_parsed_to_sections(self):
+        """Valid JSON dict content is parsed into sections, in order."""
+        sections = _content_sections('{"Overview": "Some text", "Details": "More text"}')
+
+        assert sections == [
+            {"title": "Overview", "body": "Some text"},
+            {"title": "Details", "body": "More text"},
+        ]
+
+    def test_leading_whitespace_json_parsed(self):
+        """JSON objects after leading whitespace still become sections."""
+        assert _content_sections('\n  {"Overview": "Some text"}') == [{"title": "Overview", "body": "Some text"}]
+
+    @pytest.mark.parametrize("content", [None, "", "plain text content", '["a", "b"]', "{draft} notes"])
+    def test_other_content_has_no_sections(self, content):
+        """Plain text, JSON arrays and brace-prefixed text have no sections."""
+        assert _content_sections(content) == []
 
 
 class TestOutputToResponseOptionalFields:
-    """Optional field handling in _output_to_response."""
+    """Optional field handling in ContentOutputResponse."""
 
     def test_optional_fields_null(self, make_content_output):
         """All optional fields default to None when not set."""
         co = make_content_output()
-        result = _output_to_response(co)
+        result = _serialize(co)
 
         assert result["google_doc_id"] is None
         assert result["google_doc_url"] is None
@@ -127,7 +139,7 @@ class TestOutputToResponseOptionalFields:
             published_at=now,
             error_message="some error",
         )
-        result = _output_to_response(co)
+        result = _serialize(co)
 
         assert result["template_id"] == str(tid)
         assert result["google_doc_id"] == "doc-123"
@@ -140,14 +152,14 @@ class TestOutputToResponseOptionalFields:
     def test_source_card_ids_default_empty(self, make_content_output):
         """source_card_ids defaults to empty list when None."""
         co = make_content_output()
-        result = _output_to_response(co)
+        result = _serialize(co)
 
         assert result["source_card_ids"] == []
 
     def test_source_card_ids_populated(self, make_content_output):
         """source_card_ids are passed through when set."""
         co = make_content_output(source_card_ids=["card-1", "card-2"])
-        result = _output_to_response(co)
+        result = _serialize(co)
 
         assert result["source_card_ids"] == ["card-1", "card-2"]
 
@@ -184,8 +196,60 @@ class TestListContentOutputs:
             competitor_id=None, content_type=None, status=None,
             db=mock_db, current_user=user,
         )
-        assert len(result) == 1
-        assert result[0]["id"] == str(co.id)
+        assert result == [co]
+
+    def test_list_reads_only_list_columns(self, mock_db, make_user, make_content_output):
+        """The list query leaves the body unread and serializes without it."""
+        from backend.models.loaders import CONTENT_OUTPUT_LIST_LOADS
+        from backend.routes.content_outputs import ContentOutputListItem, list_content_outputs
+
+        list_content_outputs(competitor_id=None, content_type=None, status=None, db=mock_db, current_user=make_user())
+
+        assert mock_db.options.call_args.args == CONTENT_OUTPUT_LIST_LOADS
+        body = ContentOutputListItem.model_validate(make_content_output()).model_dump()
+        assert not {"content", "sections"} & body.keys()
+
+
+class TestGetStaleContent:
+    """Stale detection reads everything in a fixed number of queries."""
+
+    def _run(self, mock_db, make_user, *, outputs=(), approvals=()):
+        from backend.routes.content_outputs import get_stale_content
+
+        comp = SimpleNamespace(id=uuid.uuid4(), name="Acme", content_types=["battle_card", "one_pager"])
+        tmpl = SimpleNamespace(id=uuid.uuid4(), name="Battle Card", content_type="battle_card")
+        for method in ("distinct", "join", "group_by"):
+            getattr(mock_db, method).return_value = mock_db
+        mock_db.all.side_effect = [
+            [comp],
+            [tmpl],
+            [SimpleNamespace(competitor_id=comp.id, **o) for o in outputs],
+            [(comp.id, a) for a in approvals],
+        ]
+        return comp, get_stale_content(db=mock_db, current_user=make_user())
+
+    def test_missing_and_stale_from_four_queries(self, mock_db, make_user):
+        output_id = uuid.uuid4()
+        comp, result = self._run(
+            mock_db, make_user,
+            outputs=[dict(content_type="battle_card", id=output_id, updated_at=datetime(2026, 1, 1, tzinfo=timezone.utc))],
+            approvals=[datetime(2026, 1, 2, tzinfo=timezone.utc)],
+        )
+
+        assert mock_db.all.call_count == 4
+        assert [(r["content_type"], r["status"]) for r in result] == [("battle_card", "stale"), ("one_pager", "missing")]
+        assert result[0]["last_output_id"] == str(output_id)
+        assert result[0]["template_name"] == "Battle Card"
+        assert result[1]["template_id"] is None
+
+    def test_output_newer_than_approvals_is_fresh(self, mock_db, make_user):
+        _, result = self._run(
+            mock_db, make_user,
+            outputs=[dict(content_type="battle_card", id=uuid.uuid4(), updated_at=datetime(2026, 1, 3, tzinfo=timezone.utc))],
+            approvals=[datetime(2026, 1, 2, tzinfo=timezone.utc)],
+        )
+
+        assert [(r["content_type"], r["status"]) for r in result] == [("one_pager", "missing")]
 
 
 class TestGetContentOutput:
@@ -211,7 +275,7 @@ class TestGetContentOutput:
         user = make_user()
 
         result = get_content_output(output_id=str(co.id), db=mock_db, current_user=user)
-        assert result["id"] == str(co.id)
+        assert result is co
 
 
 class TestGenerateContent:
@@ -221,7 +285,9 @@ class TestGenerateContent:
         """Returns 404 when competitor doesn't exist."""
         from backend.routes.content_outputs import generate_content, ContentOutputCreate
 
+        mock_db.join.return_value = mock_db
         mock_db.first.return_value = None
+        mock_db.get.return_value = None
         user = make_user()
         body = ContentOutputCreate(competitor_id=str(uuid.uuid4()), template_id=str(uuid.uuid4()))
 
@@ -235,8 +301,10 @@ class TestGenerateContent:
         from backend.routes.content_outputs import generate_content, ContentOutputCreate
 
         comp = make_competitor()
-        # First call returns competitor, second returns None (template)
-        mock_db.first.side_effect = [comp, None]
+        # The joined lookup misses; the competitor itself exists
+        mock_db.join.return_value = mock_db
+        mock_db.first.return_value = None
+        mock_db.get.return_value = comp
         user = make_user()
         body = ContentOutputCreate(competitor_id=str(comp.id), template_id=str(uuid.uuid4()))
 
@@ -271,23 +339,18 @@ class TestGenerateContent:
             obj.competitor = comp  # attach for serialization
         mock_db.add.side_effect = track_add
 
-        # first() calls: 1=competitor, 2=template, 3=reload with joinedload
-        call_count = [0]
-        def smart_first():
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return comp
-            elif call_count[0] == 2:
-                return tmpl
-            else:
-                return captured.get("co")
-        mock_db.first.side_effect = smart_first
+        # first() calls: 1=(competitor, template), 2=reload with joinedload
+        mock_db.join.return_value = mock_db
+        mock_db.first.side_effect = lambda: (comp, tmpl) if "co" not in captured else captured["co"]
 
         result = generate_content(body=body, db=mock_db, current_user=user)
 
-        assert result["status"] == "draft"
-        assert result["content"] == '{"Overview": "Test"}'
-        assert result["title"] == "Battle Card - Acme"
+        assert result.status == "draft"
+        assert result.content == '{"Overview": "Test"}'
+        assert result.sections == [{"title": "Overview", "body": "Test"}]
+        assert result.title == "Battle Card - Acme"
+        mock_gen_instance.generate_content.assert_called_once_with(mock_db, competitor=comp, template=tmpl)
+        mock_db.get.assert_not_called()
 
     @patch("backend.routes.content_outputs.ContentGenerator")
     def test_generation_failure_sets_failed_status(self, MockGenerator, mock_db, make_user, make_competitor, make_content_template):
@@ -310,21 +373,13 @@ class TestGenerateContent:
             obj.competitor = comp
         mock_db.add.side_effect = track_add
 
-        call_count = [0]
-        def smart_first():
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return comp
-            elif call_count[0] == 2:
-                return tmpl
-            else:
-                return captured.get("co")
-        mock_db.first.side_effect = smart_first
+        mock_db.join.return_value = mock_db
+        mock_db.first.side_effect = lambda: (comp, tmpl) if "co" not in captured else captured["co"]
 
         result = generate_content(body=body, db=mock_db, current_user=user)
 
-        assert result["status"] == "failed"
-        assert "LLM failed" in result["error_message"]
+        assert result.status == "failed"
+        assert "LLM failed" in result.error_message
 
 
 class TestDeleteContentOutput:
@@ -383,23 +438,41 @@ class TestUpdateContentOutput:
             update_content_output(output_id=str(uuid.uuid4()), body=body, db=mock_db, current_user=user)
         assert exc_info.value.status_code == 404
 
+    def test_content_edit_recomputes_sections(self, mock_db, make_user, make_content_output):
+        """Sections are rewritten with the content, not derived on read."""
+        from backend.routes.content_outputs import update_content_output, ContentOutputUpdate
+
+        co = make_content_output(sections=[{"title": "key", "body": "val"}])
+        mock_db.first.return_value = co
+
+        result = update_content_output(
+            output_id=co.id, body=ContentOutputUpdate(content="# Rewritten"), db=mock_db, current_user=make_user(),
+        )
+
+        assert result is co
+        assert co.sections == []
+
+    def test_title_edit_keeps_sections(self, mock_db, make_user, make_content_output):
+        from backend.routes.content_outputs import update_content_output, ContentOutputUpdate
+
+        sections = [{"title": "key", "body": "val"}]
+        co = make_content_output(sections=sections)
+        mock_db.first.return_value = co
+
+        update_content_output(output_id=co.id, body=ContentOutputUpdate(title="New"), db=mock_db, current_user=make_user())
+
+        assert co.sections == sections
+
 
 class TestUpdateContentOutputStatus:
     """Tests for update_content_output_status route handler."""
 
-    def test_invalid_status_raises_400(self, mock_db, make_user):
-        """Returns 400 for invalid status value."""
-        from backend.routes.content_outputs import update_content_output_status, StatusUpdate
+    def test_status_update_rejects_unknown_status(self):
+        """Invalid statuses fail request validation instead of reaching the handler."""
+        from backend.routes.content_outputs import StatusUpdate
 
-        user = make_user()
-        body = StatusUpdate(status="invalid_status")
-
-        with pytest.raises(Exception) as exc_info:
-            update_content_output_status(
-                output_id=str(uuid.uuid4()), body=body,
-                db=mock_db, current_user=user,
-            )
-        assert exc_info.value.status_code == 400
+        with pytest.raises(ValidationError):
+            StatusUpdate(status="invalid_status")
 
     def test_not_found_raises_404(self, mock_db, make_user):
         """Returns 404 when output not found."""
@@ -439,6 +512,7 @@ class TestUpdateContentOutputStatus:
         co = make_content_output(status="in_review")
         mock_db.first.return_value = co
         admin = make_user(role="admin")
+        mock_db.get.return_value = admin  # the role is re-read from the database
         body = StatusUpdate(status="approved")
 
         result = update_content_output_status(
@@ -480,12 +554,34 @@ class TestPublishContentOutput:
             publish_content_output(output_id=str(uuid.uuid4()), db=mock_db, current_user=user)
         assert exc_info.value.status_code == 403
 
+    def test_publish_checks_the_role_in_the_database(self, mock_db, make_user):
+        """A cached admin demoted through another worker is refused."""
+        from backend.routes.content_outputs import publish_content_output
+
+        cached = make_user(role="admin")
+        mock_db.get.return_value = make_user(role="viewer")
+
+        with pytest.raises(Exception) as exc_info:
+            publish_content_output(output_id=str(uuid.uuid4()), db=mock_db, current_user=cached)
+        assert exc_info.value.status_code == 403
+
+    def test_publish_by_deleted_user_raises_401(self, mock_db, make_user):
+        """A cached user whose row is gone gets 401, not a 500."""
+        from backend.routes.content_outputs import publish_content_output
+
+        mock_db.get.return_value = None
+
+        with pytest.raises(Exception) as exc_info:
+            publish_content_output(output_id=str(uuid.uuid4()), db=mock_db, current_user=make_user(role="admin"))
+        assert exc_info.value.status_code == 401
+
     def test_publish_not_found_raises_404(self, mock_db, make_user):
         """Returns 404 when content output not found."""
         from backend.routes.content_outputs import publish_content_output
 
         mock_db.first.return_value = None
         admin = make_user(role="admin")
+        mock_db.get.return_value = admin  # the role is re-read from the database
         admin.google_refresh_token = "token"
 
         with pytest.raises(Exception) as exc_info:
@@ -499,6 +595,7 @@ class TestPublishContentOutput:
         co = make_content_output(status="draft")
         mock_db.first.return_value = co
         admin = make_user(role="admin")
+        mock_db.get.return_value = admin  # the role is re-read from the database
         admin.google_refresh_token = "token"
 
         with pytest.raises(Exception) as exc_info:
@@ -514,6 +611,7 @@ class TestPublishContentOutput:
         mock_db.first.return_value = co
         admin = make_user(role="admin")
         admin.google_refresh_token = None
+        mock_db.get.return_value = admin  # tokens are re-read, not taken from the user cache
 
         with pytest.raises(Exception) as exc_info:
             publish_content_output(output_id=str(co.id), db=mock_db, current_user=admin)
@@ -529,6 +627,7 @@ class TestPublishContentOutput:
         mock_db.first.return_value = co
         admin = make_user(role="admin")
         admin.google_refresh_token = "token"
+        mock_db.get.return_value = admin
 
         mock_svc = MagicMock()
         MockService.return_value = mock_svc
@@ -545,6 +644,7 @@ class TestPublishContentOutput:
         mock_db.first.return_value = co
         admin = make_user(role="admin")
         admin.google_refresh_token = "token"
+        mock_db.get.return_value = admin
 
         mock_svc = MagicMock()
         mock_svc.publish_doc.side_effect = RuntimeError("API error")
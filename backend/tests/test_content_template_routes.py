@@ -9,15 +9,20 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from backend.routes.content_templates import _template_to_response
+from backend.routes.content_templates import TemplateResponse
+
+
+def _serialize(t):
+    """The JSON a route returning ``t`` sends."""
+    return TemplateResponse.model_validate(t).model_dump(mode="json")
 
 
 # ---------------------------------------------------------------------------
-# _template_to_response helper — serialization
+# TemplateResponse — serialization from ORM rows
 # ---------------------------------------------------------------------------
 
 class TestTemplateToResponseBasic:
-    """Basic field serialization for _template_to_response."""
+    """Basic field serialization for TemplateResponse."""
 
     def test_basic_fields(self, make_content_template):
         """Core fields are serialized correctly."""
@@ -26,7 +31,7 @@ class TestTemplateToResponseBasic:
             name="BC Template",
             description="A battle card template",
         )
-        result = _template_to_response(t)
+        result = _serialize(t)
 
         assert result["id"] == str(t.id)
         assert result["content_type"] == "Battle Card"
@@ -37,7 +42,7 @@ class TestTemplateToResponseBasic:
     def test_timestamps_serialized(self, make_content_template):
         """created_at and updated_at are ISO-formatted strings."""
         t = make_content_template()
-        result = _template_to_response(t)
+        result = _serialize(t)
 
         assert result["created_at"] is not None
         assert result["updated_at"] is not None
@@ -47,7 +52,7 @@ class TestTemplateToResponseBasic:
     def test_null_sections_empty_list(self, make_content_template):
         """Null sections results in empty list."""
         t = make_content_template(sections=None)
-        result = _template_to_response(t)
+        result = _serialize(t)
 
         assert result["sections"] == []
 
@@ -58,7 +63,7 @@ class TestTemplateToResponseBasic:
             {"title": "Strengths", "description": "Key strengths", "prompt_hint": ""},
         ]
         t = make_content_template(sections=sections)
-        result = _template_to_response(t)
+        result = _serialize(t)
 
         assert result["sections"] == sections
         assert len(result["sections"]) == 2
@@ -66,21 +71,21 @@ class TestTemplateToResponseBasic:
     def test_doc_name_pattern(self, make_content_template):
         """doc_name_pattern is serialized when set."""
         t = make_content_template(doc_name_pattern="Battle Card - {competitor}")
-        result = _template_to_response(t)
+        result = _serialize(t)
 
         assert result["doc_name_pattern"] == "Battle Card - {competitor}"
 
     def test_doc_name_pattern_null(self, make_content_template):
         """doc_name_pattern is None when not set."""
         t = make_content_template(doc_name_pattern=None)
-        result = _template_to_response(t)
+        result = _serialize(t)
 
         assert result["doc_name_pattern"] is None
 
     def test_inactive_template(self, make_content_template):
         """is_active=False is serialized correctly."""
         t = make_content_template(is_active=False)
-        result = _template_to_response(t)
+        result = _serialize(t)
 
         assert result["is_active"] is False
 
@@ -107,8 +112,7 @@ class TestListTemplates:
         t = make_content_template()
         mock_db.all.return_value = [t]
         result = list_templates(db=mock_db)
-        assert len(result) == 1
-        assert result[0]["id"] == str(t.id)
+        assert result == [t]
 
 
 class TestGetTemplate:
@@ -130,7 +134,7 @@ class TestGetTemplate:
         t = make_content_template()
         mock_db.first.return_value = t
         result = get_template(template_id=str(t.id), db=mock_db)
-        assert result["id"] == str(t.id)
+        assert result is t
 
 
 
@@ -156,6 +160,7 @@ class TestCreateTemplate:
         existing = make_content_template(content_type="Battle Card")
         mock_db.first.return_value = existing
         admin = make_user(role="admin")
+        mock_db.get.return_value = admin  # the role is re-read from the database
         body = TemplateCreate(content_type="Battle Card", name="Another BC")
 
         with pytest.raises(Exception) as exc_info:
@@ -168,6 +173,7 @@ class TestCreateTemplate:
 
         mock_db.first.return_value = None  # No duplicate
         admin = make_user(role="admin")
+        mock_db.get.return_value = admin  # the role is re-read from the database
         body = TemplateCreate(content_type="Battle Card", name="BC Template")
 
         # mock refresh to set timestamps on the created object
@@ -201,6 +207,7 @@ class TestUpdateTemplate:
 
         mock_db.first.return_value = None
         admin = make_user(role="admin")
+        mock_db.get.return_value = admin  # the role is re-read from the database
         body = TemplateUpdate(name="Updated Name")
 
         with pytest.raises(Exception) as exc_info:
@@ -214,12 +221,26 @@ class TestUpdateTemplate:
         t = make_content_template(name="Old Name")
         mock_db.first.return_value = t
         admin = make_user(role="admin")
+        mock_db.get.return_value = admin  # the role is re-read from the database
         body = TemplateUpdate(name="New Name")
 
         result = update_template(template_id=str(t.id), body=body, db=mock_db, current_user=admin)
         assert t.name == "New Name"
         mock_db.commit.assert_called_once()
 
+    def test_sections_stored_as_plain_dicts(self, mock_db, make_user, make_content_template):
+        """Updated sections reach the JSONB column as dicts with defaults filled in."""
+        from backend.routes.content_templates import update_template, TemplateUpdate
+
+        t = make_content_template()
+        mock_db.first.return_value = t
+        admin = make_user(role="admin")
+        mock_db.get.return_value = admin  # the role is re-read from the database
+        body = TemplateUpdate(sections=[{"title": "Overview"}])
+
+        update_template(template_id=str(t.id), body=body, db=mock_db, current_user=admin)
+        assert t.sections == [{"title": "Overview", "description": "", "prompt_hint": ""}]
+
 
 class TestDeleteTemplate:
     """Tests for delete_template route handler."""
@@ -240,6 +261,7 @@ class TestDeleteTemplate:
 
         mock_db.first.return_value = None
         admin = make_user(role="admin")
+        mock_db.get.return_value = admin  # the role is re-read from the database
 
         with pytest.raises(Exception) as exc_info:
             delete_template(template_id=str(uuid.uuid4()), db=mock_db, current_user=admin)
@@ -252,6 +274,7 @@ class TestDeleteTemplate:
         t = make_content_template(is_active=True)
         mock_db.first.return_value = t
         admin = make_user(role="admin")
+        mock_db.get.return_value = admin  # the role is re-read from the database
 
         result = delete_template(template_id=str(t.id), db=mock_db, current_user=admin)
         assert t.is_active is False
@@ -0,0 +1,142 @@
+"""Tests for backend.database connection tagging, diagnostics and helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import func, inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import make_transient_to_detached
+
+from backend.database import (
+    DBApplicationNameMiddleware,
+    NPlusOneError,
+    NPlusOneMiddleware,
+    _record_lazy_load,
+    _set_application_name,
+    db_application_name,
+    engine,
+    settings,
+    update_returning,
+    warm_pool,
+)
+from backend.models.briefing import Briefing
+
+
+def _run(path: str) -> str:
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["name"] = db_application_name.get()
+
+    asyncio.run(DBApplicationNameMiddleware(app)({"type": "http", "path": path}, None, None))
+    return seen["name"]
+
+
+class TestApplicationName:
+    """Per-router application_name for pg_stat_activity."""
+
+    def test_api_requests_are_tagged_with_router(self):
+        """/api/<router>/... requests use '<app>:<router>'."""
+        assert _run("/api/cards/123/comments") == "compintel:cards"
+
+    def test_non_api_requests_use_default(self):
+        """Static and SPA requests keep the default name."""
+        assert _run("/assets/app.js") == "compintel"
+
+    def test_checkout_sets_name_once_per_connection(self):
+        """SET application_name is only issued when the tag changes."""
+        dbapi_conn = MagicMock()
+        cursor = dbapi_conn.cursor.return_value.__enter__.return_value
+        record = SimpleNamespace(info={})
+
+        _set_application_name(dbapi_conn, record, None)
+        _set_application_name(dbapi_conn, record, None)
+
+        cursor.execute.assert_called_once_with("SET application_name = %s", ("compintel",))
+        dbapi_conn.commit.assert_called_once()
+        assert record.info["application_name"] == "compintel"
+
+
+class TestWarmPool:
+    """Startup pool pre-warming."""
+
+    def test_opens_then_returns_connections(self):
+        """Each warmed connection is checked out and handed back to the pool."""
+        with patch.object(engine, "connect") as connect:
+            warm_pool(3)
+
+        assert connect.call_count == 3
+        assert connect.return_value.close.call_count == 3
+
+    def test_unreachable_database_does_not_block_startup(self):
+        """Connection errors are logged, not raised; opened connections are still closed."""
+        opened = MagicMock()
+        with patch.object(engine, "connect", side_effect=[opened, OSError("refused")]):
+            warm_pool(3)
+
+        opened.close.assert_called_once()
+
+
+class TestNPlusOneDetection:
+    """Repeated lazy loads of one relationship within a request."""
+
+    @staticmethod
+    def _lazy_load(attribute="AnalysisCard.competitors"):
+        return SimpleNamespace(
+            lazy_loaded_from=object(),
+            loader_strategy_path=SimpleNamespace(prop=attribute),
+        )
+
+    def _request(self, *states):
+        async def app(scope, receive, send):
+            for state in states:
+                _record_lazy_load(state)
+
+        asyncio.run(NPlusOneMiddleware(app)({"type": "http", "path": "/api/cards"}, None, None))
+
+    def test_single_lazy_load_is_allowed(self, caplog):
+        """One lazy load per relationship is not reported."""
+        self._request(self._lazy_load(), self._lazy_load("Briefing.cards"))
+        assert "N+1" not in caplog.text
+
+    def test_repeated_lazy_load_warns(self, caplog):
+        """The second lazy load of the same relationship is logged once."""
+        self._request(self._lazy_load(), self._lazy_load(), self._lazy_load())
+        assert caplog.text.count("Potential N+1 query: AnalysisCard.competitors") == 1
+
+    def test_raise_mode(self):
+        """NPLUSONE_RAISE turns the warning into an error."""
+        with patch.object(settings, "NPLUSONE_RAISE", True), pytest.raises(NPlusOneError):
+            self._request(self._lazy_load(), self._lazy_load())
+
+    def test_outside_requests_is_ignored(self, caplog):
+        """Lazy loads in background jobs (no middleware) are not tracked."""
+        _record_lazy_load(self._lazy_load())
+        _record_lazy_load(self._lazy_load())
+        assert "N+1" not in caplog.text
+
+
+class TestUpdateReturning:
+    """One UPDATE ... RETURNING writes the row and fills the instance."""
+
+    def test_sql_values_are_written_and_read_back(self, mock_db):
+        now = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        briefing = Briefing(id=uuid.uuid4(), status="draft", approved_at=None)
+        make_transient_to_detached(briefing)
+        mock_db.execute.return_value.one.return_value = ("approved", now, 3, now)
+
+        update_returning(mock_db, briefing, status="approved", approved_at=func.now())
+
+        stmt = mock_db.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "approved_at=now()" in sql
+        assert "RETURNING briefings.status, briefings.approved_at, briefings.card_count, briefings.updated_at" in sql
+        assert mock_db.execute.call_args.kwargs["execution_options"] == {"synchronize_session": False}
+        assert (briefing.status, briefing.approved_at, briefing.card_count) == ("approved", now, 3)
+        assert not inspect(briefing).modified
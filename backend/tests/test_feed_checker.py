@@ -96,8 +96,8 @@ class TestProcessRSSFeed:
             with pytest.raises(RuntimeError, match="Failed to parse feed"):
                 checker._process_feed(feed)
 
-    def test_rss_dedup_skips_existing_items(self, mock_db, make_feed):
-        """RSS items with existing GUIDs are skipped (dedup)."""
+    def test_rss_items_are_bulk_loaded(self, mock_db, make_feed):
+        """Parsed entries go to insert_feed_items in one batch; its count is returned."""
         checker = _make_checker(mock_db)
         feed = make_feed(feed_type="rss", url="https://example.com/feed.xml")
 
@@ -118,9 +118,14 @@ class TestProcessRSSFeed:
             mock_parsed.entries = [entry]
             mock_fp.parse.return_value = mock_parsed
 
-            # Simulate existing item found in DB
-            mock_db.query.return_value.filter.return_value.first.return_value = MagicMock()
+            # Existing (feed_id, guid) rows are skipped by ON CONFLICT in the loader
+            with patch("backend.services.feed_checker.insert_feed_items", return_value=0) as mock_insert:
+                result = checker._process_feed(feed)
 
-            result = checker._process_feed(feed)
-            assert result == 0  # No new items because dedup
+            assert result == 0
+            (db, items), _ = mock_insert.call_args
+            assert db is mock_db
+            assert [i["guid"] for i in items] == ["existing-guid-123"]
+            assert items[0]["feed_id"] == feed.id
+            mock_db.add.assert_not_called()
 
@@ -0,0 +1,93 @@
+"""Tests for backend.services.feed_item_loader bulk ingestion."""
+
+from __future__ import annotations
+
+import csv
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from backend.services.feed_item_loader import COPY_MIN_ROWS, copy_feed_items, insert_feed_items
+
+
+def _cursor(mock_db, rowcount=0):
+    cursor = MagicMock()
+    cursor.rowcount = rowcount
+    mock_db.connection.return_value.connection.cursor.return_value.__enter__.return_value = cursor
+    return cursor
+
+
+def _item(**overrides):
+    item = {
+        "feed_id": uuid.uuid4(),
+        "guid": "guid-1",
+        "title": "Title",
+        "url": "https://example.com/1",
+        "author": None,
+        "published_at": datetime(2026, 2, 1, tzinfo=timezone.utc),
+        "raw_content": "body",
+    }
+    item.update(overrides)
+    return item
+
+
+class TestCopyFeedItems:
+    """Staging-table COPY + INSERT ... ON CONFLICT flow."""
+
+    def test_empty_batch_skips_database(self, mock_db):
+        """No connection work happens when there is nothing to load."""
+        assert copy_feed_items(mock_db, []) == 0
+        mock_db.connection.assert_not_called()
+
+    def test_returns_rows_inserted_by_merge(self, mock_db):
+        """The count comes from the final INSERT, which skips existing guids."""
+        cursor = _cursor(mock_db, rowcount=1)
+
+        assert copy_feed_items(mock_db, [_item(), _item(guid="guid-2")]) == 1
+
+        merge_sql = cursor.execute.call_args_list[-1].args[0]
+        assert "ON CONFLICT (feed_id, guid) DO NOTHING" in merge_sql
+        cursor.copy_expert.assert_called_once()
+
+    def test_copy_payload_encodes_nulls_and_json(self, mock_db):
+        """None becomes an empty field (FORCE_NULL) and metadata is JSON-encoded."""
+        cursor = _cursor(mock_db)
+        item = _item(title=None, raw_metadata={"lang": "en"})
+
+        copy_feed_items(mock_db, [item])
+
+        sql, buf = cursor.copy_expert.call_args.args
+        assert "FORCE_NULL (title, author, raw_metadata)" in sql
+        row = next(csv.reader(buf))
+        assert row[0] == str(item["feed_id"])
+        assert row[2] == ""
+        assert row[4] == ""
+        assert row[5] == "2026-02-01T00:00:00+00:00"
+        assert row[7] == '{"lang": "en"}'
+
+
+class TestInsertFeedItems:
+    """Small batches use one INSERT ... VALUES; large ones fall back to COPY."""
+
+    def test_small_batch_is_one_statement(self, mock_db):
+        """A typical poll is a single multi-row INSERT that skips existing guids."""
+        mock_db.execute.return_value.rowcount = 2
+
+        assert insert_feed_items(mock_db, [_item(), _item(guid="guid-2", url=None)]) == 2
+
+        mock_db.execute.assert_called_once()
+        mock_db.connection.assert_not_called()
+        stmt = mock_db.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (feed_id, guid) DO NOTHING" in sql
+        assert stmt.compile(dialect=postgresql.dialect()).params["url_m1"] == ""
+
+    def test_large_batch_uses_copy(self, mock_db):
+        """At COPY_MIN_ROWS the staging-table COPY path takes over."""
+        items = [_item(guid=f"guid-{i}") for i in range(COPY_MIN_ROWS)]
+        with patch("backend.services.feed_item_loader.copy_feed_items", return_value=7) as mock_copy:
+            assert insert_feed_items(mock_db, items) == 7
+        mock_copy.assert_called_once_with(mock_db, items)
+        mock_db.execute.assert_not_called()
@@ -0,0 +1,55 @@
+"""Tests for backend.services.google_docs_service publishing."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("googleapiclient")
+
+from backend.services.google_docs_service import GoogleDocsService
+
+
+def _output(**overrides):
+    fields = dict(
+        title="Battle Card - Acme", content="# Notes", sections=None,
+        google_doc_id="doc-1", google_doc_url=None, status="approved", published_at=None,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class TestPublishDoc:
+    """Publishing writes the stored sections and commits before calling Google."""
+
+    def _publish(self, mock_db, output):
+        service = GoogleDocsService()
+        events = []
+        mock_db.commit.side_effect = lambda: events.append("commit")
+        with patch.object(service, "_build_credentials", return_value=object()), patch(
+            "googleapiclient.discovery.build"
+        ), patch.object(service, "_update_existing_doc") as update:
+            update.side_effect = lambda *args: events.append("google")
+            service.publish_doc(mock_db, output, user=SimpleNamespace(id="u1"))
+        return events, update
+
+    def test_commits_before_google_calls(self, mock_db):
+        events, _ = self._publish(mock_db, _output())
+
+        assert events == ["commit", "google", "commit"]
+
+    def test_stored_sections_are_published(self, mock_db):
+        sections = [{"title": "Overview", "body": "Acme sells widgets."}]
+        output = _output(content='{"Overview": "stale"}', sections=sections)
+
+        _, update = self._publish(mock_db, output)
+
+        assert update.call_args.args[3] == sections
+        assert output.status == "published"
+
+    def test_content_without_sections_is_one_section(self, mock_db):
+        _, update = self._publish(mock_db, _output(content="# Notes", sections=[]))
+
+        assert update.call_args.args[3] == [{"title": "Content", "body": "# Notes"}]
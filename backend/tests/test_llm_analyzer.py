@@ -0,0 +1,172 @@
+"""Tests for backend.services.llm_analyzer Message Batches and competitor linking."""
+
+from __future__ import annotations
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.services.llm_analyzer import LLMAnalyzer
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def analyzer():
+    # Skip __init__: it imports the SDK and builds a real client.
+    instance = LLMAnalyzer.__new__(LLMAnalyzer)
+    instance.client = MagicMock()
+    return instance
+
+
+def _item(**fields):
+    defaults = dict(
+        id=uuid.uuid4(), feed=None, title="Launch", raw_content="Body", raw_metadata=None,
+        author=None, url="https://example.com/a", published_at=None, is_processed=False,
+    )
+    defaults.update(fields)
+    return SimpleNamespace(**defaults)
+
+
+def _result(item, text='{"is_relevant": false}', type="succeeded"):
+    message = SimpleNamespace(content=[SimpleNamespace(text=text)])
+    return SimpleNamespace(custom_id=str(item.id), result=SimpleNamespace(type=type, message=message))
+
+
+def _ended_batch(batch_id="msgbatch_1"):
+    counts = SimpleNamespace(succeeded=1, errored=0, expired=0)
+    return SimpleNamespace(id=batch_id, processing_status="ended", request_counts=counts)
+
+
+# ---------------------------------------------------------------------------
+# submit_batch
+# ---------------------------------------------------------------------------
+
+class TestSubmitBatch:
+
+    @patch("backend.services.llm_analyzer.get_prompt_context", return_value=("", ""))
+    def test_one_request_per_item_keyed_by_item_id(self, _context, analyzer, mock_db):
+        items = [_item(), _item()]
+        mock_db.limit.return_value = mock_db
+        mock_db.all.return_value = items
+        analyzer.client.messages.batches.create.return_value = SimpleNamespace(id="msgbatch_1")
+        check_run = SimpleNamespace(llm_batch_id=None)
+
+        assert analyzer.submit_batch(mock_db, check_run) == "msgbatch_1"
+
+        requests = analyzer.client.messages.batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == [str(i.id) for i in items]
+        assert requests[0]["params"]["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert check_run.llm_batch_id == "msgbatch_1"
+        mock_db.commit.assert_called_once()
+
+    def test_deferred_while_an_earlier_batch_is_pending(self, analyzer, mock_db):
+        mock_db.first.return_value = SimpleNamespace(id=uuid.uuid4())
+
+        assert analyzer.submit_batch(mock_db, SimpleNamespace(llm_batch_id=None)) is None
+        analyzer.client.messages.batches.create.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# collect_batch
+# ---------------------------------------------------------------------------
+
+class TestCollectBatch:
+
+    def test_returns_none_while_processing(self, analyzer, mock_db):
+        analyzer.client.messages.batches.retrieve.return_value = SimpleNamespace(
+            id="msgbatch_1", processing_status="in_progress",
+        )
+        check_run = SimpleNamespace(id=uuid.uuid4(), llm_batch_id="msgbatch_1", cards_generated=0)
+
+        assert analyzer.collect_batch(mock_db, check_run) is None
+        assert check_run.llm_batch_id == "msgbatch_1"
+        analyzer.client.messages.batches.results.assert_not_called()
+
+    def test_applies_succeeded_results_and_clears_batch(self, analyzer, mock_db):
+        relevant, errored, done = _item(), _item(), _item(is_processed=True)
+        mock_db.all.return_value = [relevant, errored, done]
+        analyzer.client.messages.batches.retrieve.return_value = _ended_batch()
+        analyzer.client.messages.batches.results.return_value = [
+            _result(relevant, '{"is_relevant": true}'),
+            _result(errored, type="errored"),
+            _result(done),
+        ]
+        check_run = SimpleNamespace(id=uuid.uuid4(), llm_batch_id="msgbatch_1", cards_generated=2)
+
+        with patch.object(analyzer, "_apply_evaluation", return_value=True) as mock_apply:
+            assert analyzer.collect_batch(mock_db, check_run) == 1
+
+        # Errored requests stay unprocessed for the next run; items already
+        # evaluated by a manual run are left alone.
+        mock_apply.assert_called_once_with(mock_db, relevant, '{"is_relevant": true}', check_run.id)
+        assert check_run.cards_generated == 3
+        assert check_run.llm_batch_id is None
+
+    def test_failed_evaluation_marks_item_processed(self, analyzer, mock_db):
+        item = _item()
+        mock_db.all.return_value = [item]
+        analyzer.client.messages.batches.retrieve.return_value = _ended_batch()
+        analyzer.client.messages.batches.results.return_value = [_result(item)]
+        check_run = SimpleNamespace(id=uuid.uuid4(), llm_batch_id="msgbatch_1", cards_generated=0)
+
+        with patch.object(analyzer, "_apply_evaluation", side_effect=RuntimeError("boom")):
+            assert analyzer.collect_batch(mock_db, check_run) == 0
+
+        assert item.is_processed is True
+        assert item.irrelevance_reason == "Processing error"
+
+
+class TestProcessUnprocessedItemsBatched:
+
+    def test_transaction_ends_before_each_wait(self, analyzer, mock_db):
+        events = []
+        results = iter([None, 2])
+
+        def collect(db, check_run):
+            events.append("collect")
+            return next(results)
+
+        mock_db.commit.side_effect = lambda: events.append("commit")
+        check_run = SimpleNamespace(id=uuid.uuid4(), llm_batch_id=None)
+
+        with (
+            patch.object(analyzer, "collect_pending_batches"),
+            patch.object(analyzer, "submit_batch", return_value="msgbatch_1"),
+            patch.object(analyzer, "collect_batch", side_effect=collect),
+            patch("backend.services.llm_analyzer.time.sleep", side_effect=lambda _: events.append("sleep")),
+        ):
+            assert analyzer.process_unprocessed_items_batched(mock_db, check_run) == 2
+
+        assert events == ["commit", "sleep", "collect", "commit", "sleep", "collect"]
+
+
+class TestLinkCompetitors:
+    """Mentioned competitors are matched in one query and linked in one INSERT."""
+
+    def test_names_are_matched_and_linked_in_bulk(self, analyzer, mock_db):
+        first, second = uuid.uuid4(), uuid.uuid4()
+        mock_db.all.return_value = [(first,), (second,)]
+        card = SimpleNamespace(id=uuid.uuid4())
+
+        analyzer._link_competitors(mock_db, card, {"competitor_names": ["Acme", "acme", "Globex"]})
+
+        mock_db.query.assert_called_once()
+        names = mock_db.filter.call_args.args[1].right.value
+        assert sorted(names) == ["acme", "globex"]
+        stmt, rows = mock_db.execute.call_args.args
+        assert stmt.table.name == "analysis_card_competitors"
+        assert rows == [
+            {"analysis_card_id": card.id, "competitor_id": first},
+            {"analysis_card_id": card.id, "competitor_id": second},
+        ]
+
+    def test_no_names_means_no_queries(self, analyzer, mock_db):
+        analyzer._link_competitors(mock_db, SimpleNamespace(id=uuid.uuid4()), {"competitor_names": []})
+
+        mock_db.query.assert_not_called()
+        mock_db.execute.assert_not_called()
@@ -0,0 +1,82 @@
+"""Tests for backend.migration_utils batching helpers."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from backend.migration_utils import batched_insert, chunked, iter_key_batches
+
+
+# ---------------------------------------------------------------------------
+# chunked
+# ---------------------------------------------------------------------------
+
+class TestChunked:
+    """Tests for the chunked() batching helper."""
+
+    def test_splits_into_fixed_size_batches(self):
+        """Rows are split into batches of the requested size, last one short."""
+        assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_empty_input_yields_nothing(self):
+        """No batches are produced for an empty iterable."""
+        assert list(chunked([], 3)) == []
+
+    def test_accepts_generators(self):
+        """Works on one-shot iterators without materialising them first."""
+        rows = ({"id": i} for i in range(4))
+        assert [len(b) for b in chunked(rows, 2)] == [2, 2]
+
+
+# ---------------------------------------------------------------------------
+# iter_key_batches
+# ---------------------------------------------------------------------------
+
+class TestIterKeyBatches:
+    """Tests for keyset pagination over primary keys."""
+
+    def _conn(self, pages):
+        conn = MagicMock()
+        conn.execute.side_effect = [[(k,) for k in page] for page in pages]
+        return conn
+
+    def test_pages_until_empty(self):
+        """Yields each page and stops on the first empty result."""
+        conn = self._conn([[1, 2], [3], []])
+        assert list(iter_key_batches(conn, "feed_items", batch_size=2)) == [[1, 2], [3]]
+        assert conn.execute.call_count == 3
+
+    def test_uses_last_key_for_next_page(self):
+        """Subsequent queries filter on the last key seen instead of OFFSET."""
+        conn = self._conn([[1, 2], []])
+        list(iter_key_batches(conn, "feed_items", where="is_processed", batch_size=2))
+
+        first_sql = str(conn.execute.call_args_list[0].args[0])
+        second_sql = str(conn.execute.call_args_list[1].args[0])
+        second_params = conn.execute.call_args_list[1].args[1]
+        assert "OFFSET" not in first_sql
+        assert "(is_processed)" in first_sql
+        assert "id > :last_key" in second_sql
+        assert second_params["last_key"] == 2
+
+
+# ---------------------------------------------------------------------------
+# batched_insert
+# ---------------------------------------------------------------------------
+
+class TestBatchedInsert:
+    """Tests for the execute_values-backed bulk insert."""
+
+    @patch("backend.migration_utils.execute_values")
+    @patch("backend.migration_utils.op")
+    def test_one_execute_values_call_per_batch(self, mock_op, mock_execute_values):
+        """Each batch is sent as a single multi-VALUES statement."""
+        rows = [(i, f"guid-{i}") for i in range(5)]
+
+        count = batched_insert("feed_items", ["id", "guid"], rows, batch_size=2)
+
+        assert count == 5
+        assert mock_execute_values.call_count == 3
+        sql = mock_execute_values.call_args_list[0].args[1]
+        assert sql == "INSERT INTO feed_items (id, guid) VALUES %s"
+        assert [len(c.args[2]) for c in mock_execute_values.call_args_list] == [2, 2, 1]
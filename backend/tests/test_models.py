@@ -1,10 +1,18 @@
-"""Tests for backend models — TwitterSourceConfig and RSSFeed."""
+"""Tests for backend models — TwitterSourceConfig, RSSFeed and status-column constraints."""
 
 from __future__ import annotations
 
 import uuid
 from datetime import datetime, timezone
+import re
 from types import SimpleNamespace
+from typing import get_args, get_type_hints
+
+import pytest
+from sqlalchemy import CheckConstraint, FetchedValue
+
+import backend.models  # noqa: F401  (configure all mappers)
+from backend.database import Base
 
 
 # ---------------------------------------------------------------------------
@@ -104,3 +112,46 @@ class TestRSSFeedModel:
         assert feed.twitter_config is not None
         assert feed.twitter_config.x_username == "testaccount"
 
+
+# ---------------------------------------------------------------------------
+# CHECK constraints vs. Literal annotations
+# ---------------------------------------------------------------------------
+
+def _check_constraints():
+    for mapper in Base.registry.mappers:
+        for constraint in mapper.local_table.constraints:
+            if isinstance(constraint, CheckConstraint):
+                yield mapper, constraint
+
+
+@pytest.mark.parametrize(
+    "mapper,constraint", list(_check_constraints()), ids=lambda v: getattr(v, "name", None)
+)
+def test_literal_annotation_matches_check_constraint(mapper, constraint):
+    """Each constrained column's Literal lists exactly the values its CHECK allows."""
+    column, values = re.fullmatch(r"(\w+) IN \((.*)\)", str(constraint.sqltext), re.S).groups()
+    allowed = set(re.findall(r"'([^']*)'", values))
+
+    mapped = get_type_hints(mapper.class_)[column]  # Mapped[Literal[...]]
+    assert set(get_args(get_args(mapped)[0])) == allowed
+
+
+# ---------------------------------------------------------------------------
+# Timestamps
+# ---------------------------------------------------------------------------
+
+_TIMESTAMP_COLUMNS = [
+    (mapper.class_.__name__, column)
+    for mapper in Base.registry.mappers
+    for column in mapper.local_table.columns
+    if column.name in ("created_at", "updated_at")
+]
+
+
+@pytest.mark.parametrize("model,column", _TIMESTAMP_COLUMNS, ids=lambda v: getattr(v, "name", v))
+def test_timestamps_are_set_by_the_database(model, column):
+    """created_at/updated_at come from the INSERT itself and the update trigger, never the client."""
+    assert column.server_default is not None
+    assert column.default is None and column.onupdate is None
+    if column.name == "updated_at":
+        assert isinstance(column.server_onupdate, FetchedValue)
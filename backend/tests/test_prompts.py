@@ -0,0 +1,80 @@
+"""Tests for backend.prompts template rendering."""
+
+from __future__ import annotations
+
+import pytest
+
+from backend.prompts import compile_template
+from backend.prompts.briefing import BRIEFING_USER_PROMPT, _briefing_prefix, build_briefing_prompt
+from backend.prompts.feed_evaluation import FEED_EVALUATION_ITEM, FEED_EVALUATION_SYSTEM, build_feed_evaluation_prompt
+
+
+class TestCompileTemplate:
+    """Precompiled templates render exactly like str.format."""
+
+    def test_matches_str_format(self):
+        values = dict(augment_profile="A", competitor_profiles="C", analysis_cards_json='[{"id": 1}]')
+        _, user_prompt = build_briefing_prompt(**values)
+        assert user_prompt == BRIEFING_USER_PROMPT.format(**values)
+
+    def test_escaped_braces_and_braces_in_values(self):
+        """Literal {{ }} in the template unescape; braces in values pass through untouched."""
+        context = dict(augment_profile="{x}", competitor_list_with_profiles="C")
+        item = dict(feed_name="F", item_title="T", item_content="{}", item_url="U", item_published_at="P")
+        system, user_prompt = build_feed_evaluation_prompt(**context, **item)
+        assert system[0]["text"] == FEED_EVALUATION_SYSTEM.format(**context)
+        assert user_prompt == FEED_EVALUATION_ITEM.format(**item)
+        assert '{\n  "is_relevant"' in system[0]["text"]
+
+    def test_missing_field_raises(self):
+        with pytest.raises(KeyError):
+            compile_template("Hi {name}")()
+
+    def test_static_template_renders_one_string(self):
+        """Without fields there is nothing to substitute; escapes are resolved once."""
+        render = compile_template("Static {{text}}")
+        assert render() == "Static {text}"
+        assert render() is render()
+
+    def test_format_specs_rejected(self):
+        with pytest.raises(ValueError):
+            compile_template("{count:>5}")
+
+
+class TestPromptCaching:
+    """Feed evaluation keeps everything shared by a run in one cached system block."""
+
+    def test_item_fields_stay_out_of_the_cached_prefix(self):
+        context = dict(augment_profile="A", competitor_list_with_profiles="C")
+        first, _ = build_feed_evaluation_prompt(
+            **context, feed_name="F1", item_title="T1", item_content="X1", item_url="U1", item_published_at="P1",
+        )
+        second, _ = build_feed_evaluation_prompt(
+            **context, feed_name="F2", item_title="T2", item_content="X2", item_url="U2", item_published_at="P2",
+        )
+        assert first == second
+        assert first[-1]["cache_control"] == {"type": "ephemeral"}
+
+    def test_system_block_rendered_once_per_profile_context(self):
+        """Items in one run reuse the rendered system block; edited profiles re-render it."""
+        item = dict(feed_name="F", item_title="T", item_content="X", item_url="U", item_published_at="P")
+        first, _ = build_feed_evaluation_prompt(augment_profile="A", competitor_list_with_profiles="C", **item)
+        second, _ = build_feed_evaluation_prompt(augment_profile="A", competitor_list_with_profiles="C", **item)
+        edited, _ = build_feed_evaluation_prompt(augment_profile="A2", competitor_list_with_profiles="C", **item)
+        assert second is first
+        assert edited is not first
+        assert "A2" in edited[0]["text"]
+
+
+class TestBriefingPrompt:
+    """The briefing prompt reuses its rendered profile prefix across card sets."""
+
+    def test_prefix_rendered_once_per_profile_context(self):
+        _briefing_prefix.cache_clear()
+        for cards in ("[1]", "[2]"):
+            _, user_prompt = build_briefing_prompt(augment_profile="A", competitor_profiles="C", analysis_cards_json=cards)
+            assert user_prompt == BRIEFING_USER_PROMPT.format(
+                augment_profile="A", competitor_profiles="C", analysis_cards_json=cards,
+            )
+        info = _briefing_prefix.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
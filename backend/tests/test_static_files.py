@@ -0,0 +1,160 @@
+"""Tests for backend.static_files."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.staticfiles import StaticFiles
+from starlette.testclient import TestClient
+
+from backend.static_files import CachedStaticFiles, SPAIndex
+
+
+def _client(directory, **kwargs) -> TestClient:
+    app = Starlette(routes=[Mount("/assets", CachedStaticFiles(directory=str(directory), **kwargs), name="assets")])
+    return TestClient(app)
+
+
+class TestCachedStaticFiles:
+    """Lookup caching behaviour of CachedStaticFiles."""
+
+    def test_serves_file(self, tmp_path):
+        """Existing files are served with their content."""
+        (tmp_path / "app.js").write_text("console.log(1)")
+        client = _client(tmp_path)
+
+        response = client.get("/assets/app.js")
+
+        assert response.status_code == 200
+        assert response.text == "console.log(1)"
+
+    def test_repeat_requests_skip_path_lookup(self, tmp_path):
+        """Only the first request for a path reaches StaticFiles.lookup_path."""
+        (tmp_path / "app.js").write_text("console.log(1)")
+        client = _client(tmp_path)
+
+        with patch.object(StaticFiles, "lookup_path", autospec=True, side_effect=StaticFiles.lookup_path) as lookup:
+            client.get("/assets/app.js")
+            client.get("/assets/app.js")
+            client.get("/assets/app.js")
+
+        assert lookup.call_count == 1
+
+    def test_missing_files_are_not_cached(self, tmp_path):
+        """404s are not remembered, so a file deployed later is still found."""
+        client = _client(tmp_path)
+
+        assert client.get("/assets/late.js").status_code == 404
+        (tmp_path / "late.js").write_text("ok")
+        assert client.get("/assets/late.js").status_code == 200
+
+    def test_cache_control(self, tmp_path):
+        """cache_control is sent on full and 304 responses alike."""
+        (tmp_path / "app.js").write_text("console.log(1)")
+        client = _client(tmp_path, cache_control="public, max-age=31536000, immutable")
+
+        response = client.get("/assets/app.js")
+        revalidated = client.get("/assets/app.js", headers={"If-None-Match": response.headers["etag"]})
+
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert revalidated.status_code == 304
+        assert revalidated.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+    def test_no_cache_control_by_default(self, tmp_path):
+        """Without cache_control no header is added."""
+        (tmp_path / "app.js").write_text("console.log(1)")
+
+        assert "cache-control" not in _client(tmp_path).get("/assets/app.js").headers
+
+
+class TestPrecompressedAssets:
+    """Serving build-time .br/.gz siblings."""
+
+    @staticmethod
+    def _assets(tmp_path, *suffixes):
+        (tmp_path / "app.js").write_text("plain")
+        for suffix in suffixes:
+            (tmp_path / f"app.js{suffix}").write_bytes(f"compressed{suffix}".encode())
+        return _client(tmp_path)
+
+    def _get(self, client, accept_encoding):
+        # Read raw bytes: the test client would otherwise try to decode them.
+        with client.stream("GET", "/assets/app.js", headers={"Accept-Encoding": accept_encoding}) as response:
+            return response, b"".join(response.iter_raw())
+
+    def test_prefers_brotli(self, tmp_path):
+        """br wins over gzip and keeps the original content type."""
+        client = self._assets(tmp_path, ".br", ".gz")
+
+        for _ in range(2):  # first (uncached) and cached lookups
+            response, body = self._get(client, "gzip, deflate, br")
+            assert body == b"compressed.br"
+            assert response.headers["content-encoding"] == "br"
+            assert response.headers["content-type"].startswith("text/javascript")
+            assert response.headers["vary"] == "Accept-Encoding"
+
+    def test_falls_back_to_gzip(self, tmp_path):
+        """Clients without br get the .gz sibling."""
+        client = self._assets(tmp_path, ".br", ".gz")
+
+        response, body = self._get(client, "gzip")
+
+        assert body == b"compressed.gz"
+        assert response.headers["content-encoding"] == "gzip"
+
+    def test_identity_when_not_accepted(self, tmp_path):
+        """Without a matching Accept-Encoding the original file is served."""
+        client = self._assets(tmp_path, ".br")
+
+        response, body = self._get(client, "identity")
+
+        assert body == b"plain"
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+
+    def test_files_without_siblings_are_unchanged(self, tmp_path):
+        """Assets that were not precompressed are served as before."""
+        client = self._assets(tmp_path)
+
+        response, body = self._get(client, "br")
+
+        assert body == b"plain"
+        assert "vary" not in response.headers
+
+
+class TestSPAIndex:
+    """In-memory index.html with ETag revalidation."""
+
+    def test_serves_cached_bytes(self, tmp_path):
+        """The document is read once; later edits on disk are not picked up."""
+        index_file = tmp_path / "index.html"
+        index_file.write_text("<html>v1</html>")
+        index = SPAIndex(index_file)
+        index_file.write_text("<html>v2</html>")
+
+        response = index.response()
+
+        assert response.status_code == 200
+        assert response.body == b"<html>v1</html>"
+        assert response.media_type == "text/html"
+        assert response.headers["cache-control"] == "no-cache"
+        assert response.headers["etag"] == index.etag
+
+    def test_matching_etag_is_not_modified(self, tmp_path):
+        """If-None-Match with the current ETag (alone or in a list) returns an empty 304."""
+        (tmp_path / "index.html").write_text("<html></html>")
+        index = SPAIndex(tmp_path / "index.html")
+
+        for header in (index.etag, f'"stale", {index.etag}'):
+            response = index.response(header)
+            assert response.status_code == 304
+            assert response.body == b""
+            assert response.headers["etag"] == index.etag
+
+    def test_stale_etag_gets_full_document(self, tmp_path):
+        """A different ETag (e.g. from before a deploy) gets the new document."""
+        (tmp_path / "index.html").write_text("<html></html>")
+
+        assert SPAIndex(tmp_path / "index.html").response('"stale"').status_code == 200
@@ -0,0 +1,29 @@
+"""Tests for backend.utils."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from backend.utils import run_coroutine
+
+
+async def _thread_name() -> str:
+    await asyncio.sleep(0)
+    return threading.current_thread().name
+
+
+class TestRunCoroutine:
+    """Running coroutines from synchronous code."""
+
+    def test_runs_in_calling_thread_without_a_loop(self):
+        """Worker threads (no running loop) run the coroutine inline."""
+        assert run_coroutine(_thread_name()) == threading.current_thread().name
+
+    def test_uses_a_separate_thread_inside_a_running_loop(self):
+        """Called from a thread that is running a loop, it does not deadlock."""
+
+        async def caller():
+            return run_coroutine(_thread_name())
+
+        assert asyncio.run(caller()) != threading.current_thread().name
@@ -1,4 +1,15 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import concurrent.futures
+from collections.abc import Coroutine
 from datetime import datetime, timezone
+from typing import Annotated, Any, TypeVar
+
+from pydantic import PlainSerializer
+
+T = TypeVar("T")
 
 
 def utc_isoformat(dt: datetime | None) -> str | None:
@@ -13,3 +24,39 @@ def utc_isoformat(dt: datetime | None) -> str | None:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt.isoformat()
 
+
+# Response-model field type: serialized by utc_isoformat (explicit +00:00
+# offset, naive values taken as UTC) rather than Pydantic's "Z" form. Only the
+# JSON dump of a set value calls into Python; None and model_dump() stay native.
+UtcDatetime = Annotated[datetime, PlainSerializer(utc_isoformat, return_type=str, when_used="json-unless-none")]
+
+
+def encode_cursor(*parts: str) -> str:
+    """Pack keyset pagination values into an opaque, URL-safe cursor."""
+    return base64.urlsafe_b64encode("|".join(parts).encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list[str]:
+    """Unpack a cursor made by encode_cursor; ValueError if it is malformed."""
+    try:
+        parts = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+    except (ValueError, UnicodeError) as exc:
+        raise ValueError("Malformed cursor") from exc
+    if len(parts) != size:
+        raise ValueError("Malformed cursor")
+    return parts
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """Run ``coro`` to completion from synchronous code and return its result.
+
+    Sync routes, background tasks and the scheduler run in threads without an
+    event loop, so this is a plain ``asyncio.run``. Only when the calling
+    thread is already running a loop does the coroutine get a thread of its own.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
@@ -1,11 +1,16 @@
 import { apiClient } from "./client";
-import type { Competitor } from "@/types";
+import type { Competitor, CompetitorOption } from "@/types";
 
 export async function listCompetitors(params?: { is_suggested?: boolean }): Promise<Competitor[]> {
   const { data } = await apiClient.get<Competitor[]>("/competitors", { params });
   return data;
 }
 
+export async function listCompetitorOptions(): Promise<CompetitorOption[]> {
+  const { data } = await apiClient.get<CompetitorOption[]>("/competitors", { params: { lean: true } });
+  return data;
+}
+
 export async function getCompetitor(id: string): Promise<Competitor> {
   const { data } = await apiClient.get<Competitor>(`/competitors/${id}`);
   return data;
@@ -17,6 +17,12 @@ export async function listCheckRuns(): Promise<CheckRun[]> {
   return data;
 }
 
+/** WebSocket that receives an event whenever a check run is created or updated. */
+export function openCheckRunStream(): WebSocket {
+  const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
+  return new WebSocket(`${protocol}//${window.location.host}/api/check-runs/stream`);
+}
+
 export interface SystemSettings {
   [key: string]: unknown;
 }
@@ -1,5 +1,5 @@
 import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
-import { listCompetitors, getCompetitor, createCompetitor, updateCompetitor, deleteCompetitor, approveCompetitor, rejectCompetitor } from "@/api/competitors";
+import { listCompetitors, listCompetitorOptions, getCompetitor, createCompetitor, updateCompetitor, deleteCompetitor, approveCompetitor, rejectCompetitor } from "@/api/competitors";
 import type { Competitor } from "@/types";
 
 export function useCompetitors(params?: { is_suggested?: boolean }) {
@@ -9,6 +9,13 @@ export function useCompetitors(params?: { is_suggested?: boolean }) {
   });
 }
 
+export function useCompetitorOptions() {
+  return useQuery({
+    queryKey: ["competitors", "options"],
+    queryFn: listCompetitorOptions,
+  });
+}
+
 export function useCompetitor(id: string) {
   return useQuery({
     queryKey: ["competitors", id],
@@ -1,7 +1,18 @@
+import { useEffect } from "react";
 import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
-import { listCheckRuns, getSettings, updateSettings, triggerFeedCheck, triggerProfileReview, getKVSetting, setKVSetting, type SystemSettings } from "@/api/system";
+import { listCheckRuns, openCheckRunStream, getSettings, updateSettings, triggerFeedCheck, triggerProfileReview, getKVSetting, setKVSetting, type SystemSettings } from "@/api/system";
 
 export function useCheckRuns() {
+  const queryClient = useQueryClient();
+
+  // The server pushes an event when a run starts, finishes or gains cards,
+  // so the list refreshes without polling.
+  useEffect(() => {
+    const socket = openCheckRunStream();
+    socket.onmessage = () => queryClient.invalidateQueries({ queryKey: ["check-runs"] });
+    return () => socket.close();
+  }, [queryClient]);
+
   return useQuery({
     queryKey: ["check-runs"],
     queryFn: listCheckRuns,
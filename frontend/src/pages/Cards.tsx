@@ -1,7 +1,7 @@
 import { useState } from "react";
 import { Link } from "react-router-dom";
 import { useCards } from "@/hooks/use-cards";
-import { useCompetitors } from "@/hooks/use-competitors";
+import { useCompetitorOptions } from "@/hooks/use-competitors";
 import type { CardFilters } from "@/api/cards";
 import type { AnalysisCard, CardStatus, Priority, EventType } from "@/types";
 import { cn } from "@/lib/utils";
@@ -135,7 +135,7 @@ export default function Cards() {
   const [showFilters, setShowFilters] = useState(false);
 
   const { data: cards, isLoading, error, refetch } = useCards(filters);
-  const { data: competitors } = useCompetitors();
+  const { data: competitors } = useCompetitorOptions();
 
   const hasActiveFilters = !!(filters.status || filters.priority || filters.competitor_id || filters.date_from || filters.date_to);
 
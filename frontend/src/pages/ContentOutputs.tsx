@@ -2,7 +2,7 @@ import { useState } from "react";
 import { Link, useNavigate } from "react-router-dom";
 import { useContentOutputs, useGenerateDraft, useDeleteContentOutput } from "@/hooks/use-content-outputs";
 import { useContentTemplates } from "@/hooks/use-content-templates";
-import { useCompetitors } from "@/hooks/use-competitors";
+import { useCompetitorOptions } from "@/hooks/use-competitors";
 import type { ContentOutputFilters } from "@/api/content-outputs";
 import type { ContentOutput, ContentOutputStatus } from "@/types";
 import { cn } from "@/lib/utils";
@@ -148,7 +148,7 @@ function GenerateModal({
   onGenerate: (competitorId: string, templateId: string) => void;
   isGenerating: boolean;
 }) {
-  const { data: competitors } = useCompetitors();
+  const { data: competitors } = useCompetitorOptions();
   const { data: templates } = useContentTemplates();
   const [competitorId, setCompetitorId] = useState("");
   const [templateId, setTemplateId] = useState("");
@@ -229,7 +229,7 @@ export default function ContentOutputs() {
   const navigate = useNavigate();
 
   const { data: outputs, isLoading, error, refetch } = useContentOutputs(filters);
-  const { data: competitors } = useCompetitors();
+  const { data: competitors } = useCompetitorOptions();
   const generateMutation = useGenerateDraft();
   const deleteMutation = useDeleteContentOutput();
 
@@ -9,7 +9,7 @@ import {
   useValidateTwitter,
   useRebackfill,
 } from "@/hooks/use-feeds";
-import { useCompetitors } from "@/hooks/use-competitors";
+import { useCompetitorOptions } from "@/hooks/use-competitors";
 import { CheckRunsHistory } from "@/components/common/CheckRunsHistory";
 import type { RssFeed } from "@/types";
 import type { TestFeedResult, TwitterValidationResult } from "@/api/feeds";
@@ -59,7 +59,7 @@ function FeedFormDialog({ open, onClose, feed }: FeedFormProps) {
   const isWebScrape = feedType === "web_scrape";
   const isTwitter = feedType === "twitter";
 
-  const { data: competitors } = useCompetitors();
+  const { data: competitors } = useCompetitorOptions();
   const createFeed = useCreateFeed();
   const updateFeed = useUpdateFeed();
   const testFeedUrl = useTestFeedUrl();
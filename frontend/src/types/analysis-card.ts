@@ -28,12 +28,13 @@ export interface AnalysisCard {
   summary: string;
   impact_assessment?: string;
   suggested_counter_moves?: string;
-  raw_llm_output: Record<string, unknown>;
+  raw_llm_output?: Record<string, unknown> | null;
   status: CardStatus;
   approved_by: string | null;
   approved_at: string | null;
   check_run_id: string | null;
   competitors: CompetitorBrief[];
+  comments_count: number;
   created_at: string;
   updated_at: string;
 }
@@ -17,3 +17,6 @@ export interface Competitor {
   updated_at: string;
 }
 
+
+/** The picker projection returned by `GET /competitors?lean=true`. */
+export type CompetitorOption = Pick<Competitor, "id" | "name" | "is_suggested">;
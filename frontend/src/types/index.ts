@@ -1,7 +1,7 @@
 export type { User, UserRole } from "./user";
 export type { RssFeed } from "./feed";
 export type { FeedItem } from "./feed-item";
-export type { Competitor } from "./competitor";
+export type { Competitor, CompetitorOption } from "./competitor";
 export type { AugmentProfile } from "./augment-profile";
 export type {
   AnalysisCard,